@@ -0,0 +1,116 @@
+"""
+Benchmark rendering `{hyper}` roles: Building nodes directly vs. rendering MyST snippets.
+
+Synopsis::
+
+    python -m benchmarks.hyper
+    python -m benchmarks.hyper --links 5000
+"""
+
+import argparse
+import io
+import json
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+from sphinx.application import Sphinx
+
+from sphinx_design_elements.hyper import HyperRefRole
+
+VARIANTS = [
+    "{{hyper}}`Link {number} <https://example.org/{number}> {{type=badge}}`",
+    "{{hyper}}`Link {number} <https://example.org/{number}> {{type=button,outline=true}}`",
+    "{{hyper}}`Link {number} <https://example.org/{number}> {{type=card,header=Header}}`",
+    "{{hyper}}`Link {number} <https://example.org/{number}> {{type=shield,label=Open}}`",
+    "{{hyper-open}}`Link {number} <https://example.org/{number}>`",
+]
+
+
+def make_page(links: int) -> str:
+    lines = ["# Hyper links", ""]
+    for number in range(links):
+        lines.append(VARIANTS[number % len(VARIANTS)].format(number=number))
+        lines.append("")
+    return "\n".join(lines)
+
+
+class RoleTimer:
+    """
+    Measure the time spent within `HyperRefRole.run`.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.elapsed = 0.0
+        self.original = HyperRefRole.run
+
+    def __enter__(self) -> "RoleTimer":
+        timer = self
+
+        def run(role: HyperRefRole) -> t.Any:
+            started = time.perf_counter()
+            try:
+                return timer.original(role)
+            finally:
+                timer.elapsed += time.perf_counter() - started
+                timer.count += 1
+
+        HyperRefRole.run = run  # type: ignore[method-assign]
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        HyperRefRole.run = self.original  # type: ignore[method-assign]
+
+
+def measure(links: int, build_nodes: bool) -> t.Dict[str, t.Any]:
+    HyperRefRole.build_nodes = build_nodes
+    with tempfile.TemporaryDirectory() as tmpdir:
+        srcdir = Path(tmpdir) / "src"
+        srcdir.mkdir()
+        srcdir.joinpath("conf.py").write_text(
+            "extensions = ['myst_parser', 'sphinx_design', 'sphinx_design_elements']\n"
+            "myst_enable_extensions = ['colon_fence']\n"
+            "hyper_title_offline = True\n"
+        )
+        srcdir.joinpath("index.md").write_text(make_page(links))
+        app = Sphinx(
+            srcdir=str(srcdir),
+            confdir=str(srcdir),
+            outdir=str(Path(tmpdir) / "out"),
+            doctreedir=str(Path(tmpdir) / "doctrees"),
+            buildername="dummy",
+            status=io.StringIO(),
+            warning=io.StringIO(),
+        )
+        started = time.perf_counter()
+        with RoleTimer() as timer:
+            app.build()
+        elapsed = time.perf_counter() - started
+    return {
+        "roles": timer.count,
+        "roles_per_second": round(timer.count / timer.elapsed, 1),
+        "role_ms": round(timer.elapsed * 1000, 1),
+        "build_ms": round(elapsed * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--links", type=int, default=2000, help="Number of hyper links on the page")
+    args = parser.parse_args()
+
+    snippet = measure(args.links, build_nodes=False)
+    native = measure(args.links, build_nodes=True)
+    result = {
+        "links": args.links,
+        "snippet": snippet,
+        "native": native,
+        "speedup": round(native["roles_per_second"] / snippet["roles_per_second"], 2),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark rendering Markdown fragments from reStructuredText, like the
+`shield` directive does for references which can not be built directly.
+
+Compares the shared Markdown wrapper against the previous approach, which
+patched `SphinxRenderer.__getattr__` using `unittest.mock` for each render.
+
+Synopsis::
+
+    python -m benchmarks.markdown --fragments 5000
+"""
+
+import argparse
+import json
+import time
+import typing as t
+from unittest.mock import patch
+
+from myst_parser.config.main import MdParserConfig
+from myst_parser.mdit_to_docutils.sphinx_ import SphinxRenderer
+from myst_parser.parsers.mdit import create_md_parser
+
+from sphinx_design_elements.util.directive import get_markdown_wrapper
+
+FRAGMENT = '[![Read More](https://img.shields.io/badge/Read-More-darkyellow)](#document "Read More")'
+
+
+def legacy() -> t.Callable[[str], t.Any]:
+    """
+    The previous implementation of `MarkdownWrapper.render`.
+    """
+    config = MdParserConfig()
+    config.suppress_warnings = []
+    parser = create_md_parser(config, SphinxRenderer)
+
+    def render(content: str) -> t.Any:
+        with patch("myst_parser.mdit_to_docutils.sphinx_.SphinxRenderer.__getattr__"):
+            return parser.render(content).children
+
+    return render
+
+
+def measure(render: t.Callable[[str], t.Any], count: int) -> float:
+    """
+    Return the number of fragments rendered per second.
+    """
+    render(FRAGMENT)
+    started = time.perf_counter()
+    for _ in range(count):
+        render(FRAGMENT)
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fragments", type=int, default=5000, help="Number of fragments to render")
+    args = parser.parse_args()
+    results = {
+        "fragments": args.fragments,
+        "legacy_per_second": round(measure(legacy(), args.fragments)),
+        "shared_per_second": round(measure(get_markdown_wrapper().render, args.fragments)),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark parsing the text of `{hyper}` roles, using pathological input
+which does not match the `title <target> {options}` layout: Text with many
+unbalanced `<` and `{` characters, and text with many `>` characters.
+
+The single-pass parser scales linearly with the length of the text in both
+cases. The regular expressions used previously scale quadratically with the
+length of text with unbalanced `<` and `{` characters, and linearly with the
+length of text with many `>` characters. The latter case guards the parser
+against regressions, like copying the remainder of the text per `>` character.
+
+Synopsis::
+
+    python -m benchmarks.parser
+"""
+
+import json
+import re
+import time
+import typing as t
+
+from sphinx_design_elements.hyper import split_hyper_text
+
+# The regular expressions previously used by `HyperRefRole.parse_text`.
+options_re = re.compile(r"^(?P<target>.+?)\s*(?:{(?P<options>.+)})?$", re.DOTALL)
+title_and_options_re = re.compile(r"^(?P<title>.+?)\s*(?<!\x00)<(?P<target>.+?)>(?:\s*{(?P<options>.+)})?$", re.DOTALL)
+
+
+def regex(text: str) -> t.Any:
+    return title_and_options_re.match(text) or options_re.match(text)
+
+
+def parser(text: str) -> t.Any:
+    # Bypass memoization, in order to measure parsing.
+    return split_hyper_text.__wrapped__(text)
+
+
+PATTERNS = {
+    # A long title with many unbalanced `<` and `{` characters.
+    "unbalanced": "Lorem <ipsum {dolor ",
+    # A long title with many `>` characters, each one a candidate end of the target.
+    "closing": "Lorem> ipsum> dolor ",
+}
+
+
+def make_text(size: int, pattern: str) -> str:
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+def measure(func: t.Callable[[str], t.Any], text: str, rounds: int = 3) -> float:
+    """
+    Return the best time of multiple rounds, in milliseconds.
+    """
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main():
+    results: t.Dict[str, t.List[t.Dict[str, t.Any]]] = {}
+    for name, pattern in PATTERNS.items():
+        results[name] = []
+        for size in (2_000, 4_000, 8_000, 16_000, 32_000):
+            text = make_text(size, pattern)
+            results[name].append(
+                {
+                    "size": size,
+                    "regex_ms": round(measure(regex, text), 3),
+                    "parser_ms": round(measure(parser, text), 3),
+                }
+            )
+        # Doubling the input size should double the time for linear scaling,
+        # and quadruple it for quadratic scaling.
+        for previous, current in zip(results[name], results[name][1:]):
+            current["regex_growth"] = round(current["regex_ms"] / previous["regex_ms"], 2)
+            current["parser_growth"] = round(current["parser_ms"] / previous["parser_ms"], 2)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark creating grid table and info card wrapper components: Cloning
+prototypes vs. creating each component from scratch.
+
+Measures the time spent within the `sd-table` and `info-card` directives,
+and the number of node allocations, per 1,000 cells and cards.
+
+Synopsis::
+
+    python -m benchmarks.prototype
+    python -m benchmarks.prototype --cells 5000 --cards 1000
+"""
+
+import argparse
+import io
+import json
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+from docutils import nodes
+from sphinx.application import Sphinx
+
+from sphinx_design_elements.gridtable import TableDirective
+from sphinx_design_elements.infocard import InfoCardDirective
+from sphinx_design_elements.util.cache import prototypes
+
+CARD = """
+::::{{info-card}}
+
+:::{{grid-item}}
+:columns: 8
+Card {number}
+:::
+
+:::{{grid-item}}
+:columns: 4
+{{tags}}`foo, bar`
+:::
+
+::::
+"""
+
+
+def make_page(cells: int, cards: int) -> str:
+    lines = ["# Prototypes", "", "::::{sd-table}", ":widths: 6 6", ""]
+    for number in range(cells // 2):
+        lines += [":::{sd-row}", f"```{{sd-item}} Key {number}", "```", f"```{{sd-item}} Value {number}", "```", ":::"]
+    lines += ["::::", ""]
+    lines += [CARD.format(number=number) for number in range(cards)]
+    return "\n".join(lines)
+
+
+class Probe:
+    """
+    Measure the time spent within directives, and count node allocations.
+    """
+
+    def __init__(self, *directives: t.Type[t.Any]):
+        self.directives = directives
+        self.originals = [directive.run for directive in directives]
+        self.original_init = nodes.Element.__init__
+        self.elapsed = {directive.__name__: 0.0 for directive in directives}
+        self.allocations = 0
+
+    def __enter__(self) -> "Probe":
+        probe = self
+
+        def timed(directive: t.Type[t.Any], original: t.Callable) -> t.Callable:
+            def run(instance: t.Any) -> t.Any:
+                started = time.perf_counter()
+                try:
+                    return original(instance)
+                finally:
+                    probe.elapsed[directive.__name__] += time.perf_counter() - started
+
+            return run
+
+        def init(node: nodes.Element, *args: t.Any, **kwargs: t.Any) -> None:
+            probe.allocations += 1
+            probe.original_init(node, *args, **kwargs)
+
+        for directive, original in zip(self.directives, self.originals):
+            directive.run = timed(directive, original)
+        nodes.Element.__init__ = init  # type: ignore[method-assign]
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        for directive, original in zip(self.directives, self.originals):
+            directive.run = original
+        nodes.Element.__init__ = self.original_init  # type: ignore[method-assign]
+
+
+def measure(cells: int, cards: int, maxsize: int) -> t.Dict[str, t.Any]:
+    prototypes.clear()
+    prototypes.maxsize = maxsize
+    with tempfile.TemporaryDirectory() as tmpdir:
+        srcdir = Path(tmpdir) / "src"
+        srcdir.mkdir()
+        srcdir.joinpath("conf.py").write_text(
+            "extensions = ['myst_parser', 'sphinx_design', 'sphinx_design_elements']\n"
+            "myst_enable_extensions = ['colon_fence']\n"
+        )
+        srcdir.joinpath("index.md").write_text(make_page(cells, cards))
+        app = Sphinx(
+            srcdir=str(srcdir),
+            confdir=str(srcdir),
+            outdir=str(Path(tmpdir) / "out"),
+            doctreedir=str(Path(tmpdir) / "doctrees"),
+            buildername="dummy",
+            status=io.StringIO(),
+            warning=io.StringIO(),
+        )
+        with Probe(TableDirective, InfoCardDirective) as probe:
+            app.build()
+    return {
+        "ms_per_1000_cells": round(probe.elapsed["TableDirective"] * 1000 * 1000 / cells, 1),
+        "ms_per_1000_cards": round(probe.elapsed["InfoCardDirective"] * 1000 * 1000 / cards, 1),
+        "allocations": probe.allocations,
+        "prototypes": prototypes.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cells", type=int, default=2000, help="Number of grid table cells on the page")
+    parser.add_argument("--cards", type=int, default=1000, help="Number of info cards on the page")
+    args = parser.parse_args()
+
+    maxsize = prototypes.maxsize
+    # Warm up, so that imports and first-use initialization do not count against the first run.
+    measure(100, 100, maxsize=0)
+    scratch = measure(args.cells, args.cards, maxsize=0)
+    cloned = measure(args.cells, args.cards, maxsize=maxsize)
+    result = {
+        "cells": args.cells,
+        "cards": args.cards,
+        "scratch": scratch,
+        "prototypes": cloned,
+        "allocations_saved": scratch["allocations"] - cloned["allocations"],
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
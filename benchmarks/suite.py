@@ -0,0 +1,307 @@
+"""
+Benchmark suite: Build synthetic Sphinx projects, and measure read time,
+write time, and peak memory.
+
+The projects use `{hyper}` roles, shields, `{tags}`, `sd-table` cells, and
+info cards, in MyST or rST, scaled by a factor. Page titles of `{hyper}`
+links are retrieved from a local stand-in HTTP server. Each build runs in
+its own process, so peak memory is measured per build.
+
+Results are written as JSON, and can be compared between commits.
+
+Synopsis::
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --scale 1 4 --format myst rst --output current.json
+    python -m benchmarks.suite --compare baseline.json current.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+from tests.server import PageServer
+
+# Number of elements per page, at scale 1.
+ELEMENTS = {
+    "hyper": 80,
+    "hyper_titles": 20,
+    "shields": 40,
+    "tags": 100,
+    "table_cells": 400,
+    "info_cards": 40,
+}
+
+CONF = """
+extensions = ["myst_parser", "sphinx_design", "sphinx_design_elements"]
+myst_enable_extensions = ["colon_fence"]
+"""
+
+MYST = {
+    "hyper": "{{hyper}}`Link {number} <https://example.org/{number}> {{type=badge}}`\n",
+    "hyper_titles": "{{hyper}}`{url}`\n",
+    "shields": ":::{{shield}}\n:label: Shield\n:message: {number}\n:color: darkcyan\n"
+    ":link: https://example.org/{number}\n:::\n",
+    "tags": "{{tags}}`foo, bar, {number}`\n",
+    "table_row": ":::{{sd-row}}\n```{{sd-item}} Key {number}\n```\n```{{sd-item}}\nValue **{number}**\n```\n:::\n",
+    "info_cards": "::::{{info-card}}\n\n:::{{grid-item}}\n:columns: 8\n[Card {number}](https://example.org/{number})\n\n"
+    "A module for collecting votes from beagles.\n:::\n\n:::{{grid-item}}\n:columns: 4\n\n"
+    "{{tags-primary}}`foo, bar`\n:::\n\n::::\n",
+}
+
+# The `hyper` roles do not support reStructuredText yet.
+RST = {
+    "shields": ".. shield::\n    :label: Shield\n    :message: {number}\n    :color: darkcyan\n"
+    "    :link: https://example.org/{number}\n",
+    "tags": ":tags:`foo, bar, {number}`\n",
+    "table_row": "    .. sd-row::\n        .. sd-item:: Key {number}\n        .. sd-item::\n\n"
+    "            Value **{number}**\n",
+    "info_cards": ".. info-card::\n\n    .. grid-item::\n        :columns: 8\n\n"
+    "        `Card {number} <https://example.org/{number}>`_\n\n"
+    "        A module for collecting votes from beagles.\n\n"
+    "    .. grid-item::\n        :columns: 4\n\n        :tags-primary:`foo, bar`\n",
+}
+
+
+def make_page(fmt: str, page: int, scale: int, title_url: t.Callable[[str], str]) -> str:
+    """
+    Render the source of a single page.
+    """
+    templates = MYST if fmt == "myst" else RST
+    counts = count_elements(fmt, scale)
+    if fmt == "myst":
+        blocks = [f"# Page {page}\n"]
+    else:
+        title = f"Page {page}"
+        blocks = [f"{title}\n{'=' * len(title)}\n"]
+
+    for name in ["hyper", "hyper_titles", "shields", "tags"]:
+        if name not in templates:
+            continue
+        for number in range(counts[name]):
+            url = title_url(f"page-{page}-{number}")
+            blocks.append(templates[name].format(number=number, url=url))
+
+    rows = [templates["table_row"].format(number=number) for number in range(counts["table_cells"] // 2)]
+    if fmt == "myst":
+        blocks.append("::::{sd-table}\n:widths: 4 8\n\n" + "".join(rows) + "::::\n")
+    else:
+        blocks.append(".. sd-table::\n    :widths: 4 8\n\n" + "\n".join(rows))
+
+    for number in range(counts["info_cards"]):
+        blocks.append(templates["info_cards"].format(number=number))
+    return "\n".join(blocks)
+
+
+def count_elements(fmt: str, scale: int, pages: int = 1) -> t.Dict[str, int]:
+    """
+    Number of elements in a project, by kind.
+    """
+    templates = MYST if fmt == "myst" else RST
+    return {
+        name: count * scale * pages for name, count in ELEMENTS.items() if name in templates or name == "table_cells"
+    }
+
+
+def make_project(path: Path, fmt: str, scale: int, pages: int, title_url: t.Callable[[str], str]) -> None:
+    """
+    Generate a synthetic Sphinx project.
+    """
+    suffix = ".md" if fmt == "myst" else ".rst"
+    path.joinpath("conf.py").write_text(CONF)
+    names = [f"page-{page}" for page in range(pages)]
+    if fmt == "myst":
+        index = "# Index\n\n```{toctree}\n" + "\n".join(names) + "\n```\n"
+    else:
+        index = "Index\n=====\n\n.. toctree::\n\n" + "".join(f"    {name}\n" for name in names)
+    path.joinpath("index" + suffix).write_text(index)
+    for page, name in enumerate(names):
+        path.joinpath(name + suffix).write_text(make_page(fmt, page, scale, title_url))
+
+
+def peak_memory_mb() -> float:
+    """
+    Peak resident set size of this process, or of its largest child process, in MiB.
+    """
+    import resource
+
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Linux reports KiB, macOS reports bytes.
+    if sys.platform == "darwin":
+        peak //= 1024
+    return round(peak / 1024, 1)
+
+
+def build(project: Path, builder: str, jobs: int) -> t.Dict[str, t.Any]:
+    """
+    Build a project within this process, and measure it.
+    """
+    import io
+
+    from sphinx.application import Sphinx
+
+    marks: t.Dict[str, float] = {}
+
+    def mark(name: str) -> t.Callable[..., None]:
+        def handler(*args: t.Any) -> None:
+            marks[name] = time.perf_counter()
+
+        return handler
+
+    warnings = io.StringIO()
+    app = Sphinx(
+        srcdir=str(project),
+        confdir=str(project),
+        outdir=str(project / "_build" / builder),
+        doctreedir=str(project / "_build" / "doctrees"),
+        buildername=builder,
+        status=io.StringIO(),
+        warning=warnings,
+        parallel=jobs,
+    )
+    app.connect("env-before-read-docs", mark("read"))
+    app.connect("env-updated", mark("write"))
+    app.connect("build-finished", mark("finished"))
+    startup_memory = peak_memory_mb()
+    app.build()
+    return {
+        "read_s": round(marks["write"] - marks["read"], 3),
+        "write_s": round(marks["finished"] - marks["write"], 3),
+        "startup_memory_mb": startup_memory,
+        "peak_memory_mb": peak_memory_mb(),
+        "warnings": len(warnings.getvalue().splitlines()),
+    }
+
+
+def run(fmt: str, scale: int, options: argparse.Namespace, server: PageServer) -> t.Dict[str, t.Any]:
+    """
+    Generate a project, and build it in a separate process, repeatedly.
+    """
+    runs = []
+    for _ in range(options.repeat):
+        requests = len(server.requests)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project = Path(tmpdir)
+            make_project(project, fmt, scale, options.pages, server.url)
+            command = [sys.executable, "-m", "benchmarks.suite", "--worker", str(project)]
+            command += ["--builder", options.builder, "--jobs", str(options.jobs)]
+            process = subprocess.run(command, capture_output=True, text=True)  # noqa: S603
+        if process.returncode != 0:
+            raise RuntimeError(f"Building {fmt} project at scale {scale} failed:\n{process.stderr}")
+        result = json.loads(process.stdout)
+        result["title_requests"] = len(server.requests) - requests
+        runs.append(result)
+    return {
+        "format": fmt,
+        "scale": scale,
+        "pages": options.pages,
+        "elements": count_elements(fmt, scale, options.pages),
+        "read_s": min(result["read_s"] for result in runs),
+        "write_s": min(result["write_s"] for result in runs),
+        "read_s_median": statistics.median(result["read_s"] for result in runs),
+        "write_s_median": statistics.median(result["write_s"] for result in runs),
+        "peak_memory_mb": max(result["peak_memory_mb"] for result in runs),
+        "startup_memory_mb": max(result["startup_memory_mb"] for result in runs),
+        "title_requests": runs[-1]["title_requests"],
+        "warnings": runs[-1]["warnings"],
+    }
+
+
+def environment() -> t.Dict[str, t.Any]:
+    """
+    Describe the environment of a benchmark run, to tell results apart.
+    """
+    from importlib.metadata import version
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "packages": {
+            name: version(name)
+            for name in ["sphinx-design-elements", "sphinx", "sphinx-design", "myst-parser", "docutils"]
+        },
+    }
+
+
+def compare(baseline: t.Dict[str, t.Any], current: t.Dict[str, t.Any]) -> str:
+    """
+    Render a comparison of two result files as text table.
+    """
+
+    def key(result: t.Dict[str, t.Any]) -> t.Tuple[str, int, int]:
+        return result["format"], result["scale"], result["pages"]
+
+    before = {key(result): result for result in baseline["results"]}
+    metrics = ["read_s", "write_s", "peak_memory_mb"]
+    lines = [
+        f"baseline: {baseline['environment']['commit']}, current: {current['environment']['commit']}",
+        f"{'format':<6} {'scale':>5} {'pages':>5}" + "".join(f" {metric:>24}" for metric in metrics),
+    ]
+    for result in current["results"]:
+        previous = before.get(key(result))
+        if previous is None:
+            continue
+        cells = []
+        for metric in metrics:
+            old, new = previous[metric], result[metric]
+            change = f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+            cells.append(f" {f'{old} -> {new} ({change})':>24}")
+        lines.append(f"{result['format']:<6} {result['scale']:>5} {result['pages']:>5}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", nargs="+", choices=["myst", "rst"], default=["myst", "rst"])
+    parser.add_argument("--scale", nargs="+", type=int, default=[1, 4], help="Factors for the number of elements")
+    parser.add_argument("--pages", type=int, default=10, help="Number of pages per project")
+    parser.add_argument("--builder", default="html", help="Sphinx builder to use")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of parallel Sphinx workers")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of builds per project")
+    parser.add_argument("--latency", type=float, default=0.0, help="Response delay of title server in seconds")
+    parser.add_argument("--output", type=Path, help="Write results to file instead of stdout")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BASELINE", "CURRENT"), help="Compare results")
+    parser.add_argument("--worker", type=Path, help=argparse.SUPPRESS)
+    options = parser.parse_args()
+
+    if options.worker:
+        print(json.dumps(build(options.worker, options.builder, options.jobs)))
+        return
+
+    if options.compare:
+        baseline, current = (json.loads(path.read_text()) for path in options.compare)
+        print(compare(baseline, current))
+        return
+
+    with PageServer(latency=options.latency) as server:
+        results = [run(fmt, scale, options, server) for fmt in options.format for scale in options.scale]
+    report = json.dumps({"environment": environment(), "results": results}, indent=2)
+    if options.output:
+        options.output.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
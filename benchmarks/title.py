@@ -0,0 +1,75 @@
+"""
+Benchmark title extraction from HTML pages: Streaming vs. BeautifulSoup.
+
+Synopsis::
+
+    python -m benchmarks.title
+"""
+
+import io
+import json
+import time
+import typing as t
+
+from bs4 import BeautifulSoup
+
+from sphinx_design_elements.util.html import read_html_title
+
+
+class CountingStream(io.BytesIO):
+    """
+    An in-memory stream which counts the number of bytes read.
+    """
+
+    bytes_read = 0
+
+    def read(self, size: t.Optional[int] = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def make_page(size: int) -> bytes:
+    head = "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Example Domain</title></head><body>"
+    paragraph = "<p>Lorem ipsum dolor sit amet, <a href='#'>consectetur</a> adipiscing elit.</p>\n"
+    body = paragraph * (size // len(paragraph))
+    return (head + body + "</body></html>").encode("utf8")
+
+
+def measure(func: t.Callable[[CountingStream], t.Optional[str]], page: bytes, rounds: int) -> t.Dict[str, t.Any]:
+    bytes_read = 0
+    started = time.process_time()
+    for _ in range(rounds):
+        stream = CountingStream(page)
+        assert func(stream) == "Example Domain"
+        bytes_read = stream.bytes_read
+    elapsed = time.process_time() - started
+    return {"bytes_read": bytes_read, "cpu_ms_per_title": round(elapsed / rounds * 1000, 3)}
+
+
+def streaming(stream: CountingStream) -> t.Optional[str]:
+    return read_html_title(stream)[0]
+
+
+def beautifulsoup(stream: CountingStream) -> t.Optional[str]:
+    soup = BeautifulSoup(stream, "html.parser")
+    return soup.title.get_text() if soup.title else None
+
+
+def main():
+    results = []
+    for size in (10_000, 100_000, 1_000_000):
+        page = make_page(size)
+        rounds = max(3, 1_000_000 // size)
+        results.append(
+            {
+                "page_bytes": len(page),
+                "streaming": measure(streaming, page, rounds),
+                "beautifulsoup": measure(beautifulsoup, page, rounds),
+            }
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
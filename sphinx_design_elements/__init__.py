@@ -21,6 +21,7 @@ def setup(app: "Sphinx") -> dict:
     setup_extension(app)
     return {
         "version": __version__,
+        "env_version": 1,
         "parallel_read_safe": True,
         "parallel_write_safe": True,
     }
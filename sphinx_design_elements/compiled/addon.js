@@ -1,26 +1,105 @@
 document.addEventListener("DOMContentLoaded", () => {
     console.info("Initializing sphinx-design-elements");
     setup_dropdown_group();
+    setup_paginated_tables();
 });
 
 function setup_dropdown_group() {
 
-    // Select all relevant detail elements nested within container elements using the `dropdown-group` class.
-    const dropdown_details = document.querySelectorAll(".dropdown-group details");
-
-    // Add event listener for special toggling.
-    dropdown_details.forEach((details) => {
-        details.addEventListener("toggle", toggleOpenGroup);
-    });
-
-    // When toggling elements, exclusively open one element, and close all others.
-    function toggleOpenGroup(e) {
-        if (this.open) {
-            dropdown_details.forEach((details) => {
-                if (details !== this && details.open) {
-                    details.open = false;
-                }
-            });
+    // Browsers supporting the `name` attribute of `details` elements
+    // only open one element of each dropdown group natively.
+    if ("name" in HTMLDetailsElement.prototype) {
+        return;
+    }
+
+    // Otherwise, when opening an element, close all others of the same group,
+    // using a single listener. `toggle` events do not bubble, so capture them.
+    document.addEventListener("toggle", (event) => {
+        const details = event.target;
+        if (!(details instanceof HTMLDetailsElement) || !details.open) {
+            return;
         }
+        const name = details.getAttribute("name");
+        if (!name) {
+            return;
+        }
+        document.querySelectorAll("details[name]").forEach((other) => {
+            if (other !== details && other.open && other.getAttribute("name") === name) {
+                other.open = false;
+            }
+        });
+    }, true);
+}
+
+function setup_paginated_tables() {
+    document.querySelectorAll(".sd-table-paginated[data-rows]").forEach(setup_paginated_table);
+}
+
+function setup_paginated_table(table) {
+
+    // The first page of rows is part of the page, the remaining rows
+    // are loaded from a JSON payload when navigating to other pages.
+    const nav = table.nextElementSibling;
+    if (!nav || !nav.classList.contains("sd-table-pages")) {
+        return;
     }
+    const pageSize = parseInt(table.dataset.pageSize, 10);
+    const headerRows = parseInt(table.dataset.headerRows, 10);
+    const pageCount = Math.ceil(parseInt(table.dataset.rowCount, 10) / pageSize);
+    const firstRows = Array.from(table.children).slice(headerRows);
+    let currentRows = firstRows;
+    let payload = null;
+    let page = 0;
+
+    const previous = document.createElement("button");
+    const next = document.createElement("button");
+    const label = document.createElement("span");
+    previous.type = next.type = "button";
+    previous.textContent = "Previous";
+    next.textContent = "Next";
+    nav.prepend(previous, label, next);
+
+    async function show(number) {
+        let rows = firstRows;
+        if (number > 0) {
+            if (payload === null) {
+                payload = fetch(table.dataset.rows).then((response) => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}`);
+                    }
+                    return response.json();
+                });
+            }
+            let data;
+            try {
+                data = await payload;
+            } catch (error) {
+                // Try again on the next navigation, and refer to the page presenting all rows meanwhile.
+                console.error(`Unable to load table rows: ${error}`);
+                payload = null;
+                label.textContent = "Unable to load rows";
+                nav.classList.add("sd-table-pages-failed");
+                return;
+            }
+            nav.classList.remove("sd-table-pages-failed");
+            const template = document.createElement("template");
+            template.innerHTML = data.rows.slice((number - 1) * pageSize, number * pageSize).join("");
+            rows = Array.from(template.content.children);
+        }
+        currentRows.forEach((row) => row.remove());
+        table.append(...rows);
+        currentRows = rows;
+        page = number;
+        update();
+    }
+
+    function update() {
+        label.textContent = `Page ${page + 1} of ${pageCount}`;
+        previous.disabled = page === 0;
+        next.disabled = page >= pageCount - 1;
+    }
+
+    previous.addEventListener("click", () => show(page - 1));
+    next.addEventListener("click", () => show(page + 1));
+    update();
 }
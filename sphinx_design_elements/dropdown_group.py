@@ -1,10 +1,45 @@
+from docutils import nodes
 from sphinx.application import Sphinx
+from sphinx_design.dropdown import depart_dropdown_main, dropdown_main
+
+# Container elements using this class allow only one of their dropdown elements
+# to be open at a time.
+DROPDOWN_GROUP_CLASS = "dropdown-group"
 
 
 def setup_dropdown_group(app: Sphinx):
     """
-    Add JavaScript for defining exclusive dropdown elements using the `dropdown-group` class.
+    Set up exclusive dropdown elements, using the `dropdown-group` class.
+
+    All `<details>` elements of a group share the same `name` attribute, so
+    browsers only open one of them at a time. For browsers not supporting
+    this, `addon.js` provides a fallback.
+    """
+    app.add_node(dropdown_main, override=True, html=(visit_dropdown_main, depart_dropdown_main))
+    app.connect("doctree-resolved", name_dropdown_groups)
+
+
+def name_dropdown_groups(app: Sphinx, doctree: nodes.document, docname: str):
+    """
+    Assign a group name to all dropdown elements of each dropdown group.
+    Dropdown elements of nested groups belong to their innermost group.
+    """
+    if app.builder.format != "html":
+        return
+    groups = doctree.findall(lambda node: isinstance(node, nodes.Element) and DROPDOWN_GROUP_CLASS in node["classes"])
+    for index, group in enumerate(groups, start=1):
+        name = nodes.make_id(f"{DROPDOWN_GROUP_CLASS}-{docname}-{index}")
+        for dropdown in group.findall(dropdown_main):
+            dropdown["group"] = name
+
+
+def visit_dropdown_main(self, node):
     """
-    dropdown_js = """
+    Render `<details>` elements like sphinx-design, adding the group name.
     """
-    app.add_js_file(None, body=dropdown_js)
+    attributes = {}
+    if node.get("opened"):
+        attributes["open"] = "open"
+    if node.get("group"):
+        attributes["name"] = node["group"]
+    self.body.append(self.starttag(node, "details", **attributes))
@@ -1,4 +1,6 @@
-import hashlib
+import re
+import typing as t
+from functools import lru_cache
 from importlib.resources import read_text
 from pathlib import Path
 
@@ -8,12 +10,18 @@ from sphinx.environment import BuildEnvironment
 from sphinx_design.extension import depart_container, visit_container
 
 from . import compiled as static_module
-from .dropdown_group import setup_dropdown_group
-from .gridtable import setup_gridtable
-from .hyper import setup_hyper
+from .dropdown_group import DROPDOWN_GROUP_CLASS, setup_dropdown_group
+from .gridtable import PAGINATED_TABLE_CLASS, get_paginated_tables, setup_gridtable
+from .hyper import setup_hyper, setup_hyper_titles
 from .infocard import setup_infocard
 from .shield import setup_shield
 from .tag import setup_tags
+from .util.asset import MANIFEST_FILENAME, STATIC_PATH, asset_filename, write_assets
+from .util.cache import setup_node_cache
+from .util.instrument import registered_elements, registered_since, setup_instrumentation
+
+# Asset files, within the `compiled` package.
+ASSETS = ("addon.js", "style.css")
 
 
 def setup_extension(app: Sphinx) -> None:
@@ -23,66 +31,154 @@ def setup_extension(app: Sphinx) -> None:
 
     app.connect("builder-inited", add_assets)
     app.connect("env-updated", update_asset_links)
+    app.connect("doctree-read", collect_page_assets)
+    app.connect("env-purge-doc", purge_page_assets)
+    app.connect("env-merge-info", merge_page_assets)
+    app.connect("html-page-context", inject_page_assets)
 
     # Override container html visitors, to stop the default behaviour
     # of adding the `container` class to all `nodes.container`.
     app.add_node(nodes.container, override=True, html=(visit_container, depart_container))
 
+    elements = registered_elements()
     setup_dropdown_group(app)
     setup_gridtable(app)
     setup_hyper(app)
+    setup_hyper_titles(app)
     setup_infocard(app)
     setup_shield(app)
     setup_tags(app)
+    setup_node_cache(app)
+    setup_instrumentation(app, registered_since(elements))
 
 
 def add_assets(app: Sphinx):
     """
-    Copy JS and CSS assets to the build directory.
+    Write JS and CSS assets to the build directory.
+
+    Assets use stable file names, so pages do not need to be rewritten when
+    their content changes. Sphinx appends a checksum to the links of pages it
+    writes, and pages written earlier pick up the new content when browsers
+    revalidate the stable URL.
     """
 
     # Reset "changed" identifier.
     app.env.settings["sphinx_design_elements_assets_changed"] = False
 
     # Set up new static path in output dir.
-    static_path = (Path(app.outdir) / "_sphinx_design_elements_static").absolute()
-    static_existed = static_path.exists()
+    static_path = (Path(app.outdir) / STATIC_PATH).absolute()
     static_path.mkdir(exist_ok=True)
     app.config.html_static_path.append(str(static_path))
 
-    # Add asset files.
-    add_asset(app, static_path, "addon.js")
-    add_asset(app, static_path, "style.css")
+    # Content-addressed asset files of previous versions are referenced by
+    # all pages, so rewrite them once, when migrating to stable file names.
+    for pattern in ("design-elements.*.js", "design-elements.*.css"):
+        for path_delete in static_path.glob(pattern):
+            app.env.settings["sphinx_design_elements_assets_changed"] = True
+            path_delete.unlink()
+
+    # Add minified asset files, and their precompressed siblings.
+    write_assets(static_path, ASSETS, manifest_path=Path(app.doctreedir) / MANIFEST_FILENAME)
+
+
+def update_asset_links(app: Sphinx, env: BuildEnvironment):
+    """
+    If pages refer to JS or CSS assets of previous versions, rewrite all files.
+    """
+    if app.env.settings.get("sphinx_design_elements_assets_changed"):
+        return list(env.all_docs.keys())
+    return []
+
 
-    if not static_existed:
-        app.env.settings["sphinx_design_elements_assets_changed"] = True
+def get_page_assets(env: BuildEnvironment) -> t.Dict[str, t.Set[str]]:
+    """
+    Return the assets needed by each document.
+    """
+    if not hasattr(env, "design_elements_page_assets"):
+        env.design_elements_page_assets = {}  # type: ignore[attr-defined]
+    return env.design_elements_page_assets  # type: ignore[attr-defined]
 
 
-def add_asset(app: Sphinx, static_path: Path, filename: str):
+@lru_cache(maxsize=None)
+def stylesheet_classes() -> t.FrozenSet[str]:
+    """
+    Return all class names used by selectors of the stylesheet.
     """
-    Copy asset file to the build directory.
+    content = re.sub(r"/\*.*?\*/", "", read_text(static_module, "style.css"), flags=re.DOTALL)
+    return frozenset(re.findall(r"\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)", content))
+
+
+def find_page_assets(doctree: nodes.Node) -> t.Set[str]:
     """
-    content = read_text(static_module, filename)
-    extension = Path(filename).suffix.lstrip(".")
-    digest = hashlib.md5(content.encode("utf8")).hexdigest()  # noqa: S324
-    path = static_path / f"design-elements.{digest}.{extension}"
-    if extension == "js":
-        app.add_js_file(path.name)
-    elif extension == "css":
-        app.add_css_file(path.name)
+    Determine which assets are needed by the elements of a document.
+    """
+    assets = set()
+    for node in doctree.findall(nodes.Element):
+        classes: t.List[str] = node.get("classes", [])
+        if DROPDOWN_GROUP_CLASS in classes or PAGINATED_TABLE_CLASS in classes:
+            assets.add("addon.js")
+        # The stylesheet also adjusts the margins of `hr.docutils` elements.
+        if isinstance(node, nodes.transition) or stylesheet_classes().intersection(classes):
+            assets.add("style.css")
+        if len(assets) == len(ASSETS):
+            break
+    return assets
+
+
+def collect_page_assets(app: Sphinx, doctree: nodes.document):
+    """
+    Record which assets are needed by the current document.
+    """
+    assets = get_page_assets(app.env)
+    needed = find_page_assets(doctree)
+    if needed:
+        assets[app.env.docname] = needed
     else:
-        raise ValueError(f"Unable to add asset file, unknown extension: {filename}")
-    if not path.exists():
-        app.env.settings["sphinx_design_elements_assets_changed"] = True
-        for path_delete in static_path.glob(f"*.{extension}"):
-            path_delete.unlink()
-        path.write_text(content, encoding="utf8")
+        assets.pop(app.env.docname, None)
 
 
-def update_asset_links(app: Sphinx, env: BuildEnvironment):
+def purge_page_assets(app: Sphinx, env: BuildEnvironment, docname: str):
+    get_page_assets(env).pop(docname, None)
+
+
+def merge_page_assets(app: Sphinx, env: BuildEnvironment, docnames: t.List[str], other: BuildEnvironment):
     """
-    If JS or CSS assets changed, rewrite all files.
+    Accumulate assets recorded by parallel readers.
     """
-    if app.env.settings.get("sphinx_design_elements_assets_changed"):
-        return list(env.all_docs.keys())
-    return []
+    assets = get_page_assets(env)
+    other_assets = get_page_assets(other)
+    for docname in docnames:
+        if docname in other_assets:
+            assets[docname] = other_assets[docname]
+
+
+def find_pagename_assets(env: BuildEnvironment, pagename: str) -> t.Set[str]:
+    """
+    Return the assets needed by a page. Pages presenting all rows of a
+    paginated table need the same assets like the document of the table.
+    """
+    assets = get_page_assets(env)
+    if pagename in assets:
+        return assets[pagename]
+    for docname, tables in get_paginated_tables(env).items():
+        if any(pagename == table_pagename for _, table_pagename in tables):
+            return assets.get(docname, set())
+    return set()
+
+
+def inject_page_assets(
+    app: Sphinx, pagename: str, templatename: str, context: t.Dict[str, t.Any], doctree: t.Optional[nodes.document]
+):
+    """
+    Add JS and CSS assets only to pages which need them, unless the
+    HTML assets policy demands to add assets to all pages.
+    """
+    if app.registry.html_assets_policy == "always":
+        assets: t.Iterable[str] = ASSETS
+    else:
+        assets = find_pagename_assets(app.env, pagename)
+    for filename in sorted(assets):
+        if filename.endswith(".js"):
+            app.add_js_file(asset_filename(filename))
+        else:
+            app.add_css_file(asset_filename(filename))
@@ -1,13 +1,44 @@
+import hashlib
+import html
+import json
+import re
 import typing as t
+from pathlib import Path
 from typing import List
 
+import yaml
 from docutils import nodes
 from docutils.parsers.rst import directives
+from docutils.statemachine import StringList
 from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
 from sphinx.util.docutils import SphinxDirective
+from sphinx.util.osutil import relative_uri
+from sphinx_design.extension import visit_container
 from sphinx_design.grids import item_columns_option
 from sphinx_design.shared import create_component, margin_option, padding_option
 
+from sphinx_design_elements.util.asset import STATIC_PATH, write_file
+from sphinx_design_elements.util.cache import freeze, prototypes
+from sphinx_design_elements.util.data import read_table_data
+from sphinx_design_elements.util.instrument import phase
+
+logger = logging.getLogger(__name__)
+
+# Paginated tables use this class, their navigation uses `sd-table-pages`.
+PAGINATED_TABLE_CLASS = "sd-table-paginated"
+
+# Where payloads of paginated tables are stored, within the static directory.
+TABLES_PATH = "tables"
+
+
+class paginated_table(nodes.container):
+    """
+    A grid table container, of which only the first page of rows is rendered
+    into HTML pages. Other builders render it like any other container.
+    """
+
 
 def setup_gridtable(app: Sphinx):
     """
@@ -16,6 +47,12 @@ def setup_gridtable(app: Sphinx):
     app.add_directive("sd-table", TableDirective)
     app.add_directive("sd-row", RowDirective)
     app.add_directive("sd-item", ItemDirective)
+    app.add_node(paginated_table, html=(visit_paginated_table, None))
+    app.connect("doctree-read", collect_paginated_tables)
+    app.connect("env-purge-doc", purge_paginated_tables)
+    app.connect("env-merge-info", merge_paginated_tables)
+    app.connect("env-get-outdated", check_table_pages)
+    app.connect("html-collect-pages", collect_table_pages)
 
 
 margin_padding_classes = [margin_option("0")[0], padding_option("0")[0]]
@@ -25,54 +62,266 @@ def widths_option(
     argument: t.Optional[str],
 ) -> List[str]:
     """
-    Column widths. Each column width is an integer value between 1 and 12.
-
-    TODO: Validate the value range and the number of columns.
+    Column widths. Each column width is an integer value between 1 and 12, or `auto`.
+    A table has up to 12 columns.
     """
     if argument is None:
         return []
     values = argument.strip().split()
+    if len(values) > 12:
+        raise ValueError(f"at most 12 column widths are supported, got {len(values)}")
+    for value in values:
+        if value != "auto" and not (value.isdigit() and 1 <= int(value) <= 12):
+            raise ValueError(f"column width must be an integer from 1 to 12, or auto, got {value!r}")
     return values
 
 
+def columns_option(argument: t.Optional[str]) -> List[str]:
+    """
+    Names of columns to select from a data file, separated by commas.
+    """
+    if argument is None:
+        raise ValueError("argument required but none supplied")
+    return [column.strip() for column in argument.split(",") if column.strip()]
+
+
+# Characters and patterns which may start markup, either in reStructuredText,
+# or in MyST Markdown. Cells without them are plain text, and not parsed.
+markup_re = re.compile(
+    r"""[*_`|\\\[\]<>{}:@#$~^&]|www\.|\n|^\s*(?:[-+=.>]|\d+[.)]|[a-zA-Z][.)]\s|[ivxlcdmIVXLCDM]+[.)]\s|\()"""
+)
+
+
+def may_contain_markup(text: str) -> bool:
+    """
+    Check whether text may contain markup, erring on the side of caution.
+    """
+    return markup_re.search(text) is not None
+
+
+class TableLayout(t.NamedTuple):
+    """
+    The column layout and styling of a grid table, computed once per table,
+    and applied to each of its rows and items.
+    """
+
+    column_classes: t.List[t.List[str]]
+    row_classes: t.List[str]
+    row_outline: bool
+    item_outline: bool
+
+    @classmethod
+    def from_options(cls, options: t.Dict[str, t.Any]) -> "TableLayout":
+        return cls(
+            column_classes=[item_columns_option(width) for width in options.get("widths", [])],
+            row_classes=options.get("row-class", []),
+            row_outline="row-outline" in options,
+            item_outline="item-outline" in options,
+        )
+
+    def apply(self, items: t.Sequence[nodes.Node]) -> None:
+        """
+        Apply the column widths to the items of a row.
+        """
+        for item, classes in zip(items, self.column_classes):
+            t.cast("nodes.Element", item).update_basic_atts({"classes": classes})
+
+    def mismatch(self, count: int) -> t.Optional[str]:
+        """
+        Describe a mismatch between the number of items of a row, and the number of column widths.
+        """
+        if self.column_classes and count != len(self.column_classes):
+            return f"Grid table row has {count} items, but {len(self.column_classes)} column widths"
+        return None
+
+
+# Layouts of the grid tables being parsed, innermost last, within the document attributes.
+LAYOUTS_KEY = "sd-table-layouts"
+
+# Rows and items outside of grid tables.
+DEFAULT_LAYOUT = TableLayout([], [], False, False)
+
+
+def current_layout(document: nodes.document) -> TableLayout:
+    """
+    Return the layout of the innermost grid table being parsed.
+    """
+    layouts = document.attributes.get(LAYOUTS_KEY)
+    return layouts[-1] if layouts else DEFAULT_LAYOUT
+
+
+def create_row(options: t.Dict[str, t.Any], row_class: List[str]) -> nodes.container:
+    """
+    Create a grid row, using the options of `RowDirective`.
+    """
+
+    def factory() -> nodes.container:
+        return create_component(
+            "grid-row",
+            ["sd-row"]
+            + margin_padding_classes
+            + options.get("gutter", [])
+            + (["sd-flex-row-reverse"] if "reverse" in options else [])
+            + (["sd-border-1"] if "outline" in options else [])
+            + row_class
+            + options.get("row-class", []),
+        )
+
+    return prototypes.clone(("grid-row", freeze(options), *row_class), factory)
+
+
+def create_item(options: t.Dict[str, t.Any]) -> nodes.container:
+    """
+    Create a grid item, using the options of `ItemDirective`.
+    """
+
+    def factory() -> nodes.container:
+        return create_component(
+            "grid-item",
+            [
+                "sd-col",
+                f"sd-d-flex-{options.get('child-direction', 'column')}",
+            ]
+            + options.get("columns", [])
+            + options.get("margin", [])
+            + options.get("padding", [])
+            + ([f'sd-align-major-{options["child-align"]}'] if "child-align" in options else [])
+            + (["sd-border-1"] if "outline" in options else [])
+            + options.get("class", []),
+        )
+
+    return prototypes.clone(("grid-item", freeze(options)), factory)
+
+
 class TableDirective(SphinxDirective):
     """
     A composite element offering a title, description text, and both verbose and short tags.
     It is suitable for authoring pages enumerating items with dense information, without
     the maintenance nightmares of tables.
+
+    Rows are either defined by nested `sd-row` directives, or read from a CSV, JSON Lines,
+    JSON, or YAML file, using the `file` option.
     """
 
     has_content = True
     required_arguments = 0
     optional_arguments = 1
     option_spec = {
+        "columns": columns_option,
+        "file": directives.path,
+        "header": directives.flag,
         "item-outline": directives.flag,
         "outline": directives.flag,
+        "page-size": directives.positive_int,
         "row-class": directives.class_option,
         "row-outline": directives.flag,
         "widths": widths_option,
     }
 
     def run(self) -> List[nodes.Node]:
-        self.state_machine.document.attributes["widths"] = self.options.get("widths", [])
-        self.state_machine.document.attributes["row-class"] = self.options.get("row-class", [])
-        if "row-outline" in self.options:
-            self.state_machine.document.attributes["row-outline"] = None
-        if "item-outline" in self.options:
-            self.state_machine.document.attributes["item-outline"] = None
-
-        grid_classes = ["sd-container-fluid", "sd-sphinx-override"]
-        grid_container = create_component(
-            "grid-container",
-            grid_classes
-            + margin_padding_classes
-            + (["sd-border-1"] if "outline" in self.options else [])
-            + self.options.get("class-container", []),
+        layout = TableLayout.from_options(self.options)
+
+        grid_container = prototypes.clone(
+            ("grid-container", "outline" in self.options),
+            lambda: create_component(
+                "grid-container",
+                ["sd-container-fluid", "sd-sphinx-override"]
+                + margin_padding_classes
+                + (["sd-border-1"] if "outline" in self.options else []),
+            ),
         )
+        if "page-size" in self.options:
+            grid_container = self.paginate(grid_container)
         self.set_source_info(grid_container)
-        self.state.nested_parse(self.content, self.content_offset, grid_container)
+        if "file" in self.options:
+            if self.content:
+                raise self.error("Table content and `file` option are mutually exclusive")
+            self.add_data_rows(grid_container, layout)
+        else:
+            # Rows and items pick up the layout of the innermost table.
+            document = self.state.document
+            layouts = document.attributes.setdefault(LAYOUTS_KEY, [])
+            layouts.append(layout)
+            try:
+                with phase("nested_parse"):
+                    self.state.nested_parse(self.content, self.content_offset, grid_container)
+            finally:
+                layouts.pop()
+                if not layouts:
+                    del document.attributes[LAYOUTS_KEY]
         return [grid_container]
 
+    def paginate(self, grid_container: nodes.container) -> paginated_table:
+        """
+        Convert the grid container into a paginated table, with a distinct
+        identifier, and the name of the page presenting all of its rows.
+
+        The page is located next to the document, so relative links within the
+        rows stay valid, and its name must not shadow any document.
+        """
+        serial = self.env.new_serialno("sd-table")
+        table = paginated_table(
+            "",
+            is_div=True,
+            design_component=grid_container["design_component"],
+            classes=grid_container["classes"] + [PAGINATED_TABLE_CLASS],
+        )
+        table["ids"].append(nodes.make_id(f"sd-table-{self.env.docname}-{serial}"))
+        table["page-size"] = self.options["page-size"]
+        table["header-rows"] = 1 if "header" in self.options else 0
+        pagename = f"{self.env.docname}-table-{serial}"
+        while pagename in self.env.found_docs:
+            pagename += "-all"
+        table["all-rows-page"] = pagename
+        return table
+
+    def add_data_rows(self, grid_container: nodes.Element, layout: TableLayout) -> None:
+        """
+        Build rows from a data file, without dispatching directives per row and item.
+        Only cells which may contain markup are parsed.
+        """
+        rel_path, path = self.env.relfn2path(self.options["file"])
+        self.env.note_dependency(rel_path)
+        row_options = {"outline": None} if layout.row_outline else {}
+        item_options = {"outline": None} if layout.item_outline else {}
+        try:
+            rows = read_table_data(Path(path), self.options.get("columns"))
+            for index, row in enumerate(rows):
+                if index == 0:
+                    mismatch = layout.mismatch(len(row))
+                    if mismatch:
+                        raise self.error(f"{mismatch}, in {rel_path}")
+                    if "header" not in self.options:
+                        continue
+                grid_row = create_row(row_options, layout.row_classes)
+                self.set_source_info(grid_row)
+                for value in row:
+                    grid_row += self.create_cell(item_options, value, header=index == 0)
+                layout.apply(grid_row.children)
+                grid_container += grid_row
+        except (OSError, ValueError, yaml.YAMLError) as ex:
+            raise self.error(f"Unable to read table data from {rel_path}: {ex}") from ex
+
+    def create_cell(self, options: t.Dict[str, t.Any], value: str, header: bool) -> nodes.container:
+        """
+        Create a grid item for a single cell. Header cells are emphasized.
+        """
+        column = create_item(options)
+        self.set_source_info(column)
+        if header:
+            paragraph = nodes.paragraph("", "", nodes.strong(value, value))
+        elif may_contain_markup(value):
+            with phase("nested_parse"):
+                self.state.nested_parse(StringList(value.splitlines()), self.content_offset, column)
+            return column
+        elif value:
+            paragraph = nodes.paragraph(value, value)
+        else:
+            return column
+        self.set_source_info(paragraph)
+        column += paragraph
+        return column
+
 
 class RowDirective(SphinxDirective):
     """
@@ -85,30 +334,20 @@ class RowDirective(SphinxDirective):
     }
 
     def run(self) -> List[nodes.Node]:
-        if "row-outline" in self.state_machine.document.attributes:
+        layout = current_layout(self.state.document)
+        if layout.row_outline:
             self.options["outline"] = None
 
-        grid_row = create_component(
-            "grid-row",
-            ["sd-row"]
-            + margin_padding_classes
-            + self.options.get("gutter", [])
-            + (["sd-flex-row-reverse"] if "reverse" in self.options else [])
-            + (["sd-border-1"] if "outline" in self.options else [])
-            + self.state_machine.document.attributes["row-class"]
-            + self.options.get("row-class", []),
-        )
-        self.state_machine.document.attributes["row"] = grid_row
+        grid_row = create_row(self.options, layout.row_classes)
         grid_row.parent = self.state_machine.node
         self.set_source_info(grid_row)
-        self.state.nested_parse(self.content, self.content_offset, grid_row)
-
-        # Apply widths.
-        widths = t.cast("t.Iterable[str]", self.state_machine.document.attributes.get("widths"))
-        for column, width in zip(grid_row.children, widths):
-            element = t.cast("nodes.Element", column)
-            element.update_basic_atts({"classes": item_columns_option(width)})
+        with phase("nested_parse"):
+            self.state.nested_parse(self.content, self.content_offset, grid_row)
 
+        mismatch = layout.mismatch(len(grid_row.children))
+        if mismatch:
+            logger.warning(mismatch, location=grid_row)
+        layout.apply(grid_row.children)
         return [grid_row]
 
 
@@ -131,23 +370,151 @@ class ItemDirective(SphinxDirective):
     }
 
     def run(self) -> List[nodes.Node]:
-        if "item-outline" in self.state_machine.document.attributes:
+        if current_layout(self.state.document).item_outline:
             self.options["outline"] = None
 
-        column = create_component(
-            "grid-item",
-            [
-                "sd-col",
-                f"sd-d-flex-{self.options.get('child-direction', 'column')}",
-            ]
-            + self.options.get("columns", [])
-            + self.options.get("margin", [])
-            + self.options.get("padding", [])
-            + ([f'sd-align-major-{self.options["child-align"]}'] if "child-align" in self.options else [])
-            + (["sd-border-1"] if "outline" in self.options else [])
-            + self.options.get("class", []),
-        )
+        column = create_item(self.options)
         column.parent = self.state_machine.node
         self.set_source_info(column)
-        self.state.nested_parse(self.content, self.content_offset, column)
+        with phase("nested_parse"):
+            self.state.nested_parse(self.content, self.content_offset, column)
         return [column]
+
+
+def visit_paginated_table(self, node: paginated_table):
+    """
+    Render the first page of rows, and write the remaining rows into a
+    compact JSON payload, which `addon.js` loads on demand.
+
+    The complete table is also stored within the doctree directory, to
+    present it on a separate page, for search engines and readers without
+    JavaScript.
+    """
+    rows = []
+    for child in node.children:
+        start = len(self.body)
+        child.walkabout(self)
+        rows.append("".join(self.body[start:]))
+        del self.body[start:]
+
+    builder = self.builder
+    table_id = node["ids"][0]
+    fragment_path = get_fragment_path(builder.doctreedir, table_id)
+    visible = node["header-rows"] + node["page-size"]
+    if len(rows) <= visible:
+        fragment_path.unlink(missing_ok=True)
+        visit_container(self, node)
+        self.body.extend(rows)
+        self.body.append("</div>\n")
+        raise nodes.SkipNode
+
+    page_uri = builder.get_target_uri(builder.current_docname)
+    payload = json.dumps({"rows": rows[visible:]}, separators=(",", ":")).encode("utf8")
+    version = hashlib.md5(payload).hexdigest()[:8]  # noqa: S324
+    write_file(get_payload_path(builder.outdir, table_id), payload)
+    write_file(fragment_path, "".join([self.starttag(node, "div", CLASS="docutils"), *rows, "</div>\n"]).encode("utf8"))
+
+    url = relative_uri(page_uri, f"{STATIC_PATH}/{TABLES_PATH}/{table_id}.json") + f"?v={version}"
+    attributes = {
+        "data-rows": url,
+        "data-row-count": len(rows) - node["header-rows"],
+        "data-page-size": node["page-size"],
+        "data-header-rows": node["header-rows"],
+    }
+    self.body.append(self.starttag(node, "div", CLASS="docutils", **attributes))
+    self.body.extend(rows[:visible])
+    self.body.append("</div>\n")
+    all_rows_uri = relative_uri(page_uri, builder.get_target_uri(node["all-rows-page"]))
+    self.body.append(
+        f'<nav class="sd-table-pages"><a class="sd-table-all-rows" href="{all_rows_uri}">'
+        f"Show all {len(rows) - node['header-rows']} rows</a></nav>\n"
+    )
+    raise nodes.SkipNode
+
+
+def get_fragment_path(doctreedir: t.Union[str, Path], table_id: str) -> Path:
+    """
+    Return the path of the file storing all rows of a paginated table, as HTML.
+    """
+    return Path(doctreedir) / "design-elements" / TABLES_PATH / f"{table_id}.html"
+
+
+def get_payload_path(outdir: t.Union[str, Path], table_id: str) -> Path:
+    """
+    Return the path of the JSON payload storing the remaining rows of a paginated table.
+    """
+    return Path(outdir) / STATIC_PATH / TABLES_PATH / f"{table_id}.json"
+
+
+def get_paginated_tables(env: BuildEnvironment) -> t.Dict[str, t.List[t.Tuple[str, str]]]:
+    """
+    Return the identifiers and page names of all paginated tables, by document.
+    """
+    if not hasattr(env, "design_elements_paginated_tables"):
+        env.design_elements_paginated_tables = {}  # type: ignore[attr-defined]
+    return env.design_elements_paginated_tables  # type: ignore[attr-defined]
+
+
+def collect_paginated_tables(app: Sphinx, doctree: nodes.document):
+    """
+    Record the paginated tables of the current document.
+    """
+    tables = get_paginated_tables(app.env)
+    found = [(node["ids"][0], node["all-rows-page"]) for node in doctree.findall(paginated_table)]
+    if found:
+        tables[app.env.docname] = found
+    else:
+        tables.pop(app.env.docname, None)
+
+
+def purge_paginated_tables(app: Sphinx, env: BuildEnvironment, docname: str):
+    """
+    Forget the paginated tables of a document, and remove their files, which
+    would go stale when the document changes its tables, or is removed.
+    """
+    for table_id, pagename in get_paginated_tables(env).pop(docname, []):
+        get_fragment_path(app.doctreedir, table_id).unlink(missing_ok=True)
+        get_payload_path(app.outdir, table_id).unlink(missing_ok=True)
+        # The page presenting all rows, unless a document has taken its name meanwhile.
+        if pagename not in env.found_docs:
+            (Path(app.outdir) / app.builder.get_target_uri(pagename)).unlink(missing_ok=True)
+
+
+def merge_paginated_tables(app: Sphinx, env: BuildEnvironment, docnames: t.List[str], other: BuildEnvironment):
+    """
+    Accumulate paginated tables recorded by parallel readers.
+    """
+    tables = get_paginated_tables(env)
+    other_tables = get_paginated_tables(other)
+    for docname in docnames:
+        if docname in other_tables:
+            tables[docname] = other_tables[docname]
+
+
+def check_table_pages(
+    app: Sphinx, env: BuildEnvironment, added: t.Set[str], changed: t.Set[str], removed: t.Set[str]
+) -> t.List[str]:
+    """
+    Read documents again, when a document has been added which shadows the
+    page presenting all rows of one of their paginated tables.
+    """
+    return [
+        docname
+        for docname, tables in get_paginated_tables(env).items()
+        if any(pagename in added for _, pagename in tables)
+    ]
+
+
+def collect_table_pages(app: Sphinx):
+    """
+    Add a page presenting all rows, for each paginated table which exceeds its first page.
+    """
+    for docname, tables in sorted(get_paginated_tables(app.env).items()):
+        title = app.env.titles[docname].astext() if docname in app.env.titles else docname
+        for table_id, pagename in tables:
+            fragment_path = get_fragment_path(app.doctreedir, table_id)
+            if not fragment_path.exists():
+                continue
+            document_uri = relative_uri(app.builder.get_target_uri(pagename), app.builder.get_target_uri(docname))
+            link = f'<p><a href="{document_uri}#{table_id}">{html.escape(title)}</a></p>\n'
+            yield pagename, {"title": title, "body": link + fragment_path.read_text("utf8")}, "page.html"
@@ -1,5 +1,7 @@
 import re
-from typing import Any, Dict, List, Sequence, Tuple, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from unittest.mock import patch
 from urllib.parse import parse_qs
 
@@ -9,12 +11,24 @@ from docutils.nodes import Node, system_message, unescape
 from docutils.parsers.rst.states import Inliner
 from myst_parser.mocking import MockInliner
 from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
 from sphinx.jinja2glue import _tobool, _toint
 from sphinx.roles import AnyXRefRole
+from sphinx.transforms.post_transforms import SphinxPostTransform
+from sphinx.util import logging
 from sphinx.util.docutils import SphinxRole
 
+from sphinx_design_elements.shield import SHIELD_BADGE_URL, encode_shield_text
+from sphinx_design_elements.util.cache import get_node_cache
 from sphinx_design_elements.util.directive import SmartReference
+from sphinx_design_elements.util.http import get_transport
+from sphinx_design_elements.util.instrument import phase
+from sphinx_design_elements.util.inventory import TitleInventory
+from sphinx_design_elements.util.prefetch import TitlePrefetcher
 from sphinx_design_elements.util.role import (
+    build_directive_node,
+    build_role_node,
     get_html_page_title,
     label_from_reference_element,
     link_type,
@@ -22,6 +36,10 @@ from sphinx_design_elements.util.role import (
     parse_block_rst,
     resolve_reference,
 )
+from sphinx_design_elements.util.store import SharedTitleStore
+from sphinx_design_elements.util.title import TitleResolver
+
+logger = logging.getLogger(__name__)
 
 
 def setup_hyper(app: Sphinx):
@@ -43,6 +61,225 @@ def setup_hyper(app: Sphinx):
     app.add_role("hyper-nb-github", HyperNotebookGitHubRole(app=app))
 
 
+def setup_hyper_titles(app: Sphinx):
+    """
+    Set up resolving page titles of `hyper` URL targets, and their persistent cache.
+    """
+    app.add_config_value("hyper_title_cache_dir", None, "", types=[str])
+    app.add_config_value("hyper_title_cache_limit", 5, "", types=[int, float])
+    app.add_config_value("hyper_title_timeout", 10, "", types=[int, float])
+    app.add_config_value("hyper_title_budget", None, "", types=[int, float])
+    app.add_config_value("hyper_title_offline", False, "", types=[bool])
+    app.add_config_value("hyper_title_prefetch", True, "", types=[bool])
+    app.add_config_value("hyper_title_prefetch_workers", 8, "", types=[int])
+    app.add_config_value("hyper_title_prefetch_per_host", 2, "", types=[int])
+    app.connect("config-inited", check_title_budget)
+    app.connect("builder-inited", load_title_inventory)
+    app.connect("env-before-read-docs", reset_title_store)
+    app.connect("env-before-read-docs", prefetch_titles)
+    app.connect("env-merge-info", merge_title_inventory)
+    app.connect("build-finished", save_title_inventory)
+    app.connect("build-finished", close_transport)
+    app.add_post_transform(HyperTitleTransform)
+
+
+def check_title_budget(app: Sphinx, config: Config):
+    """
+    Validate the network budget, converting values given on the command line,
+    like `-D hyper_title_budget=1`, which arrive as strings.
+    """
+    budget = config.hyper_title_budget
+    if budget is None or isinstance(budget, (int, float)):
+        return
+    try:
+        config.hyper_title_budget = float(budget)
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid network budget: {budget!r}. Expected a number of seconds, using unlimited budget")
+        config.hyper_title_budget = None
+
+
+def load_title_inventory(app: Sphinx):
+    """
+    Load the title inventory from disk.
+
+    By default, it is stored within the doctree directory, so it will be
+    retained across builds like the pickled environment.
+    """
+    if app.config.hyper_title_cache_dir:
+        path = Path(app.confdir) / app.config.hyper_title_cache_dir
+    else:
+        path = Path(app.doctreedir) / "hyper"
+    inventory = TitleInventory(path=path, cache_limit=app.config.hyper_title_cache_limit, project=app.config.project)
+    inventory.load()
+    app.env.hyper_title_inventory = inventory  # type: ignore[attr-defined]
+    app.env.hyper_title_resolver = TitleResolver(  # type: ignore[attr-defined]
+        inventory=inventory,
+        timeout=app.config.hyper_title_timeout,
+        budget=app.config.hyper_title_budget,
+        offline=app.config.hyper_title_offline,
+        store=SharedTitleStore(Path(app.doctreedir) / "hyper-titles.sqlite"),
+    )
+
+
+def save_title_inventory(app: Sphinx, exception: Optional[Exception]):
+    """
+    Save the title inventory to disk.
+    """
+    inventory = get_title_inventory(app.env)
+    if inventory is not None:
+        inventory.save()
+
+
+def reset_title_store(app: Sphinx, env: BuildEnvironment, docnames: List[str]):
+    """
+    Reset the shared title store at the beginning of reading documents.
+
+    This happens within the main process, before any parallel readers are forked.
+    """
+    resolver = get_title_resolver(env)
+    if resolver is not None and resolver.store is not None:
+        resolver.store.reset()
+
+
+def merge_title_inventory(app: Sphinx, env: BuildEnvironment, docnames: List[str], other: BuildEnvironment):
+    """
+    Merge page titles retrieved by parallel readers into the main title inventory.
+    """
+    inventory = get_title_inventory(env)
+    other_inventory = get_title_inventory(other)
+    if inventory is not None and other_inventory is not None:
+        inventory.update(other_inventory)
+
+
+def close_transport(app: Sphinx, exception: Optional[Exception]):
+    """
+    Close idle connections of the HTTP transport.
+    """
+    close = getattr(get_transport(), "close", None)
+    if close is not None:
+        close()
+
+
+def prefetch_titles(app: Sphinx, env: BuildEnvironment, docnames: List[str]):
+    """
+    Scan the sources of all documents to be read for URL targets of `hyper` roles
+    without explicit title, and retrieve their titles concurrently, so the roles
+    will only need to read them from the title inventory.
+    """
+    resolver = get_title_resolver(env)
+    if resolver is None or not resolver.available or not app.config.hyper_title_prefetch:
+        return
+
+    urls = set()
+    for docname in docnames:
+        try:
+            source = Path(env.doc2path(docname)).read_text(encoding="utf8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        urls.update(scan_title_urls(source))
+    urls_missing = [url for url in sorted(urls) if url not in resolver.inventory]
+    if not urls_missing:
+        return
+
+    logger.info(f"prefetching {len(urls_missing)} page titles... ", nonl=True)
+    prefetcher = TitlePrefetcher(
+        fetch=resolver.fetch,
+        max_workers=app.config.hyper_title_prefetch_workers,
+        per_host=app.config.hyper_title_prefetch_per_host,
+    )
+    prefetcher.run(urls_missing)
+    logger.info("done")
+
+    # Do not hand over open connections to parallel readers.
+    close_transport(app, None)
+
+
+def scan_title_urls(source: str) -> List[str]:
+    """
+    Find URL targets of `hyper` roles without explicit title in MyST or rST source text.
+    """
+    urls = []
+    for matched in hyper_role_re.finditer(source):
+        data, _ = HyperRefRole.parse_text(matched.group("text"))
+        if data is None or data.get("title"):
+            continue
+        target = data.get("target") or ""
+        if link_type(target) == "url":
+            urls.append(target)
+    return urls
+
+
+def get_title_inventory(env: BuildEnvironment) -> Optional[TitleInventory]:
+    """
+    Return the title inventory, if the extension has been set up completely.
+    """
+    return getattr(env, "hyper_title_inventory", None)
+
+
+def get_title_resolver(env: BuildEnvironment) -> Optional[TitleResolver]:
+    """
+    Return the title resolver, if the extension has been set up completely.
+    """
+    return getattr(env, "hyper_title_resolver", None)
+
+
+class hyper_title(nodes.Inline, nodes.TextElement):
+    """
+    Placeholder for a page title which could not be resolved while parsing.
+
+    Its text is the URL of the page, which is used as a fallback.
+    """
+
+
+class HyperTitleTransform(SphinxPostTransform):
+    """
+    Resolve deferred page titles from the title inventory, or fall back to the URL.
+
+    Titles are displayed by `hyper_title` placeholders, or by attributes of elements
+    marked with `hyper-title-url`, like the alternative text and the image URL of shields.
+    """
+
+    default_priority = 5
+
+    def run(self, **kwargs: Any) -> None:
+        for node in list(self.document.findall(hyper_title)):
+            title = self.resolve(node["url"], short_title=node.get("short-title", False))
+            node.replace_self(nodes.Text(title or node.astext()))
+        for element in list(self.document.findall(nodes.Element)):
+            url = element.attributes.pop("hyper-title-url", None)
+            if url is None:
+                continue
+            title = self.resolve(url, short_title=element.attributes.pop("hyper-short-title", False))
+            if title:
+                self.replace_attributes(element, url, title)
+
+    def resolve(self, url: str, short_title: bool = False) -> Optional[str]:
+        inventory = get_title_inventory(self.env)
+        title = inventory.get(url) if inventory is not None else None
+        if title and short_title:
+            title = title.split(" - ", 1)[0]
+        return title
+
+    @staticmethod
+    def replace_attributes(element: nodes.Element, url: str, title: str) -> None:
+        """
+        Replace the URL by the title within attributes displaying it.
+        """
+        for key in ("alt", "reftitle"):
+            if element.get(key) == url:
+                element[key] = title
+        uri = element.get("uri", "")
+        if isinstance(element, nodes.image) and uri.startswith(SHIELD_BADGE_URL):
+            element["uri"] = uri.replace(encode_shield_text(url), encode_shield_text(title), 1)
+        badge = element.get("shield")
+        if badge is not None and badge["message"] == url:
+            element["shield"] = {**badge, "message": title}
+
+
+# Matches `hyper` roles in MyST ({hyper}`text`) and rST (:hyper:`text`) syntax.
+hyper_role_re = re.compile(r"(?:{|:)(?P<name>hyper(?:-[\w-]+)?)(?:}|:)`(?P<text>[^`]+)`")
+
+
 class HyperRefRole(AnyXRefRole):
     """
     Craft hyperlinks with style.
@@ -59,13 +296,11 @@ class HyperRefRole(AnyXRefRole):
         "shield",
     ]
 
-    options_re = re.compile(r"^(?P<target>.+?)\s*(?:{(?P<options>.+)})?$", re.DOTALL)
-    title_and_options_re = re.compile(
-        r"^(?P<title>.+?)\s*(?<!\x00)<(?P<target>.+?)>(?:\s*{(?P<options>.+)})?$", re.DOTALL
-    )
-
     default_options: Dict[str, str] = {}
 
+    # Whether to build nodes directly, instead of rendering MyST snippets.
+    build_nodes = True
+
     def __init__(self, app: Sphinx, *args, **kwargs):
         self.with_container = False
         # Any number of options for the reference role.
@@ -91,6 +326,34 @@ class HyperRefRole(AnyXRefRole):
         self.text = unescape(text)
         self.lineno = lineno
         self.inliner = inliner  # type: ignore[assignment]
+
+        # Repeated invocations are rendered only once.
+        cache = get_node_cache(self.app.env)
+        cache_key = (name, text.strip())
+        if cache is not None:
+            source, line = inliner.reporter.get_source_and_line(lineno)  # type: ignore[attr-defined]
+            cached = cache.get(cache_key, self.app.env.docname, source, line)
+            if cached is not None:
+                return cached, []
+
+        result, messages = self.render(name, rawtext, text, lineno, inliner, options, content)
+        if cache is not None and not messages and not self.title_deferred:
+            cache.set(cache_key, self.app.env.docname, result)
+        return result, messages
+
+    def render(
+        self,
+        name: str,
+        rawtext: str,
+        text: str,
+        lineno: int,
+        inliner: Union[Inliner, MockInliner],
+        options: Union[Dict, None] = None,
+        content: Union[Sequence[str], None] = None,
+    ) -> Tuple[List[Node], List[system_message]]:
+        """
+        Parse the role text, and render the hyperlink.
+        """
         # self.options = options  # noqa: ERA001
         # self.content = content  # noqa: ERA001
 
@@ -102,22 +365,15 @@ class HyperRefRole(AnyXRefRole):
 
         self.title = ""
         self.target = ""
+        self.title_deferred = False
         self.ref_options = {}
         if self.default_options:
             self.ref_options.update(self.default_options)
 
-        matched = self.title_and_options_re.match(text)
-        if matched:
-            self.has_explicit_title = True
-        else:
-            self.has_explicit_title = False
-            matched = self.options_re.match(text)
+        with phase("parse text"):
+            data, self.has_explicit_title = self.parse_text(text)
 
-        if matched:
-            data = matched.groupdict()
-            for key, value in data.items():
-                if value is not None:
-                    data[key] = unescape(value)
+        if data is not None:
             if data["options"]:
                 self.ref_options.update(decode_hyper_options(data["options"]))
             title = data.get("title")
@@ -147,16 +403,44 @@ class HyperRefRole(AnyXRefRole):
 
         return SphinxRole.__call__(self, name, rawtext, text, lineno, inliner, options, content)  # type: ignore[arg-type]
 
+    @classmethod
+    def parse_text(cls, text: str) -> Tuple[Optional[Dict[str, Optional[str]]], bool]:
+        """
+        Parse role text into its `title`, `target`, and `options` slots.
+
+        Return the slots, or `None` if the text can not be parsed, and
+        whether the title has been given explicitly.
+        """
+        slots = split_hyper_text(text)
+        if slots is None:
+            return None, False
+        title, target, options = slots
+        data: Dict[str, Optional[str]] = {}
+        if title is not None:
+            data["title"] = unescape(title)
+        data["target"] = unescape(target)
+        data["options"] = unescape(options) if options is not None else None
+        return data, title is not None
+
     def resolve_page_title(self) -> str:
         """
         Resolve page title from reference or URL.
         """
         ref: Union[nodes.Node, nodes.Element, None] = None
         if self.srh.is_url():
-            try:
-                return get_html_page_title(self.target)
-            except Exception:
+            resolver = get_title_resolver(self.app.env)
+            if resolver is None or link_type(self.target) != "url":
+                try:
+                    return get_html_page_title(self.target)
+                except Exception:
+                    return self.target
+            with phase("resolve title", url=self.target):
+                title = resolver.resolve(self.target)
+            if title is None:
+                # Emit a placeholder, to be resolved from the inventory later.
+                self.title_deferred = True
                 return self.target
+            return title
         elif self.srh.is_traditional_intersphinx_reference():
             document = self.inliner.document
             ref = resolve_reference(env=self.app.env, document=document, target=self.target)
@@ -169,6 +453,34 @@ class HyperRefRole(AnyXRefRole):
 
     def run(self) -> Tuple[List[nodes.Node], List[nodes.system_message]]:
         """Run the role."""
+        short_title = "short-title" in self.ref_options
+        result, messages = self.run_type()
+        if self.title_deferred:
+            for node in result:
+                self.defer_title(node, short_title=short_title)
+        return result, messages
+
+    def defer_title(self, node: nodes.Node, short_title: bool = False) -> None:
+        """
+        Replace text nodes displaying the URL target by `hyper_title` placeholders,
+        and mark elements displaying it within attributes, like shields.
+        """
+        for text in list(node.findall(nodes.Text)):
+            if text.astext() == self.target and text.parent is not None:
+                placeholder = hyper_title(self.target, self.target, url=self.target)
+                if short_title:
+                    placeholder["short-title"] = True
+                text.parent.replace(text, placeholder)
+        for element in node.findall(nodes.Element):
+            if self.target in (element.get("alt"), element.get("reftitle")):
+                element["hyper-title-url"] = self.target
+                if short_title:
+                    element["hyper-short-title"] = True
+
+    def run_type(self) -> Tuple[List[nodes.Node], List[nodes.system_message]]:
+        """
+        Render the hyperlink according to its type.
+        """
 
         if self.title and "short-title" in self.ref_options:
             del self.ref_options["short-title"]
@@ -213,8 +525,7 @@ class HyperRefRole(AnyXRefRole):
             if outline:
                 suffix = "-line"
             # {bdg-link-primary-line}`explicit title <https://example.com>`
-            snippet = f"{{{type_}-{color}{suffix}}}`{self.title} <{self.target}>`"
-            return self.render_snippet(snippet)
+            return self.render_role(f"{type_}-{color}{suffix}", f"{self.title} <{self.target}>")
 
         elif type_ == "button":
             self.ref_options.setdefault("color", "primary")
@@ -280,8 +591,7 @@ class HyperRefRole(AnyXRefRole):
         else:
             raise NotImplementedError(f"Hyperref type not implemented: {type_}. Viable choices: {self.special_types}")
 
-        snippet = f":::{{{type_}}} {argument0}\n{self.directive_options}{content}\n:::"
-        return self.render_snippet(snippet)
+        return self.render_directive(type_, argument0, content)
 
     def pop_icon(self):
         if icon := self.ref_options.pop("icon", None):
@@ -303,29 +613,156 @@ class HyperRefRole(AnyXRefRole):
             type_ = "ref"
         return f"{prefix}-{type_}"
 
+    def render_role(self, name: str, text: str) -> Tuple[List[nodes.Node], List[nodes.system_message]]:
+        """
+        Render a role, building its nodes directly, or by rendering a MyST snippet.
+        """
+        if self.build_nodes and isinstance(self.inliner, MockInliner):
+            node, messages = build_role_node(self.inliner, name, text, self.lineno)
+            if node is not None:
+                return self.render_node(node, messages)
+            if messages:
+                return [], self.system_messages + messages
+        return self.render_snippet(f"{{{name}}}`{text}`")
+
+    def render_directive(
+        self, name: str, argument: str, content: str
+    ) -> Tuple[List[nodes.Node], List[nodes.system_message]]:
+        """
+        Render a directive, building its nodes directly, or by rendering a MyST snippet.
+        """
+        if self.build_nodes and isinstance(self.inliner, MockInliner):
+            node = build_directive_node(
+                self.inliner,
+                name=name,
+                argument=argument,
+                options=self.directive_option_values,
+                content=content,
+                lineno=self.lineno,
+                with_container=self.with_container,
+            )
+            if node is not None:
+                return self.render_node(node)
+        return self.render_snippet(f":::{{{name}}} {argument}\n{self.directive_options}{content}\n:::")
+
     def render_snippet(self, snippet: str) -> Tuple[List[nodes.Node], List[nodes.system_message]]:
         """
         Render a MyST snippet.
         """
-        directive_nodes, _ = self.inliner.parse_block(  # type: ignore[attr-defined]
-            text=snippet, lineno=self.lineno, memo=self, parent=self.inliner.parent, with_container=self.with_container
-        )
+        with phase("render snippet"):
+            directive_nodes, _ = self.inliner.parse_block(  # type: ignore[attr-defined]
+                text=snippet,
+                lineno=self.lineno,
+                memo=self,
+                parent=self.inliner.parent,
+                with_container=self.with_container,
+            )
         if not directive_nodes:
             return [], self.system_messages
-        node = directive_nodes[0]
+        return self.render_node(directive_nodes[0])
+
+    def render_node(
+        self, node: nodes.Node, messages: Optional[List[nodes.system_message]] = None
+    ) -> Tuple[List[nodes.Node], List[nodes.system_message]]:
         self.set_source_info(node)
-        return [node], self.system_messages
+        return [node], self.system_messages + (messages or [])
 
     @property
-    def directive_options(self) -> str:
+    def directive_option_values(self) -> Dict[str, Any]:
         """
-        Format options in MyST directive format, using YAML.
+        Return directive options, where `True` designates flags.
         """
         items = self.ref_options.copy()
         for key, value in items.items():
             if not value or (not _toint(value) and _tobool(value) is True):
                 items[key] = True
-        return "---\n" + yaml.dump(items) + "---\n"
+        return items
+
+    @property
+    def directive_options(self) -> str:
+        """
+        Format options in MyST directive format, using YAML.
+        """
+        return "---\n" + yaml.dump(self.directive_option_values) + "---\n"
+
+
+@lru_cache(maxsize=8192)
+def split_hyper_text(text: str) -> Optional[Tuple[Optional[str], str, Optional[str]]]:
+    """
+    Split the text of `{hyper}` roles into title, target, and options, in linear time.
+
+    - `title <target> {options}`, where the title is optional, and the `<`
+      character must not be escaped.
+    - `target {options}`
+
+    The options are optional in both cases. Return `None` for empty text.
+
+    The outcome is the same like matching the regular expressions
+    `^(?P<title>.+?)\\s*(?<!\\x00)<(?P<target>.+?)>(?:\\s*{(?P<options>.+)})?$`, and,
+    when that fails, `^(?P<target>.+?)\\s*(?:{(?P<options>.+)})?$`, but it avoids
+    their quadratic backtracking on text which does not match.
+    """
+    length = len(text)
+    if not length:
+        return None
+
+    # Index of the first non-whitespace character at or after each position.
+    skip = [length] * (length + 1)
+    for index in range(length - 1, -1, -1):
+        skip[index] = skip[index + 1] if text[index].isspace() else index
+
+    # Where the closing brace of options may be, considering that `$` also
+    # matches before a trailing newline.
+    if text.endswith("}"):
+        brace = length - 1
+    elif text.endswith("}\n"):
+        brace = length - 2
+    else:
+        brace = -1
+
+    def tail(position: int, blank: bool) -> Tuple[bool, Optional[str]]:
+        """
+        Whether the text from `position` on is an options block, or empty.
+        Blank text is accepted, when `blank` is true.
+        """
+        start = skip[position]
+        if text[start : start + 1] == "{" and brace >= start + 2:
+            return True, text[start + 1 : brace]
+        if blank:
+            return start == length, None
+        return position == length or (position == length - 1 and text[position] == "\n"), None
+
+    # `title <target> {options}`: The target ends at the first `>` followed by
+    # options or the end, and must end after the last such `>`.
+    last = -1
+    for index in range(length - 1, -1, -1):
+        if text[index] == ">" and tail(index + 1, blank=False)[0]:
+            last = index
+            break
+    for size in range(1, length):
+        opening = skip[size]
+        if opening + 2 > last:
+            break
+        if text[opening] != "<" or text[opening - 1] == "\x00":
+            continue
+        for closing in range(opening + 2, last + 1):
+            if text[closing] == ">":
+                matched, options = tail(closing + 1, blank=False)
+                if matched:
+                    return text[:size], text[opening + 1 : closing], options
+
+    # `target {options}`
+    for size in range(1, length + 1):
+        matched, options = tail(size, blank=True)
+        if matched:
+            return None, text[:size], options
+    return None  # pragma: nocover
+
+
+@lru_cache(maxsize=1024)
+def parse_hyper_options(text: str) -> Tuple[Tuple[str, str], ...]:
+    indata = parse_qs(text, separator=",")
+    return tuple((key, value[0]) for key, value in indata.items())
 
 
 def decode_hyper_options(text: str) -> Dict[str, str]:
@@ -334,11 +771,7 @@ def decode_hyper_options(text: str) -> Dict[str, str]:
 
     {hyper}`Navigate to Tutorial <fts-analyzer> {type=shield,color=darkcyan,logo=Markdown}`
     """
-    indata = parse_qs(text, separator=",")
-    outdata = {}
-    for key, value in indata.items():
-        outdata[key] = value[0]
-    return outdata
+    return dict(parse_hyper_options(text))
 
 
 class HyperNavigateRole(HyperRefRole):
@@ -1,18 +1,32 @@
+import typing as t
+from pathlib import Path
 from typing import List, Tuple, cast
 
+import yaml
 from docutils import nodes
+from docutils.parsers.rst import directives
 from docutils.statemachine import StringList
+from sphinx import addnodes
 from sphinx.application import Sphinx
 from sphinx.util.docutils import SphinxDirective
+from sphinx_design.badges_buttons import create_bdg_classes
 from sphinx_design.cards import CardDirective
-from sphinx_design.shared import create_component, margin_option, padding_option
+from sphinx_design.grids import item_columns_option
+from sphinx_design.shared import SEMANTIC_COLORS, create_component, margin_option, padding_option
+
+from sphinx_design_elements.gridtable import may_contain_markup, widths_option
+from sphinx_design_elements.util.cache import freeze, prototypes
+from sphinx_design_elements.util.data import read_records
+from sphinx_design_elements.util.directive import SmartReference
+from sphinx_design_elements.util.instrument import phase
 
 
 def setup_infocard(app: Sphinx):
     """
-    Set up the `InfoCardDirective` composite web element.
+    Set up the `InfoCardDirective` and `InfoCardListDirective` composite web elements.
     """
     app.add_directive("info-card", InfoCardDirective)
+    app.add_directive("info-card-list", InfoCardListDirective)
 
 
 class GridBuilderDirective(SphinxDirective):
@@ -26,6 +40,13 @@ class GridBuilderDirective(SphinxDirective):
 
         Return its outer and inner `docutils.container` instances.
         """
+        grid_container = prototypes.clone(("info-card-grid", freeze(self.options)), self.build_grid)
+        grid_row = cast("nodes.container", grid_container[0])
+        self.set_source_info(grid_container)
+        self.set_source_info(grid_row)
+        return grid_container, grid_row
+
+    def build_grid(self) -> nodes.container:
         margin_padding_classes = [margin_option("0")[0], padding_option("0")[0]]
 
         grid_classes = ["sd-container-fluid", "sd-sphinx-override"]
@@ -36,7 +57,6 @@ class GridBuilderDirective(SphinxDirective):
             + (["sd-border-1"] if "outline" in self.options else [])
             + self.options.get("class-container", []),
         )
-        self.set_source_info(grid_container)
         grid_row = create_component(
             "grid-row",
             ["sd-row"]
@@ -45,21 +65,40 @@ class GridBuilderDirective(SphinxDirective):
             + (["sd-flex-row-reverse"] if "reverse" in self.options else [])
             + self.options.get("class-row", []),
         )
-        self.set_source_info(grid_row)
         grid_container += grid_row
-        return grid_container, grid_row
+        return grid_container
 
-    def create_card(self) -> Tuple[nodes.Element, nodes.Element]:
+    def create_card(
+        self, arguments: t.Optional[List[str]] = None, options: t.Optional[t.Dict[str, t.Any]] = None
+    ) -> Tuple[nodes.Element, nodes.Element]:
         """
         Create a sphinx-design "card" component.
 
         Return its outer and inner `docutils.container` instances.
         """
+        arguments = self.arguments if arguments is None else arguments
+        options = self.options if options is None else options
+
+        def factory() -> nodes.Element:
+            return self.build_card(arguments, options)
+
+        # Titles are parsed, and may refer to the current document, so only untitled cards are shared.
+        if arguments:
+            card_node = factory()
+        else:
+            card_node = prototypes.clone(("card", freeze(options)), factory)
+        self.set_source_info(card_node)
+
+        card_body = card_node.children[0]
+        self.set_source_info(card_body)
+        return card_node, cast("nodes.Element", card_body)
+
+    def build_card(self, arguments: List[str], options: t.Dict[str, t.Any]) -> nodes.Element:
         card = CardDirective(
             # FIXME: Need to assign random name?
             name="sdroot",
-            arguments=self.arguments,
-            options=self.options,
+            arguments=arguments,
+            options=options,
             content=StringList(None),
             lineno=self.lineno,
             content_offset=self.content_offset,
@@ -69,12 +108,7 @@ class GridBuilderDirective(SphinxDirective):
         )
 
         # TODO: Can process this differently?
-        card_node = card.run()[0]
-        self.set_source_info(card_node)
-
-        card_body = card_node.children[0]
-        self.set_source_info(card_body)
-        return cast("nodes.Element", card_node), cast("nodes.Element", card_body)
+        return cast("nodes.Element", card.run()[0])
 
 
 class InfoCardDirective(GridBuilderDirective):
@@ -104,8 +138,144 @@ class InfoCardDirective(GridBuilderDirective):
         card_body += content_outer
 
         # Parse the node content, assuming grid items, and add them to the content grid.
-        self.state.nested_parse(self.content, self.content_offset, content_inner)
+        with phase("nested_parse"):
+            self.state.nested_parse(self.content, self.content_offset, content_inner)
         self.set_source_info(content_inner)
 
         # Return a reference to the root node.
         return [root]
+
+
+def is_grid_row(node: nodes.Node) -> bool:
+    return isinstance(node, nodes.container) and node.get("design_component") == "grid-row"
+
+
+def info_card_widths_option(argument: t.Optional[str]) -> List[str]:
+    """
+    Widths of the description and tags columns of info cards.
+    """
+    values = widths_option(argument)
+    if len(values) != 2:
+        raise ValueError("two column widths are required, for the description and the tags")
+    return values
+
+
+class InfoCardListDirective(InfoCardDirective):
+    """
+    Render many info cards from a JSON Lines, JSON, or YAML file, in one pass.
+
+    Each entry provides a `title`, a `description`, `tags`, and a `link`. The
+    grid and card components are created once, and cloned for each entry.
+    """
+
+    has_content = False
+    required_arguments = 1
+    optional_arguments = 0
+    final_argument_whitespace = True
+    option_spec = {
+        "widths": info_card_widths_option,
+    }
+
+    def run(self) -> List[nodes.Node]:
+        rel_path, path = self.env.relfn2path(directives.path(self.arguments[0]))
+        self.env.note_dependency(rel_path)
+
+        # Create the component skeleton of a single info card, once.
+        skeleton, canvas = self.create_grid()
+        card, card_body = self.create_card(arguments=[], options={})
+        canvas += card
+        content_outer, _ = self.create_grid()
+        card_body += content_outer
+
+        widths = self.options.get("widths", ["8", "4"])
+        column_classes = [item_columns_option(width) for width in widths]
+
+        cards: List[nodes.Node] = []
+        try:
+            for entry in read_records(Path(path)):
+                root = skeleton.deepcopy()
+                # The content grid is the innermost row.
+                content_inner = cast("nodes.Element", list(root.findall(is_grid_row))[-1])
+                content_inner += self.create_column(column_classes[0], self.describe(entry))
+                content_inner += self.create_column(column_classes[1], self.create_tags(entry.get("tags")))
+                cards.append(root)
+        except (OSError, ValueError, yaml.YAMLError) as ex:
+            raise self.error(f"Unable to read info cards from {rel_path}: {ex}") from ex
+        return cards
+
+    def create_column(self, classes: List[str], children: List[nodes.Node]) -> nodes.container:
+        column = create_component("grid-item", ["sd-col", "sd-d-flex-column", *classes], children=children)
+        self.set_source_info(column)
+        return column
+
+    def describe(self, entry: t.Dict[str, t.Any]) -> List[nodes.Node]:
+        """
+        Create the title, linked when the entry has a link, and the description.
+        """
+        elements: List[nodes.Node] = []
+        title = str(entry.get("title") or "")
+        if title:
+            paragraph = nodes.paragraph()
+            link = entry.get("link")
+            paragraph += self.create_link(str(link), title) if link else nodes.strong(title, title)
+            self.set_source_info(paragraph)
+            elements.append(paragraph)
+
+        description = str(entry.get("description") or "")
+        if may_contain_markup(description):
+            container = nodes.Element()
+            with phase("nested_parse"):
+                self.state.nested_parse(StringList(description.splitlines()), self.content_offset, container)
+            elements.extend(container.children)
+        elif description:
+            paragraph = nodes.paragraph(description, description)
+            self.set_source_info(paragraph)
+            elements.append(paragraph)
+        return elements
+
+    def create_link(self, link: str, title: str) -> nodes.Element:
+        """
+        Link to an URL, to a label when prefixed with `#`, or to a document otherwise.
+        """
+        if SmartReference(link).is_url():
+            return nodes.reference(title, title, refuri=link)
+        if link.startswith("#"):
+            reftype, target = "ref", link[1:].lower()
+        else:
+            reftype, target = "doc", link
+        reference = addnodes.pending_xref(
+            title,
+            nodes.inline(title, title),
+            refdomain="std",
+            reftype=reftype,
+            reftarget=target,
+            refdoc=self.env.docname,
+            refexplicit=True,
+            refwarn=True,
+        )
+        self.set_source_info(reference)
+        return reference
+
+    def create_tags(self, tags: t.Any) -> List[nodes.Node]:
+        """
+        Create tags like the `tags` roles do, either from a list of names, or
+        a comma-separated string, or from a mapping of colors to tags.
+        """
+        if not tags:
+            return []
+        if not isinstance(tags, dict):
+            tags = {"primary": tags}
+        elements: List[nodes.Node] = []
+        for color, names in tags.items():
+            if color not in SEMANTIC_COLORS:
+                raise ValueError(f"Unknown tag color: {color}")
+            if isinstance(names, str):
+                names = names.split(",")
+            paragraph = nodes.paragraph()
+            for index, name in enumerate(map(str.strip, map(str, names))):
+                if index:
+                    paragraph += nodes.inline(" ", " ")
+                paragraph += nodes.inline(name, name, classes=create_bdg_classes(color, True))
+            self.set_source_info(paragraph)
+            elements.append(paragraph)
+        return elements
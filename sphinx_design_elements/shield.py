@@ -1,22 +1,70 @@
+import typing as t
 import urllib
+from pathlib import Path
 
 from docutils import nodes
 from docutils.parsers.rst import directives
 from docutils.statemachine import StringList
 from myst_parser.mocking import MockState
 from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
 from sphinx.util.docutils import SphinxDirective
+from sphinx.util.osutil import relative_uri
 
-from sphinx_design_elements.util.directive import MarkdownWrapper, link_to_markdown
+from sphinx_design_elements.util.asset import STATIC_PATH, write_file
+from sphinx_design_elements.util.badge import (
+    badge_filename,
+    badge_id,
+    can_render_badge,
+    content_digest,
+    layout_badge,
+    render_badge_sprite,
+    render_badge_svg,
+    render_badge_use,
+)
+from sphinx_design_elements.util.cache import get_node_cache
+from sphinx_design_elements.util.directive import SmartReference, get_markdown_wrapper, link_to_markdown
+from sphinx_design_elements.util.instrument import phase
 
-mw = MarkdownWrapper()
+logger = logging.getLogger(__name__)
+
+# The site-wide sprite file, within the static directory.
+SPRITE_FILENAME = "shields.svg"
+
+# Static badges of shields.io.
+SHIELD_BADGE_URL = "https://img.shields.io/badge/"
+
+# `remote`: Refer to shields.io. `local`: Refer to one SVG file per badge.
+# `sprite`: Refer to symbols of a site-wide SVG sprite. `inline`: Embed symbols into each page.
+SHIELD_RENDER_MODES = ("remote", "local", "sprite", "inline")
 
 
 def setup_shield(app: Sphinx):
     """
     Set up the `ShieldsDirective` element.
     """
+    app.add_config_value("shield_render", "remote", "env", types=[str])
+    app.connect("config-inited", check_render_mode)
     app.add_directive("shield", ShieldsDirective)
+    app.connect("doctree-read", collect_badges)
+    app.connect("env-purge-doc", purge_badges)
+    app.connect("env-merge-info", merge_badges)
+    app.connect("env-updated", write_sprite)
+    app.connect("doctree-resolved", render_local_badges)
+
+
+def check_render_mode(app: Sphinx, config: Config):
+    """
+    Validate how badges are rendered: Either `remote`, by shields.io, `local`, as SVG files,
+    `sprite`, as symbols of a site-wide SVG sprite, or `inline`, as symbols embedded into each page.
+    """
+    if config.shield_render not in SHIELD_RENDER_MODES:
+        logger.warning(
+            f"Unknown shield render mode: {config.shield_render}. Viable choices: {list(SHIELD_RENDER_MODES)}"
+        )
+        config.shield_render = "remote"
 
 
 class ShieldsDirective(SphinxDirective):
@@ -50,8 +98,25 @@ class ShieldsDirective(SphinxDirective):
         "link-alt": directives.unchanged,
     }
 
+    # Whether to build nodes directly, instead of rendering Markdown, where possible.
+    build_nodes = True
+
     def run(self):
-        """Run the directive."""
+        """Run the directive, or reuse the nodes of an identical invocation."""
+        cache = get_node_cache(self.env)
+        if cache is None:
+            return self.render()
+        key = ("shield", tuple(self.arguments), tuple(sorted(self.options.items())), "\n".join(self.content))
+        source, line = self.get_source_info()
+        cached = cache.get(key, self.env.docname, source, line)
+        if cached is not None:
+            return cached
+        result = self.render()
+        cache.set(key, self.env.docname, result)
+        return result
+
+    def render(self):
+        """Render the shield."""
 
         quote = urllib.parse.quote
 
@@ -77,7 +142,7 @@ class ShieldsDirective(SphinxDirective):
         if not text:
             raise self.error("Shield text is empty")
 
-        badge_url = f"https://img.shields.io/badge/{text}-{quote(message_color)}"
+        badge_url = f"{SHIELD_BADGE_URL}{text}-{quote(message_color)}"
         badge_args = {}
         if style:
             badge_args["style"] = style
@@ -90,24 +155,69 @@ class ShieldsDirective(SphinxDirective):
 
         if badge_args:
             badge_url += "?" + urllib.parse.urlencode(badge_args)
-        content = f"![{link_alt}]({badge_url})"
 
-        if link:
-            content = link_to_markdown(link, content, link_title)
+        result = self.build(badge_url, link, link_title, link_alt) if self.build_nodes else None
+
+        if result is None:
+            content = f"![{link_alt}]({badge_url})"
+
+            if link:
+                content = link_to_markdown(link, content, link_title)
 
-        # When working with rST, parse reference out-of-band using MyST.
-        if not isinstance(self.state, MockState):
-            return mw.render(content)
+            # When working with rST, parse reference out-of-band using MyST.
+            if not isinstance(self.state, MockState):
+                with phase("render snippet"):
+                    result = get_markdown_wrapper().render(content, document=self.state.document)
 
-        # Native MyST rendering.
-        return self.parse_nested(content)
+            # Native MyST rendering.
+            else:
+                result = self.parse_nested(content)
+
+        # Designate badges to be rendered locally when writing the output.
+        render_mode = getattr(self.config, "shield_render", "remote")
+        if render_mode != "remote" and can_render_badge(style=style, logo=logo):
+            badge = {"message": message, "label": label, "color": message_color, "label_color": label_color}
+            if style:
+                badge["style"] = style
+            for node in result:
+                for image in node.findall(nodes.image):
+                    image["shield"] = badge
+        return result
+
+    def build(
+        self, badge_url: str, link: t.Optional[str], link_title: str, link_alt: str
+    ) -> t.Optional[t.List[nodes.Element]]:
+        """
+        Build the nodes of the shield directly, like MyST would render them.
+
+        Only links to URLs and to local targets are supported. For all other
+        kinds of references, return `None`, to resolve them using MyST.
+        """
+        node: nodes.Element = nodes.image(uri=badge_url, alt=link_alt)
+        if link:
+            smartref = SmartReference(ref=link)
+            if smartref.is_url():
+                node = nodes.reference(
+                    "", "", node, refuri=get_markdown_wrapper().parser.normalizeLink(link), reftitle=link_title
+                )
+            else:
+                target = smartref.reference_to_myst()
+                if not target.startswith("#"):
+                    return None
+                # Resolved by MyST's `ResolveAnchorIds` transform, within MyST documents.
+                node = nodes.reference("", "", node, id_link=True, refuri=target, reftitle=link_title)
+        paragraph = nodes.paragraph("", "", node)
+        for element in paragraph.findall(nodes.Element):
+            self.set_source_info(element)
+        return [paragraph]
 
     def parse_nested(self, content: str):
         """
         When using MyST, parse reference within the same parsing context.
         """
         node_ = nodes.Element()
-        self.state.nested_parse(StringList(content.splitlines()), self.content_offset, node_)
+        with phase("nested_parse"):
+            self.state.nested_parse(StringList(content.splitlines()), self.content_offset, node_)
         return node_.children
 
 
@@ -124,3 +234,117 @@ def encode_shield_text(text: str):
     Double dash --	        Dash -
     """
     return urllib.parse.quote(text).replace("_", "__").replace("-", "--")
+
+
+def get_badges(env: BuildEnvironment) -> t.Dict[str, t.Dict[str, t.Dict[str, t.Any]]]:
+    """
+    Return the badges designated for the site-wide sprite, by document and identifier.
+    """
+    if not hasattr(env, "shield_badges"):
+        env.shield_badges = {}  # type: ignore[attr-defined]
+    return env.shield_badges  # type: ignore[attr-defined]
+
+
+def collect_badges(app: Sphinx, doctree: nodes.document):
+    """
+    Record the badges of a document, to be rendered into the site-wide sprite.
+    """
+    if app.config.shield_render != "sprite":
+        return
+    badges = {}
+    for node in doctree.findall(nodes.image):
+        badge = node.get("shield")
+        if badge:
+            badges[badge_id(badge)] = badge
+    all_badges = get_badges(app.env)
+    if badges:
+        all_badges[app.env.docname] = badges
+    else:
+        all_badges.pop(app.env.docname, None)
+
+
+def purge_badges(app: Sphinx, env: BuildEnvironment, docname: str):
+    get_badges(env).pop(docname, None)
+
+
+def merge_badges(app: Sphinx, env: BuildEnvironment, docnames: t.List[str], other: BuildEnvironment):
+    """
+    Accumulate badges recorded by parallel readers.
+    """
+    all_badges = get_badges(env)
+    other_badges = get_badges(other)
+    for docname in docnames:
+        if docname in other_badges:
+            all_badges[docname] = other_badges[docname]
+
+
+def write_sprite(app: Sphinx, env: BuildEnvironment):
+    """
+    Render all distinct badges of the site into one SVG sprite file.
+
+    The sprite is only rewritten when its content changes. Its digest is used
+    to version references, so browsers pick up changes despite caching.
+    """
+    if app.config.shield_render != "sprite" or app.builder.format != "html":
+        return []
+    badges: t.Dict[str, t.Dict[str, t.Any]] = {}
+    for document_badges in get_badges(env).values():
+        badges.update(document_badges)
+    sprite = render_badge_sprite(badges)
+    path = Path(app.outdir) / STATIC_PATH / SPRITE_FILENAME
+    write_file(path, sprite.encode("utf8"))
+    env.shield_sprite_version = content_digest(sprite)[:8]  # type: ignore[attr-defined]
+    env.shield_sprite_symbols = set(badges)  # type: ignore[attr-defined]
+    return []
+
+
+def render_local_badges(app: Sphinx, doctree: nodes.document, docname: str):
+    """
+    Render badges designated for local rendering, and refer to them.
+
+    With the `local` render mode, each distinct badge is written once into
+    the static directory of the HTML output, using a content-addressed file
+    name, and shared by all pages. With the `sprite` and `inline` modes, each
+    badge is replaced by an SVG element referring to a symbol, either within
+    the site-wide sprite file, or within a sprite embedded into the page.
+
+    Badges missing from the site-wide sprite, like shields of `hyper` links
+    whose deferred titles have been resolved after reading, are embedded.
+    """
+    html = app.builder.format == "html"
+    render_mode = app.config.shield_render
+    page_uri = app.builder.get_target_uri(docname)
+    inline_badges: t.Dict[str, t.Dict[str, t.Any]] = {}
+    sprite_symbols: t.Set[str] = getattr(app.env, "shield_sprite_symbols", set())
+    for node in list(doctree.findall(nodes.image)):
+        badge = node.attributes.pop("shield", None)
+        if not badge or not html:
+            continue
+        if render_mode in ("sprite", "inline"):
+            symbol_id = badge_id(badge)
+            if render_mode == "sprite" and symbol_id in sprite_symbols:
+                version = getattr(app.env, "shield_sprite_version", "")
+                href = relative_uri(page_uri, f"{STATIC_PATH}/{SPRITE_FILENAME}") + f"?v={version}#{symbol_id}"
+            else:
+                inline_badges[symbol_id] = badge
+                href = f"#{symbol_id}"
+            layout = layout_badge(**badge)
+            markup = render_badge_use(href, layout.width, node.get("alt") or layout.title)
+            node.replace_self(nodes.raw("", markup, format="html"))
+        else:
+            svg = render_badge_svg(**badge)
+            filename = badge_filename(svg)
+            write_badge(Path(app.outdir) / STATIC_PATH / filename, svg)
+            uri = relative_uri(page_uri, f"{STATIC_PATH}/{filename}")
+            node["uri"] = uri
+            node["candidates"] = {"?": uri}
+    if inline_badges:
+        doctree.insert(0, nodes.raw("", render_badge_sprite(inline_badges, hidden=True), format="html"))
+
+
+def write_badge(path: Path, svg: str) -> None:
+    """
+    Write a badge file once.
+    """
+    if not path.exists():
+        write_file(path, svg.encode("utf8"))
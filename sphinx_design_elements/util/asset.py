@@ -0,0 +1,141 @@
+import gzip
+import json
+import os
+import re
+import tempfile
+import typing as t
+from importlib.resources import files
+from pathlib import Path
+
+from sphinx_design_elements import __version__
+from sphinx_design_elements import compiled as static_module
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# The static directory within the output directory.
+STATIC_PATH = "_sphinx_design_elements_static"
+
+# Records which assets have been written, by package version. It is stored
+# outside of the static directory, so it will not be published.
+MANIFEST_FILENAME = "design-elements.manifest.json"
+
+
+def minify_css(content: str) -> str:
+    """
+    Minify a stylesheet, by removing comments and insignificant whitespace.
+    """
+    content = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
+    content = re.sub(r"\s+", " ", content)
+    content = re.sub(r"\s*([{};,>])\s*", r"\1", content)
+    content = re.sub(r":\s+", ":", content)
+    return content.replace(";}", "}").strip()
+
+
+def minify_js(content: str) -> str:
+    """
+    Minify a script conservatively, by removing comment lines, indentation,
+    and blank lines. Line breaks are retained, because statements may rely
+    on automatic semicolon insertion.
+    """
+    lines = []
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not line.startswith("//"):
+            lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+MINIFIERS: t.Dict[str, t.Callable[[str], str]] = {
+    "css": minify_css,
+    "js": minify_js,
+}
+
+
+def asset_filename(filename: str) -> str:
+    """
+    Compute the file name of an asset within the build directory.
+    """
+    extension = Path(filename).suffix.lstrip(".")
+    if extension not in MINIFIERS:
+        raise ValueError(f"Unable to add asset file, unknown extension: {filename}")
+    return f"design-elements.{extension}"
+
+
+def compress(content: bytes) -> t.Dict[str, bytes]:
+    """
+    Compress content for serving it precompressed, by file name suffix.
+    Brotli is only used when the `brotli` package is installed.
+    """
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content)
+    return variants
+
+
+def build_asset(filename: str) -> bytes:
+    """
+    Read and minify an asset file of the `compiled` package.
+    """
+    content = files(static_module).joinpath(filename).read_text(encoding="utf8")
+    extension = Path(filename).suffix.lstrip(".")
+    return MINIFIERS[extension](content).encode("utf8")
+
+
+def source_signature(filenames: t.Iterable[str]) -> t.List[t.List[t.Any]]:
+    """
+    Identify the source files by size and modification time, which is cheap,
+    and picks up changes in development, where the version stays the same.
+    """
+    signature = []
+    for filename in filenames:
+        stat = os.stat(str(files(static_module).joinpath(filename)))
+        signature.append([filename, stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def write_assets(static_path: Path, filenames: t.Sequence[str], manifest_path: Path) -> t.List[str]:
+    """
+    Write minified asset files and their precompressed siblings, and return
+    their file names.
+
+    The written files are recorded in a manifest, so assets are only built
+    once per package version, and not on each build.
+    """
+    key = {"version": __version__, "sources": source_signature(filenames), "brotli": brotli is not None}
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf8"))
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("key") == key and all((static_path / name).exists() for name in manifest.get("assets", [])):
+        return manifest["assets"]
+
+    names = []
+    for filename in filenames:
+        name = asset_filename(filename)
+        content = build_asset(filename)
+        write_file(static_path / name, content)
+        for suffix, compressed in compress(content).items():
+            write_file(static_path / f"{name}{suffix}", compressed)
+        names.append(name)
+    write_file(manifest_path, json.dumps({"key": key, "assets": names}, indent=2).encode("utf8"))
+    return names
+
+
+def write_file(path: Path, content: bytes) -> None:
+    """
+    Write a file atomically, when its content changed, retaining its modification time otherwise.
+
+    Parallel writers may race, so the content is written to a temporary file
+    first, which is readable by web servers, like other static files.
+    """
+    if path.exists() and path.read_bytes() == content:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(descriptor, "wb") as f:
+        f.write(content)
+    os.chmod(temporary, 0o644)
+    os.replace(temporary, path)
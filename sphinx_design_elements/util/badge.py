@@ -0,0 +1,307 @@
+"""
+Render static badges as SVG, locally, like https://shields.io does.
+
+Text is measured using precomputed advance widths of the Verdana font at
+11px, the font shields.io uses for laying out badges.
+"""
+
+import hashlib
+import math
+import re
+import typing as t
+from functools import lru_cache
+from html import escape
+
+# Advance widths of printable ASCII characters, Verdana, 11px.
+VERDANA_11_WIDTHS: t.Dict[str, float] = dict(
+    zip(
+        " !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~",
+        map(
+            float,
+            (
+                "3.87 4.33 5.05 9.0 7.0 11.84 7.99 2.95 4.99 4.99 7.0 9.0 4.0 4.99 4.0 4.99 "
+                "7.0 7.0 7.0 7.0 7.0 7.0 7.0 7.0 7.0 7.0 4.99 4.99 9.0 9.0 9.0 6.0 11.0 "
+                "7.52 7.54 7.68 8.48 6.96 6.32 8.53 8.27 4.63 5.0 7.62 6.12 9.27 "
+                "8.23 8.66 6.63 8.66 7.65 7.52 6.78 8.05 7.52 10.88 7.54 6.77 7.54 "
+                "4.99 4.99 4.99 9.0 7.0 7.0 "
+                "6.61 6.85 5.73 6.85 6.55 3.87 6.85 6.96 3.02 3.79 6.51 3.02 10.7 "
+                "6.96 6.68 6.85 6.85 4.69 5.73 4.33 6.96 6.51 8.98 6.51 6.51 5.78 "
+                "6.98 4.99 6.98 9.0"
+            ).split(),
+        ),
+    )
+)
+
+# Fallback widths for characters not in the table.
+DEFAULT_WIDTH = 7.0
+WIDE_WIDTH = 11.0
+
+# Named colors of shields.io.
+SHIELDS_COLORS = {
+    "brightgreen": "#4c1",
+    "green": "#97ca00",
+    "yellow": "#dfb317",
+    "yellowgreen": "#a4a61d",
+    "orange": "#fe7d37",
+    "red": "#e05d44",
+    "blue": "#007ec6",
+    "grey": "#555",
+    "gray": "#555",
+    "lightgrey": "#9f9f9f",
+    "lightgray": "#9f9f9f",
+    "critical": "#e05d44",
+    "important": "#fe7d37",
+    "success": "#4c1",
+    "informational": "#007ec6",
+    "inactive": "#9f9f9f",
+}
+
+# CSS named colors, which shields.io accepts, too.
+CSS_COLORS = dict(
+    item.split(":")
+    for item in (
+        "aliceblue:f0f8ff antiquewhite:faebd7 aqua:00ffff aquamarine:7fffd4 azure:f0ffff beige:f5f5dc "
+        "bisque:ffe4c4 black:000000 blanchedalmond:ffebcd blueviolet:8a2be2 brown:a52a2a "
+        "burlywood:deb887 cadetblue:5f9ea0 chartreuse:7fff00 chocolate:d2691e coral:ff7f50 "
+        "cornflowerblue:6495ed cornsilk:fff8dc crimson:dc143c cyan:00ffff darkblue:00008b "
+        "darkcyan:008b8b darkgoldenrod:b8860b darkgray:a9a9a9 darkgreen:006400 darkgrey:a9a9a9 "
+        "darkkhaki:bdb76b darkmagenta:8b008b darkolivegreen:556b2f darkorange:ff8c00 darkorchid:9932cc "
+        "darkred:8b0000 darksalmon:e9967a darkseagreen:8fbc8f darkslateblue:483d8b darkslategray:2f4f4f "
+        "darkslategrey:2f4f4f darkturquoise:00ced1 darkviolet:9400d3 deeppink:ff1493 deepskyblue:00bfff "
+        "dimgray:696969 dimgrey:696969 dodgerblue:1e90ff firebrick:b22222 floralwhite:fffaf0 "
+        "forestgreen:228b22 fuchsia:ff00ff gainsboro:dcdcdc ghostwhite:f8f8ff gold:ffd700 "
+        "goldenrod:daa520 greenyellow:adff2f honeydew:f0fff0 hotpink:ff69b4 indianred:cd5c5c "
+        "indigo:4b0082 ivory:fffff0 khaki:f0e68c lavender:e6e6fa lavenderblush:fff0f5 lawngreen:7cfc00 "
+        "lemonchiffon:fffacd lightblue:add8e6 lightcoral:f08080 lightcyan:e0ffff "
+        "lightgoldenrodyellow:fafad2 lightgreen:90ee90 lightpink:ffb6c1 lightsalmon:ffa07a "
+        "lightseagreen:20b2aa lightskyblue:87cefa lightslategray:778899 lightslategrey:778899 "
+        "lightsteelblue:b0c4de lightyellow:ffffe0 lime:00ff00 limegreen:32cd32 linen:faf0e6 "
+        "magenta:ff00ff maroon:800000 mediumaquamarine:66cdaa mediumblue:0000cd mediumorchid:ba55d3 "
+        "mediumpurple:9370db mediumseagreen:3cb371 mediumslateblue:7b68ee mediumspringgreen:00fa9a "
+        "mediumturquoise:48d1cc mediumvioletred:c71585 midnightblue:191970 mintcream:f5fffa "
+        "mistyrose:ffe4e1 moccasin:ffe4b5 navajowhite:ffdead navy:000080 oldlace:fdf5e6 olive:808000 "
+        "olivedrab:6b8e23 orangered:ff4500 orchid:da70d6 palegoldenrod:eee8aa palegreen:98fb98 "
+        "paleturquoise:afeeee palevioletred:db7093 papayawhip:ffefd5 peachpuff:ffdab9 peru:cd853f "
+        "pink:ffc0cb plum:dda0dd powderblue:b0e0e6 purple:800080 rebeccapurple:663399 "
+        "rosybrown:bc8f8f royalblue:4169e1 saddlebrown:8b4513 salmon:fa8072 sandybrown:f4a460 "
+        "seagreen:2e8b57 seashell:fff5ee sienna:a0522d silver:c0c0c0 skyblue:87ceeb slateblue:6a5acd "
+        "slategray:708090 slategrey:708090 snow:fffafa springgreen:00ff7f steelblue:4682b4 tan:d2b48c "
+        "teal:008080 thistle:d8bfd8 tomato:ff6347 turquoise:40e0d0 violet:ee82ee wheat:f5deb3 "
+        "white:ffffff whitesmoke:f5f5f5"
+    ).split()
+)
+
+hex_color_re = re.compile(r"^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+function_color_re = re.compile(r"^(?:rgba?|hsla?)\([\d\s.,%]+\)$")
+
+# Styles which can be rendered locally. Others are delegated to shields.io.
+LOCAL_STYLES = ("flat", "flat-square")
+
+
+def text_width(text: str) -> float:
+    """
+    Compute the width of text in pixels, when rendered using Verdana at 11px.
+    """
+    width = 0.0
+    for char in text:
+        advance = VERDANA_11_WIDTHS.get(char)
+        if advance is None:
+            advance = WIDE_WIDTH if ord(char) >= 0x2E80 else DEFAULT_WIDTH
+        width += advance
+    return round(width, 1)
+
+
+def resolve_color(value: t.Optional[str], default: str) -> str:
+    """
+    Resolve a shields.io color value into a CSS color.
+    """
+    if not value:
+        return default
+    value = value.strip().lower()
+    if value in SHIELDS_COLORS:
+        return SHIELDS_COLORS[value]
+    matched = hex_color_re.match(value)
+    if matched:
+        return "#" + matched.group(1)
+    if value in CSS_COLORS or function_color_re.match(value):
+        return value
+    return default
+
+
+def brightness(color: str) -> float:
+    """
+    Compute the perceived brightness of a color, between 0 and 1.
+    """
+    value = SHIELDS_COLORS.get(color) or CSS_COLORS.get(color) or color
+    matched = hex_color_re.match(value)
+    if not matched:
+        return 0.0
+    digits = matched.group(1)
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    red, green, blue = (int(digits[index : index + 2], 16) for index in (0, 2, 4))
+    return (red * 299 + green * 587 + blue * 114) / 255000
+
+
+def text_colors(background: str) -> t.Tuple[str, str]:
+    """
+    Return text and shadow colors for readable text on a background color.
+    """
+    if brightness(background) >= 0.69:
+        return "#333", "#ccc"
+    return "#fff", "#010101"
+
+
+def can_render_badge(style: t.Optional[str] = None, logo: t.Optional[str] = None) -> bool:
+    """
+    Whether a badge can be rendered locally. Logos are only available from shields.io.
+    """
+    return (style or "flat") in LOCAL_STYLES and not logo
+
+
+class BadgeLayout(t.NamedTuple):
+    width: int
+    title: str
+    body: str
+
+
+@lru_cache(maxsize=1024)
+def layout_badge(
+    message: str,
+    label: t.Optional[str] = None,
+    color: t.Optional[str] = None,
+    label_color: t.Optional[str] = None,
+    style: t.Optional[str] = None,
+    id_prefix: str = "",
+) -> BadgeLayout:
+    """
+    Lay out a static badge, using the `flat` or `flat-square` style.
+
+    Return its width, its title, and the SVG markup of its content. Element
+    identifiers are prefixed by `id_prefix`, so multiple badges can be
+    embedded into the same document.
+    """
+    style = style or "flat"
+    if style not in LOCAL_STYLES:
+        raise ValueError(f"Badge style can not be rendered locally: {style}")
+    message_color = resolve_color(color, "#007ec6")
+    label_color = resolve_color(label_color, "#555")
+
+    label_text_width = text_width(label) if label else 0.0
+    message_text_width = text_width(message)
+    label_width = math.ceil(label_text_width + 10) if label else 0
+    message_width = math.ceil(message_text_width + 10)
+    width = label_width + message_width
+    title = f"{label}: {message}" if label else message
+
+    flat = style == "flat"
+    parts = []
+    if flat:
+        parts.append(
+            f'<linearGradient id="{id_prefix}s" x2="0" y2="100%">'
+            '<stop offset="0" stop-color="#bbb" stop-opacity=".1"/><stop offset="1" stop-opacity=".1"/>'
+            "</linearGradient>"
+        )
+        parts.append(f'<clipPath id="{id_prefix}r"><rect width="{width}" height="20" rx="3" fill="#fff"/></clipPath>')
+        parts.append(f'<g clip-path="url(#{id_prefix}r)">')
+    else:
+        parts.append('<g shape-rendering="crispEdges">')
+    if label:
+        parts.append(f'<rect width="{label_width}" height="20" fill="{escape(label_color)}"/>')
+    parts.append(f'<rect x="{label_width}" width="{message_width}" height="20" fill="{escape(message_color)}"/>')
+    if flat:
+        parts.append(f'<rect width="{width}" height="20" fill="url(#{id_prefix}s)"/>')
+    parts.append("</g>")
+    parts.append(
+        '<g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" '
+        'text-rendering="geometricPrecision" font-size="110">'
+    )
+    if label:
+        parts += render_text(label, label_width / 2, label_text_width, label_color, shadow=flat)
+    parts += render_text(message, label_width + message_width / 2, message_text_width, message_color, shadow=flat)
+    parts.append("</g>")
+    return BadgeLayout(width=width, title=title, body="".join(parts))
+
+
+def render_badge_svg(
+    message: str,
+    label: t.Optional[str] = None,
+    color: t.Optional[str] = None,
+    label_color: t.Optional[str] = None,
+    style: t.Optional[str] = None,
+) -> str:
+    """
+    Render a static badge as a standalone SVG document.
+    """
+    layout = layout_badge(message, label=label, color=color, label_color=label_color, style=style)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{layout.width}" height="20" role="img" '
+        f'aria-label="{escape(layout.title)}"><title>{escape(layout.title)}</title>{layout.body}</svg>'
+    )
+
+
+def render_badge_symbol(symbol_id: str, badge: t.Dict[str, t.Any]) -> t.Tuple[int, str]:
+    """
+    Render a static badge as an SVG `<symbol>` element, and return its width, too.
+    """
+    layout = layout_badge(**badge, id_prefix=f"{symbol_id}-")
+    return layout.width, f'<symbol id="{symbol_id}" viewBox="0 0 {layout.width} 20">{layout.body}</symbol>'
+
+
+def render_badge_sprite(badges: t.Dict[str, t.Dict[str, t.Any]], hidden: bool = False) -> str:
+    """
+    Render multiple badges into an SVG sprite, using one `<symbol>` per badge,
+    which can be referenced by `<use href="sprite.svg#symbol-id">` elements.
+
+    When embedding the sprite into an HTML document, use `hidden`.
+    """
+    attributes = ' width="0" height="0" style="position: absolute" aria-hidden="true"' if hidden else ""
+    symbols = "".join(render_badge_symbol(symbol_id, badges[symbol_id])[1] for symbol_id in sorted(badges))
+    return f'<svg xmlns="http://www.w3.org/2000/svg"{attributes}>{symbols}</svg>'
+
+
+def render_badge_use(href: str, width: int, title: str) -> str:
+    """
+    Render an HTML element displaying a badge from an SVG sprite.
+    """
+    return (
+        f'<svg class="sd-shield" xmlns="http://www.w3.org/2000/svg" width="{width}" height="20" '
+        f'role="img" aria-label="{escape(title)}"><title>{escape(title)}</title>'
+        f'<use href="{escape(href)}"/></svg>'
+    )
+
+
+def render_text(text: str, center: float, width: float, background: str, shadow: bool) -> t.List[str]:
+    """
+    Render text centered within a badge section, scaled by 10 for precision.
+    """
+    fill, shadow_fill = text_colors(background)
+    x = round(center * 10)
+    length = round(width * 10)
+    content = escape(text, quote=False)
+    parts = []
+    if shadow:
+        parts.append(
+            f'<text aria-hidden="true" x="{x}" y="150" fill="{shadow_fill}" fill-opacity=".3" '
+            f'transform="scale(.1)" textLength="{length}">{content}</text>'
+        )
+    parts.append(f'<text x="{x}" y="140" transform="scale(.1)" fill="{fill}" textLength="{length}">{content}</text>')
+    return parts
+
+
+def content_digest(content: str) -> str:
+    return hashlib.md5(content.encode("utf8")).hexdigest()  # noqa: S324
+
+
+def badge_filename(svg: str) -> str:
+    """
+    Compute a content-addressed file name for a badge.
+    """
+    return f"shield.{content_digest(svg)}.svg"
+
+
+def badge_id(badge: t.Dict[str, t.Any]) -> str:
+    """
+    Compute a content-addressed element identifier for a badge.
+    """
+    return f"shield-{content_digest(render_badge_svg(**badge))[:16]}"
@@ -0,0 +1,208 @@
+import typing as t
+from collections import OrderedDict
+
+from docutils import nodes
+from sphinx import addnodes
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+CacheKey = t.Tuple[t.Hashable, ...]
+
+ElementT = t.TypeVar("ElementT", bound=nodes.Element)
+
+
+class NodeCache:
+    """
+    A size-limited LRU cache for node subtrees rendered by roles and directives,
+    so repeated invocations with the same input are only rendered once.
+
+    Subtrees which refer to the current document, like `pending_xref` nodes,
+    are cached per document, all others are shared across documents. Subtrees
+    carrying system messages or element identifiers are not cached.
+
+    Hits return a deep copy of the cached nodes, with their source information
+    updated to the location of the invocation.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.entries: t.OrderedDict[CacheKey, t.List[nodes.Node]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        # Only the counters are worth transferring from parallel readers.
+        state = self.__dict__.copy()
+        state["entries"] = OrderedDict()
+        return state
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(
+        self, key: CacheKey, docname: str, source: t.Any = None, line: t.Optional[int] = None
+    ) -> t.Optional[t.List[nodes.Node]]:
+        """
+        Return a copy of the cached nodes, or `None`.
+        """
+        if self.maxsize <= 0:
+            return None
+        for entry_key in ((*key, None), (*key, docname)):
+            cached = self.entries.get(entry_key)
+            if cached is not None:
+                self.entries.move_to_end(entry_key)
+                self.hits += 1
+                return [self.copy(node, source, line) for node in cached]
+        self.misses += 1
+        return None
+
+    def set(self, key: CacheKey, docname: str, result: t.Sequence[nodes.Node]) -> None:
+        """
+        Store nodes into the cache, when they can be reused.
+        """
+        if self.maxsize <= 0 or not result or not all(self.is_cacheable(node) for node in result):
+            return
+        scope = docname if any(self.is_document_specific(node) for node in result) else None
+        entry_key = (*key, scope)
+        self.entries[entry_key] = [node.deepcopy() for node in result]
+        self.entries.move_to_end(entry_key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def update(self, other: "NodeCache") -> None:
+        """
+        Accumulate the counters of another cache, for example from a parallel reader.
+        """
+        self.hits += other.hits
+        self.misses += other.misses
+
+    def stats(self) -> t.Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "maxsize": self.maxsize}
+
+    @staticmethod
+    def copy(node: nodes.Node, source: t.Any, line: t.Optional[int]) -> nodes.Node:
+        node = node.deepcopy()
+        if source is not None or line is not None:
+            for descendant in node.findall():
+                if descendant.source is not None or descendant.line is not None:
+                    descendant.source, descendant.line = source, line
+        return node
+
+    @staticmethod
+    def is_cacheable(node: nodes.Node) -> bool:
+        for descendant in node.findall(nodes.Element):
+            if isinstance(descendant, (nodes.system_message, nodes.problematic)) or descendant["ids"]:
+                return False
+        return True
+
+    @staticmethod
+    def is_document_specific(node: nodes.Node) -> bool:
+        for descendant in node.findall(nodes.Element):
+            if isinstance(descendant, addnodes.pending_xref) or "refdoc" in descendant.attributes:
+                return True
+        return False
+
+
+class PrototypeCache:
+    """
+    A size-limited LRU cache of wrapper node skeletons, like grid and card
+    components, keyed by the signature of the options they are created from.
+
+    Directives clone a prototype and attach their content, instead of creating
+    the same components, and computing their class lists, over and over again.
+    Prototypes are detached from the document they have been created in, so
+    they can be shared across documents.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.entries: t.OrderedDict[CacheKey, nodes.Element] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clone(self, key: CacheKey, factory: t.Callable[[], ElementT]) -> ElementT:
+        """
+        Return a copy of the prototype for the given key, creating it on demand.
+        """
+        if self.maxsize <= 0:
+            return factory()
+        prototype = self.entries.get(key)
+        if prototype is None:
+            self.misses += 1
+            prototype = factory()
+            for node in prototype.findall():
+                node.document = None  # type: ignore[assignment]
+            self.entries[key] = prototype
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return t.cast("ElementT", prototype.deepcopy())
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> t.Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "maxsize": self.maxsize}
+
+
+def freeze(options: t.Mapping[str, t.Any]) -> CacheKey:
+    """
+    Compute a hashable signature of directive options.
+    """
+    return tuple(sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in options.items()))
+
+
+# Prototypes only depend on options, so they are shared by all documents.
+prototypes = PrototypeCache()
+
+
+def setup_node_cache(app: Sphinx):
+    """
+    Set up caching nodes rendered by roles and directives while reading documents.
+    """
+    app.add_config_value("design_elements_node_cache_size", 1024, "", types=[int])
+    app.connect("env-before-read-docs", reset_node_cache)
+    app.connect("env-merge-info", merge_node_cache)
+    app.connect("build-finished", report_node_cache)
+
+
+def get_node_cache(env: BuildEnvironment) -> t.Optional[NodeCache]:
+    """
+    Return the node cache, if the extension has been set up completely.
+    """
+    return getattr(env, "design_elements_node_cache", None)
+
+
+def reset_node_cache(app: Sphinx, env: BuildEnvironment, docnames: t.List[str]):
+    """
+    Start with an empty node cache when reading documents.
+    """
+    env.design_elements_node_cache = NodeCache(  # type: ignore[attr-defined]
+        maxsize=app.config.design_elements_node_cache_size
+    )
+
+
+def merge_node_cache(app: Sphinx, env: BuildEnvironment, docnames: t.List[str], other: BuildEnvironment):
+    """
+    Accumulate node cache counters of parallel readers.
+    """
+    cache = get_node_cache(env)
+    other_cache = get_node_cache(other)
+    if cache is not None and other_cache is not None:
+        cache.update(other_cache)
+
+
+def report_node_cache(app: Sphinx, exception: t.Optional[Exception]):
+    cache = get_node_cache(app.env)
+    if cache is not None and (cache.hits or cache.misses):
+        logger.verbose(f"node cache: {cache.hits} hits, {cache.misses} misses")
@@ -0,0 +1,134 @@
+import csv
+import json
+import typing as t
+from pathlib import Path
+
+import yaml
+
+Row = t.List[str]
+
+# Use the LibYAML loader when available, which is an order of magnitude faster.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def read_table_data(path: Path, columns: t.Optional[t.List[str]] = None) -> t.Iterator[Row]:
+    """
+    Read tabular data from a CSV, JSON Lines, JSON, or YAML file, row by row.
+
+    The first row yielded is the header, holding the column names. CSV and
+    JSON Lines files are streamed. JSON and YAML files are read at once.
+
+    Records can either be mappings, or sequences. When using sequences, the
+    first record is the header. Optionally, select and order the columns.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        records = read_csv(path)
+    elif suffix == ".jsonl":
+        records = read_jsonl(path)
+    elif suffix == ".json":
+        records = iter(read_document(path, json.loads))
+    elif suffix in (".yaml", ".yml"):
+        records = iter(read_document(path, load_yaml))
+    else:
+        raise ValueError(f"Unknown table data format: {path.suffix}")
+    return tabulate(records, columns)
+
+
+def read_records(path: Path) -> t.Iterator[t.Dict[str, t.Any]]:
+    """
+    Read records from a JSON Lines, JSON, or YAML file, one by one.
+    Each record must be a mapping.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".jsonl":
+        records = read_jsonl(path)
+    elif suffix == ".json":
+        records = iter(read_document(path, json.loads))
+    elif suffix in (".yaml", ".yml"):
+        records = iter(read_document(path, load_yaml))
+    else:
+        raise ValueError(f"Unknown record data format: {path.suffix}")
+    for number, record in enumerate(records, start=1):
+        if not isinstance(record, dict):
+            raise ValueError(f"Record {number} must be a mapping: {record!r}")
+        yield record
+
+
+def load_yaml(content: str) -> t.Any:
+    return yaml.load(content, Loader=YamlLoader)  # noqa: S506
+
+
+def read_csv(path: Path) -> t.Iterator[t.Any]:
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        yield from csv.reader(f)
+
+
+def read_jsonl(path: Path) -> t.Iterator[t.Any]:
+    with path.open(encoding="utf8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as ex:
+                raise ValueError(f"Line {number}: {ex}") from ex
+
+
+def read_document(path: Path, loader: t.Callable[[str], t.Any]) -> t.List[t.Any]:
+    data = loader(path.read_text(encoding="utf8"))
+    if data is None:
+        return []
+    if not isinstance(data, list):
+        raise ValueError("Table data must be a list of records")
+    return data
+
+
+def tabulate(records: t.Iterator[t.Any], columns: t.Optional[t.List[str]] = None) -> t.Iterator[Row]:
+    """
+    Convert records into rows of text, starting with the header.
+    """
+    first = next(records, None)
+    if first is None:
+        return
+    if isinstance(first, dict):
+        header = columns or [str(key) for key in first]
+        records = prepend(first, records)
+    else:
+        header = cells(first)
+    indexes = None
+    if columns and not isinstance(first, dict):
+        missing = [column for column in columns if column not in header]
+        if missing:
+            raise ValueError(f"Unknown columns: {', '.join(missing)}")
+        indexes = [header.index(column) for column in columns]
+        header = list(columns)
+    yield header
+
+    for record in records:
+        if isinstance(record, dict):
+            yield [cell(record.get(column)) for column in header]
+        else:
+            row = cells(record)
+            if indexes is not None:
+                row = [row[index] if index < len(row) else "" for index in indexes]
+            yield row
+
+
+def prepend(first: t.Any, records: t.Iterator[t.Any]) -> t.Iterator[t.Any]:
+    yield first
+    yield from records
+
+
+def cells(record: t.Any) -> Row:
+    if not isinstance(record, (list, tuple)):
+        raise ValueError(f"Table record must be a mapping or a sequence: {record!r}")
+    return [cell(value) for value in record]
+
+
+def cell(value: t.Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
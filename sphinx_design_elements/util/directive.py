@@ -1,11 +1,57 @@
+import threading
 import typing as t
-from unittest.mock import patch
+import weakref
+from functools import lru_cache
 
 from docutils import nodes
+from markdown_it.tree import SyntaxTreeNode
 from myst_parser.config.main import MdParserConfig
-from myst_parser.mdit_to_docutils.base import REGEX_SCHEME
+from myst_parser.mdit_to_docutils.base import REGEX_SCHEME, DocutilsRenderer, make_document
 from myst_parser.mdit_to_docutils.sphinx_ import SphinxRenderer
 from myst_parser.parsers.mdit import create_md_parser
+from sphinx.environment import BuildEnvironment
+
+
+class FragmentRenderer(SphinxRenderer):
+    """
+    A MyST renderer for fragments, which also works without a Sphinx environment.
+
+    Without an environment, links are rendered like the docutils renderer does.
+
+    Setting up rendering is expensive, so it is only done once per document.
+    Subsequent fragments of the same document only update the node to render
+    into, and the markdown-it environment.
+    """
+
+    document_ref: t.Optional["weakref.ref[nodes.document]"] = None
+
+    def setup_render(self, options: t.Dict[str, t.Any], env: t.MutableMapping[str, t.Any]) -> None:
+        document = options["document"]
+        if self.document_ref is None or self.document_ref() is not document:
+            super().setup_render(options, env)
+            self.document_ref = weakref.ref(document)
+        self.md_env = env
+        self.md_options = options
+        self.current_node = options["current_node"]
+
+    @property
+    def sphinx_env(self) -> t.Optional[BuildEnvironment]:  # type: ignore[override]
+        return getattr(self.document.settings, "env", None)
+
+    def render_link_project(self, token: SyntaxTreeNode) -> None:
+        if self.sphinx_env is None:
+            return DocutilsRenderer.render_link_project(self, token)
+        return super().render_link_project(token)
+
+    def render_link_path(self, token: SyntaxTreeNode) -> None:
+        if self.sphinx_env is None:
+            return DocutilsRenderer.render_link_path(self, token)
+        return super().render_link_path(token)
+
+    def render_link_unknown(self, token: SyntaxTreeNode) -> None:
+        if self.sphinx_env is None:
+            return DocutilsRenderer.render_link_unknown(self, token)
+        return super().render_link_unknown(token)
 
 
 class MarkdownWrapper:
@@ -18,30 +64,53 @@ class MarkdownWrapper:
     Details: For example, `shield` / `hyper` machineries are heavily based on
     Markdown for sub-element rendering, so they need the MyST machinery when
     invoked from reStructuredText.
+
+    The parser is created once, and reused for all fragments. Rendering is
+    serialized, because the renderer keeps its state per render.
     """
 
     def __init__(self):
         self.config = MdParserConfig()
         self.config.suppress_warnings = []
-        self.parser = create_md_parser(self.config, SphinxRenderer)
-
-    def render(self, content: str) -> t.List[nodes.Element]:
+        self.parser = create_md_parser(self.config, FragmentRenderer)
+        # Fragments do not contribute to the word count of their document.
+        self.parser.disable("wordcount", ignoreInvalid=True)
+        self.lock = threading.Lock()
+        # Used for rendering fragments outside of documents.
+        self.document: t.Optional[nodes.document] = None
+
+    def render(self, content: str, document: t.Optional[nodes.document] = None) -> t.List[nodes.Element]:
         """
         Render a Markdown expression / markup.
-        """
-        with self.renderer_patch():
-            res = self.parser.render(content)
-            return res.children
 
-    def renderer_patch(self):
+        When rendering within a document, references are resolved using its
+        Sphinx environment. The nodes are not added to the document.
         """
-        Because the Sphinx MyST renderer has not been initialized fully, work around it.
-        """
-        return patch("myst_parser.mdit_to_docutils.sphinx_.SphinxRenderer.__getattr__")
-
-
-# A global instance, so it does not need to be created per element.
-mw = MarkdownWrapper()
+        if document is None:
+            if self.document is None:
+                self.document = make_document()
+            document = self.document
+        # Documents not parsed by MyST miss its settings.
+        if getattr(document.settings, "myst_suppress_warnings", None) is None:
+            document.settings.myst_suppress_warnings = self.config.suppress_warnings
+        container = nodes.Element()
+        with self.lock:
+            self.parser.options["document"] = document
+            self.parser.options["current_node"] = container
+            try:
+                self.parser.render(content)
+            finally:
+                del self.parser.options["document"]
+                del self.parser.options["current_node"]
+        return t.cast("t.List[nodes.Element]", container.children)
+
+
+@lru_cache(maxsize=None)
+def get_markdown_wrapper() -> MarkdownWrapper:
+    """
+    Return the shared Markdown wrapper, creating it on first use.
+    """
+    return MarkdownWrapper()
 
 
 class SmartReference:
@@ -66,7 +135,7 @@ class SmartReference:
         """
         scheme_match = REGEX_SCHEME.match(self.ref)
         scheme = None if scheme_match is None else scheme_match.group(1)
-        if scheme in mw.config.url_schemes:
+        if scheme in get_markdown_wrapper().config.url_schemes:
             return True
         return False
 
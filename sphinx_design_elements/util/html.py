@@ -0,0 +1,103 @@
+import codecs
+import re
+import typing as t
+from html.parser import HTMLParser
+
+# Markers after which the `<title>` element of an HTML document can no longer appear.
+head_end_re = re.compile(rb"</title\s*>|</head\s*>|<body[\s>]", re.IGNORECASE)
+
+# `<meta charset="...">` or `<meta http-equiv="Content-Type" content="text/html; charset=...">`.
+meta_charset_re = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
+
+
+class TitleParser(HTMLParser):
+    """
+    Collect the text of the `<title>` element within the `<head>` of an HTML document.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.in_title = False
+        self.finished = False
+        self.fragments: t.List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: t.List[t.Tuple[str, t.Optional[str]]]) -> None:
+        if self.finished:
+            return
+        if tag == "title":
+            self.in_title = True
+        elif tag == "body":
+            self.finished = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ("title", "head"):
+            self.in_title = False
+            self.finished = True
+
+    def handle_data(self, data: str) -> None:
+        if self.in_title and not self.finished:
+            self.fragments.append(data)
+
+    @property
+    def title(self) -> t.Optional[str]:
+        if not self.fragments:
+            return None
+        return "".join(self.fragments)
+
+
+def sniff_charset(head: bytes, charset: t.Optional[str] = None) -> str:
+    """
+    Determine the character set of an HTML document.
+
+    Precedence: Explicit charset, e.g. from the `Content-Type` HTTP header,
+    then `<meta>` elements, then UTF-8.
+    """
+    if not charset:
+        matched = meta_charset_re.search(head)
+        if matched:
+            charset = matched.group(1).decode("ascii", errors="ignore")
+    try:
+        return codecs.lookup(charset or "utf-8").name
+    except LookupError:
+        return "utf-8"
+
+
+def read_html_title(
+    stream: t.BinaryIO, charset: t.Optional[str] = None, chunk_size: int = 8192, max_bytes: int = 1024 * 1024
+) -> t.Tuple[t.Optional[str], bytes]:
+    """
+    Extract the text of the `<title>` element from an HTML document, streaming.
+
+    The document is read in chunks, only until the end of the `<title>` or
+    `<head>` element has been seen, or up to `max_bytes`.
+
+    Return the title and the bytes consumed from the stream. The title is an empty
+    string when the document has no title, or `None` when it could not be
+    determined within the consumed bytes.
+    """
+    buffer = b""
+    end = None
+    complete = False
+    while len(buffer) < max_bytes:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            complete = True
+            break
+        # Search from a little before the new chunk, in case a marker spans chunks.
+        start = max(0, len(buffer) - 16)
+        buffer += chunk
+        matched = head_end_re.search(buffer, start)
+        if matched:
+            end = matched.end()
+            complete = True
+            break
+
+    # Only parse the document up to the marker.
+    head = buffer[:end]
+    parser = TitleParser()
+    parser.feed(head.decode(sniff_charset(head, charset), errors="replace"))
+    parser.close()
+    title = parser.title if parser.finished or complete else None
+    if title is None and complete:
+        title = ""
+    return title, buffer
@@ -0,0 +1,278 @@
+import functools
+import http.client
+import os
+import ssl
+import threading
+import typing as t
+import zlib
+from collections import defaultdict
+from email.message import Message
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass, urlopen
+
+from sphinx_design_elements import __version__
+
+USER_AGENT = f"sphinx-design-elements/{__version__}"
+
+ConnectionKey = t.Tuple[str, str, int]
+
+
+class HttpResponse:
+    """
+    A response from an HTTP transport, offering a streaming interface to its body.
+
+    The body is transparently decompressed, when the server responded using
+    `gzip` or `deflate` content encoding.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: Message,
+        stream: t.Any,
+        release: t.Optional[t.Callable[[], None]] = None,
+    ):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.stream = stream
+        self.release = release
+        self.decompressor: t.Optional[t.Any] = None
+        self.buffer = b""
+        encoding = (headers.get("Content-Encoding") or "").strip().lower()
+        if encoding in ("gzip", "x-gzip", "deflate"):
+            # Automatically detect gzip or zlib headers.
+            self.decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read and decode up to `size` bytes of the response body, or all of it.
+        """
+        if self.decompressor is None:
+            return self.stream.read() if size < 0 else self.stream.read(size)
+        if size < 0:
+            data = self.buffer + self.decompressor.decompress(self.stream.read()) + self.decompressor.flush()
+            self.buffer = b""
+            return data
+        while len(self.buffer) < size:
+            chunk = self.stream.read(size)
+            if not chunk:
+                self.buffer += self.decompressor.flush()
+                break
+            self.buffer += self.decompressor.decompress(chunk)
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def close(self) -> None:
+        if self.release is not None:
+            self.release()
+            self.release = None
+        else:
+            self.stream.close()
+
+    def __enter__(self) -> "HttpResponse":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+
+class UrllibTransport:
+    """
+    HTTP transport using `urllib.request.urlopen`, opening a new connection per request.
+
+    It honors proxy settings from the environment.
+    """
+
+    def open(self, url: str, timeout: t.Optional[float] = None) -> HttpResponse:
+        response = urlopen(url) if timeout is None else urlopen(url, timeout=timeout)  # noqa: S310
+        return HttpResponse(url=response.geturl(), status=response.status, headers=response.headers, stream=response)
+
+
+class HttpTransport:
+    """
+    HTTP transport keeping connections alive, pooled per host, and requesting
+    compressed responses.
+
+    After a response has been consumed partially, the remainder of its body is
+    drained up to `drain_limit` bytes, in order to be able to reuse the connection.
+    Larger remainders are discarded by closing the connection.
+
+    Idle connections are owned by the process which opened them. A process forked
+    from the owner, like a parallel reader of `sphinx-build -j N`, starts with an
+    empty pool, because sharing sockets with the parent process would mix up
+    responses.
+
+    The `hosts` mapping can be used to direct requests for specific host names to
+    different addresses, for example to a local HTTP server when testing.
+
+    Requests which are subject to proxy settings from the environment are
+    delegated to the `UrllibTransport`.
+    """
+
+    redirect_codes = (301, 302, 303, 307, 308)
+
+    def __init__(
+        self,
+        max_idle_per_host: int = 4,
+        max_redirects: int = 5,
+        drain_limit: int = 64 * 1024,
+        hosts: t.Optional[t.Dict[str, t.Tuple[str, int]]] = None,
+    ):
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self.drain_limit = drain_limit
+        self.hosts = hosts or {}
+        self.idle: t.Dict[ConnectionKey, t.List[http.client.HTTPConnection]] = defaultdict(list)
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.ssl_context = ssl.create_default_context()
+        self.fallback = UrllibTransport()
+        self.connections_opened = 0
+
+    def open(self, url: str, timeout: t.Optional[float] = None) -> HttpResponse:
+        """
+        Issue a GET request, following redirects, and return the response.
+        """
+        for _ in range(self.max_redirects + 1):
+            if self.uses_proxy(url):
+                return self.fallback.open(url, timeout=timeout)
+            response = self.request(url, timeout=timeout)
+            location = response.headers.get("Location")
+            if response.status not in self.redirect_codes or not location:
+                return response
+            response.close()
+            url = urljoin(url, location)
+        raise http.client.HTTPException(f"Too many redirects: {url}")
+
+    def request(self, url: str, timeout: t.Optional[float] = None) -> HttpResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        key: ConnectionKey = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = {
+            "Host": parts.netloc,
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+
+        # Retry once with a fresh connection, when an idle connection has been closed by the server.
+        for attempt in range(2):
+            connection, reused = self.acquire(key, timeout)
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+            if response.status >= 400 and response.status not in self.redirect_codes:
+                response.read()
+                self.release_connection(key, connection, response)
+                raise http.client.HTTPException(f"HTTP Error {response.status}: {response.reason}")
+            release = functools.partial(self.release_connection, key, connection, response)
+            return HttpResponse(url=url, status=response.status, headers=response.msg, stream=response, release=release)
+        raise http.client.HTTPException(f"Unable to connect: {url}")  # pragma: nocover
+
+    def acquire(self, key: ConnectionKey, timeout: t.Optional[float]) -> t.Tuple[http.client.HTTPConnection, bool]:
+        """
+        Return an idle connection from the pool, or create a new one.
+        """
+        self.check_owner()
+        with self.lock:
+            idle = self.idle[key]
+            connection = idle.pop() if idle else None
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+
+        scheme, host, port = key
+        address_host, address_port = self.hosts.get(host, (host, port))
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        kwargs: t.Dict[str, t.Any] = {"timeout": timeout}
+        if scheme == "https":
+            kwargs["context"] = self.ssl_context
+        connection = connection_class(address_host, address_port, **kwargs)
+        with self.lock:
+            self.connections_opened += 1
+        return connection, False
+
+    def release_connection(
+        self, key: ConnectionKey, connection: http.client.HTTPConnection, response: http.client.HTTPResponse
+    ) -> None:
+        """
+        Return a connection to the pool, after draining the rest of the response body.
+        """
+        try:
+            if not response.isclosed():
+                remaining = response.length
+                if remaining is not None and remaining > self.drain_limit:
+                    raise OSError("Response remainder too large")
+                response.read(self.drain_limit + 1)
+                if not response.isclosed():
+                    raise OSError("Response remainder too large")
+            if response.will_close:
+                raise OSError("Server closes connection")
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            return
+        with self.lock:
+            idle = self.idle[key]
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def check_owner(self) -> None:
+        """
+        Drop idle connections inherited from the parent process, without closing them.
+        """
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.lock = threading.Lock()
+            self.idle = defaultdict(list)
+
+    def close(self) -> None:
+        """
+        Close all idle connections.
+        """
+        with self.lock:
+            for connections in self.idle.values():
+                for connection in connections:
+                    connection.close()
+            self.idle.clear()
+
+    def uses_proxy(self, url: str) -> bool:
+        parts = urlsplit(url)
+        return parts.scheme in getproxies() and not proxy_bypass(parts.hostname or "")
+
+
+transport: t.Any = HttpTransport()
+
+
+def get_transport() -> t.Any:
+    """
+    Return the transport used for retrieving HTML pages.
+    """
+    return transport
+
+
+def set_transport(value: t.Any) -> None:
+    """
+    Set the transport used for retrieving HTML pages. It must provide an `open(url, timeout)`
+    method returning an `HttpResponse`.
+    """
+    global transport
+    transport = value
@@ -0,0 +1,451 @@
+import json
+import os
+import threading
+import time
+import typing as t
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from pathlib import Path
+
+from docutils.parsers.rst import directives, roles
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+
+from sphinx_design_elements.util.cache import get_node_cache, prototypes
+
+logger = logging.getLogger(__name__)
+
+# Counters of the node cache and the prototype cache: hits, misses, hits, misses.
+CacheCounters = t.Tuple[int, int, int, int]
+
+
+class ElementStats:
+    """
+    Counters and timings of a single role or directive.
+
+    Timings and cache counters exclude nested invocations of other
+    instrumented elements, except `total`, which includes them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.own = 0.0
+        self.max = 0.0
+        self.max_location: t.Optional[str] = None
+        self.network = 0.0
+        self.requests = 0
+        self.cache: t.List[int] = [0, 0, 0, 0]
+
+    def update(self, other: "ElementStats") -> None:
+        """
+        Accumulate the counters of another instance, for example from a parallel reader.
+        """
+        self.count += other.count
+        self.total += other.total
+        self.own += other.own
+        if other.max > self.max:
+            self.max, self.max_location = other.max, other.max_location
+        self.network += other.network
+        self.requests += other.requests
+        self.cache = [mine + theirs for mine, theirs in zip(self.cache, other.cache)]
+
+    def as_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "self_s": round(self.own, 6),
+            "max_s": round(self.max, 6),
+            "max_location": self.max_location,
+            "network_s": round(self.network, 6),
+            "network_requests": self.requests,
+            "node_cache": cache_rates(self.cache[0], self.cache[1]),
+            "prototypes": cache_rates(self.cache[2], self.cache[3]),
+        }
+
+
+class Span:
+    """
+    An invocation of an element which is in progress.
+    """
+
+    def __init__(self, counters: CacheCounters, docname: str, line: t.Optional[int]):
+        self.counters = counters
+        self.docname = docname
+        self.line = line
+        self.children = 0.0
+        self.children_counters: CacheCounters = (0, 0, 0, 0)
+        self.network = 0.0
+        self.requests = 0
+
+
+class Instrumentation:
+    """
+    Record invocation counts, wall time, network time, and cache counters of
+    the roles and directives of this package, while reading documents.
+
+    Network time spent outside of element invocations, like when prefetching
+    page titles, is recorded separately.
+
+    When tracing, each invocation, and each phase within, is also recorded as
+    Chrome trace event, with timestamps relative to the start of reading.
+    """
+
+    def __init__(self, trace: bool = False):
+        self.elements: t.Dict[str, ElementStats] = {}
+        self.network = 0.0
+        self.requests = 0
+        self.stack: t.List[Span] = []
+        self.lock = threading.Lock()
+        self.events: t.Optional[t.List[t.Dict[str, t.Any]]] = [] if trace else None
+        self.epoch = time.perf_counter()
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["lock"]
+        state["stack"] = []
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, name: str, env: BuildEnvironment, line: t.Optional[int], kind: str) -> t.Iterator[None]:
+        """
+        Record an invocation of an element.
+        """
+        span = Span(cache_counters(env), env.docname, line)
+        self.stack.append(span)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            elapsed = finished - started
+            self.stack.pop()
+            if self.events is not None:
+                self.trace(name, kind, started, finished, {"docname": span.docname, "line": line})
+            counters = tuple(now - before for now, before in zip(cache_counters(env), span.counters))
+
+            stats = self.elements.get(name)
+            if stats is None:
+                stats = self.elements[name] = ElementStats()
+            stats.count += 1
+            stats.total += elapsed
+            stats.own += elapsed - span.children
+            if elapsed > stats.max:
+                stats.max, stats.max_location = elapsed, f"{env.docname}:{line}"
+            stats.network += span.network
+            stats.requests += span.requests
+            for index, (value, nested) in enumerate(zip(counters, span.children_counters)):
+                stats.cache[index] += value - nested
+
+            if self.stack:
+                parent = self.stack[-1]
+                parent.children += elapsed
+                parent.children_counters = t.cast(
+                    "CacheCounters", tuple(a + b for a, b in zip(parent.children_counters, counters))
+                )
+
+    @contextmanager
+    def phase(self, name: str, args: t.Dict[str, t.Any]) -> t.Iterator[None]:
+        """
+        Trace a phase, like parsing or rendering, within the innermost element.
+        """
+        if self.stack and threading.current_thread() is threading.main_thread():
+            args = {"docname": self.stack[-1].docname, "line": self.stack[-1].line, **args}
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.trace(name, "phase", started, time.perf_counter(), args)
+
+    def trace(self, name: str, category: str, started: float, finished: float, args: t.Dict[str, t.Any]) -> None:
+        """
+        Record a complete event, with timestamps in microseconds.
+        """
+        if self.events is None:
+            return
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((started - self.epoch) * 1e6, 1),
+                "dur": round((finished - started) * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": args,
+            }
+        )
+
+    def record_network(self, seconds: float) -> None:
+        """
+        Record time spent waiting for the network, attributing it to the innermost element.
+        """
+        with self.lock:
+            if self.stack and threading.current_thread() is threading.main_thread():
+                self.stack[-1].network += seconds
+                self.stack[-1].requests += 1
+            else:
+                self.network += seconds
+                self.requests += 1
+
+    def clear(self) -> None:
+        self.elements.clear()
+        self.network = 0.0
+        self.requests = 0
+        if self.events is not None:
+            self.events.clear()
+
+    def update(self, other: "Instrumentation") -> None:
+        """
+        Accumulate the counters of another instance, for example from a parallel reader.
+        """
+        for name, other_stats in other.elements.items():
+            self.elements.setdefault(name, ElementStats()).update(other_stats)
+        self.network += other.network
+        self.requests += other.requests
+        if self.events is not None and other.events is not None:
+            self.events += other.events
+
+    def report(self) -> t.Dict[str, t.Any]:
+        cache = [sum(stats.cache[index] for stats in self.elements.values()) for index in range(4)]
+        return {
+            "elements": {name: self.elements[name].as_dict() for name in sorted(self.elements)},
+            "network": {"network_s": round(self.network, 6), "network_requests": self.requests},
+            "node_cache": cache_rates(cache[0], cache[1]),
+            "prototypes": cache_rates(cache[2], cache[3]),
+        }
+
+    def trace_events(self) -> t.Dict[str, t.Any]:
+        """
+        Return the recorded events in Chrome trace event format, naming each process.
+        """
+        events = sorted(self.events or [], key=lambda event: event["ts"])
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "sphinx-build" if pid == os.getpid() else f"reader {pid}"},
+            }
+            for pid in sorted({event["pid"] for event in events} | {os.getpid()})
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+
+def cache_counters(env: BuildEnvironment) -> CacheCounters:
+    cache = get_node_cache(env)
+    if cache is None:
+        return 0, 0, prototypes.hits, prototypes.misses
+    return cache.hits, cache.misses, prototypes.hits, prototypes.misses
+
+
+def cache_rates(hits: int, misses: int) -> t.Dict[str, t.Any]:
+    lookups = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": round(hits / lookups, 3) if lookups else None}
+
+
+# The instrumentation of the current build, if enabled.
+current: t.Optional[Instrumentation] = None
+
+
+def reset_in_child() -> None:
+    """
+    Parallel readers are forked from the main process, while it is merging the
+    results of other readers. Start with empty counters, so they will only
+    report their own work.
+    """
+    if current is not None:
+        current.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_in_child)
+
+
+def record_network(seconds: float) -> None:
+    """
+    Record time spent waiting for the network, when instrumentation is enabled.
+    """
+    if current is not None:
+        current.record_network(seconds)
+
+
+def phase(name: str, **args: t.Any) -> t.ContextManager[t.Any]:
+    """
+    Trace a phase, like parsing or rendering, when tracing is enabled.
+    """
+    if current is None or current.events is None:
+        return nullcontext()
+    return current.phase(name, args)
+
+
+def registered_elements() -> t.Dict[t.Tuple[str, str], t.Any]:
+    """
+    Return all roles and directives registered with docutils, by kind and name.
+    """
+    elements = {("role", name): role for name, role in roles._roles.items()}  # type: ignore[attr-defined]
+    for name, directive in directives._directives.items():  # type: ignore[attr-defined]
+        elements["directive", name] = directive
+    return elements
+
+
+def registered_since(before: t.Dict[t.Tuple[str, str], t.Any]) -> t.List[t.Tuple[str, str]]:
+    """
+    Return the kinds and names of roles and directives registered after taking a snapshot.
+    """
+    return sorted(key for key, value in registered_elements().items() if before.get(key) is not value)
+
+
+def setup_instrumentation(app: Sphinx, elements: t.List[t.Tuple[str, str]]):
+    """
+    Set up optional instrumentation of the given roles and directives.
+    """
+    app.add_config_value("design_elements_instrumentation", False, "", types=[bool])
+    app.add_config_value(
+        "design_elements_instrumentation_report", "design-elements-instrumentation.json", "", types=[str]
+    )
+    app.add_config_value("design_elements_trace", None, "", types=[str])
+    app.connect("builder-inited", partial(instrument_elements, elements=elements))
+    app.connect("env-before-read-docs", reset_instrumentation, priority=100)
+    app.connect("env-merge-info", merge_instrumentation)
+    app.connect("build-finished", report_instrumentation)
+
+
+def get_instrumentation(env: BuildEnvironment) -> t.Optional[Instrumentation]:
+    """
+    Return the instrumentation, if it is enabled.
+    """
+    return getattr(env, "design_elements_instrumentation", None)
+
+
+def is_enabled(app: Sphinx) -> bool:
+    """
+    Whether to measure invocations, for reporting counters, or for tracing.
+    """
+    return bool(app.config.design_elements_instrumentation or app.config.design_elements_trace)
+
+
+def instrument_elements(app: Sphinx, elements: t.List[t.Tuple[str, str]]):
+    """
+    Wrap the given roles and directives, to measure their invocations.
+    """
+    if not is_enabled(app):
+        return
+    for kind, name in elements:
+        if kind == "role":
+            app.add_role(name, instrument_role(name, roles._roles[name]), override=True)  # type: ignore[attr-defined]
+        else:
+            directive = directives._directives[name]  # type: ignore[attr-defined]
+            app.add_directive(name, instrument_directive(name, directive), override=True)
+
+
+def instrument_role(name: str, role: t.Callable) -> t.Callable:
+    """
+    Wrap a role function, to measure its invocations.
+    """
+
+    def run(role_name: str, rawtext: str, text: str, lineno: int, inliner: t.Any, *args: t.Any, **kwargs: t.Any):
+        env = inliner.document.settings.env
+        instrumentation = get_instrumentation(env)
+        if instrumentation is None:
+            return role(role_name, rawtext, text, lineno, inliner, *args, **kwargs)
+        with instrumentation.measure(name, env, lineno, kind="role"):
+            return role(role_name, rawtext, text, lineno, inliner, *args, **kwargs)
+
+    run.__wrapped__ = role  # type: ignore[attr-defined]
+    return run
+
+
+def instrument_directive(name: str, directive: t.Type) -> t.Type:
+    """
+    Derive a directive class, to measure its invocations.
+    """
+
+    def run(self: t.Any) -> t.Any:
+        env = self.state.document.settings.env
+        instrumentation = get_instrumentation(env)
+        if instrumentation is None:
+            return directive.run(self)
+        with instrumentation.measure(name, env, self.lineno, kind="directive"):
+            return directive.run(self)
+
+    return type(directive.__name__, (directive,), {"run": run, "__module__": directive.__module__})
+
+
+def reset_instrumentation(app: Sphinx, env: BuildEnvironment, docnames: t.List[str]):
+    """
+    Start with empty counters when reading documents.
+    """
+    global current
+    if not is_enabled(app):
+        current = None
+        if hasattr(env, "design_elements_instrumentation"):
+            del env.design_elements_instrumentation
+        return
+    current = env.design_elements_instrumentation = Instrumentation(  # type: ignore[attr-defined]
+        trace=bool(app.config.design_elements_trace)
+    )
+
+
+def merge_instrumentation(app: Sphinx, env: BuildEnvironment, docnames: t.List[str], other: BuildEnvironment):
+    """
+    Accumulate counters of parallel readers.
+    """
+    instrumentation = get_instrumentation(env)
+    other_instrumentation = get_instrumentation(other)
+    if instrumentation is not None and other_instrumentation is not None:
+        instrumentation.update(other_instrumentation)
+
+
+def report_instrumentation(app: Sphinx, exception: t.Optional[Exception]):
+    """
+    Log a summary of the recorded counters, and write them to a JSON file.
+    Write recorded trace events to a separate JSON file.
+    """
+    instrumentation = get_instrumentation(app.env)
+    if instrumentation is None or exception is not None:
+        return
+
+    if app.config.design_elements_instrumentation:
+        report = instrumentation.report()
+        report["parallel"] = app.parallel
+        path = Path(app.outdir) / app.config.design_elements_instrumentation_report
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf8")
+
+        logger.info("")
+        for line in summary(report):
+            logger.info(line)
+        logger.info(f"instrumentation report written to {path}")
+
+    if app.config.design_elements_trace:
+        path = Path(app.outdir) / app.config.design_elements_trace
+        path.write_text(json.dumps(instrumentation.trace_events()), encoding="utf8")
+        logger.info(f"trace written to {path}")
+
+
+def summary(report: t.Dict[str, t.Any]) -> t.List[str]:
+    """
+    Render the recorded counters as text table, slowest elements first.
+    """
+    lines = [f"{'element':<24} {'count':>7} {'total ms':>10} {'self ms':>10} {'max ms':>8} {'net ms':>8} {'cache':>6}"]
+    elements = sorted(report["elements"].items(), key=lambda item: item[1]["self_s"], reverse=True)
+    for name, stats in elements:
+        hits = stats["node_cache"]["hits"] + stats["prototypes"]["hits"]
+        lookups = hits + stats["node_cache"]["misses"] + stats["prototypes"]["misses"]
+        rate = f"{hits / lookups:.0%}" if lookups else "-"
+        lines.append(
+            f"{name:<24} {stats['count']:>7} {stats['total_s'] * 1000:>10.1f} {stats['self_s'] * 1000:>10.1f} "
+            f"{stats['max_s'] * 1000:>8.1f} {stats['network_s'] * 1000:>8.1f} {rate:>6}"
+        )
+    network = report["network"]
+    if network["network_requests"]:
+        lines.append(
+            f"network outside of elements: {network['network_requests']} requests, "
+            f"{network['network_s'] * 1000:.1f} ms"
+        )
+    return lines
@@ -0,0 +1,174 @@
+import json
+import re
+import time
+import typing as t
+import zlib
+from pathlib import Path
+
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TitleInventory:
+    """
+    A synthetic intersphinx inventory, caching titles extracted from HTML pages,
+    so that subsequent invocations do not need to extract them over and over again.
+
+    Titles are stored in an `objects.inv` file using the intersphinx inventory
+    format version 2, so other tools can consume it. Because that format can not
+    convey timestamps, the retrieval time of each entry is stored side by side,
+    in a `timestamps.json` file.
+
+    Entries expire after `cache_limit` days. A negative value caches them
+    for an unlimited time, like `intersphinx_cache_limit`.
+    """
+
+    inventory_filename = "objects.inv"
+    timestamps_filename = "timestamps.json"
+
+    domain_role = "std:doc"
+    priority = -1
+
+    line_re = re.compile(r"(?P<name>\S+)\s+(?P<type>\S+)\s+(?P<prio>-?\d+)\s+(?P<uri>\S*)\s+(?P<dispname>.*)")
+
+    def __init__(self, path: t.Union[str, Path], cache_limit: float = 5, project: str = "hyper"):
+        self.path = Path(path)
+        self.cache_limit = cache_limit
+        self.project = project
+        self.titles: t.Dict[str, str] = {}
+        self.timestamps: t.Dict[str, float] = {}
+        self.changed = False
+
+    @property
+    def inventory_path(self) -> Path:
+        return self.path / self.inventory_filename
+
+    @property
+    def timestamps_path(self) -> Path:
+        return self.path / self.timestamps_filename
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def get(self, url: str) -> t.Optional[str]:
+        """
+        Return the cached title of a page, or `None` when it is unknown or expired.
+        """
+        if url not in self.titles or self.is_expired(url):
+            return None
+        return self.titles[url]
+
+    def set(self, url: str, title: str, timestamp: t.Optional[float] = None) -> None:
+        """
+        Store the title of a page.
+        """
+        self.titles[url] = title
+        self.timestamps[url] = time.time() if timestamp is None else timestamp
+        self.changed = True
+
+    def update(self, other: "TitleInventory") -> None:
+        """
+        Merge entries from another inventory, newer entries win.
+
+        Identical entries, like the ones a parallel reader inherited from the main
+        process, are skipped, so they do not mark the inventory as changed.
+        """
+        for url, title in other.titles.items():
+            timestamp = other.timestamps.get(url, 0)
+            if self.titles.get(url) == title and self.timestamps.get(url) == timestamp:
+                continue
+            if timestamp >= self.timestamps.get(url, 0):
+                self.set(url, title, timestamp=timestamp)
+
+    def is_expired(self, url: str) -> bool:
+        if self.cache_limit < 0:
+            return False
+        age = time.time() - self.timestamps.get(url, 0)
+        return age > self.cache_limit * 86400
+
+    def load(self) -> None:
+        """
+        Read the inventory from disk, skipping expired entries.
+        """
+        if not self.inventory_path.exists():
+            return
+        try:
+            titles = self.read_inventory(self.inventory_path)
+            timestamps: t.Dict[str, float] = {}
+            if self.timestamps_path.exists():
+                timestamps = json.loads(self.timestamps_path.read_text(encoding="utf8"))
+        except Exception as ex:
+            logger.warning(f"Unable to read title inventory {self.inventory_path}: {ex}")
+            return
+        for url, title in titles.items():
+            self.titles[url] = title
+            self.timestamps[url] = timestamps.get(url, 0)
+            if self.is_expired(url):
+                del self.titles[url]
+                del self.timestamps[url]
+
+    def save(self) -> None:
+        """
+        Write the inventory to disk, when it has been changed.
+        """
+        if not self.changed:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.write_inventory(self.inventory_path)
+        self.timestamps_path.write_text(json.dumps(self.timestamps, indent=2, sort_keys=True), encoding="utf8")
+        self.changed = False
+
+    def read_inventory(self, path: Path) -> t.Dict[str, str]:
+        """
+        Read titles from an intersphinx inventory file.
+        """
+        titles: t.Dict[str, str] = {}
+        with open(path, "rb") as f:
+            header = f.readline().decode("utf8").rstrip()
+            if header != "# Sphinx inventory version 2":
+                raise ValueError(f"Unsupported inventory format: {header}")
+            # Skip project, version, and compression notes.
+            for _ in range(3):
+                f.readline()
+            payload = zlib.decompress(f.read()).decode("utf8")
+        for line in payload.splitlines():
+            matched = self.line_re.match(line.rstrip())
+            if not matched or matched.group("type") != self.domain_role:
+                continue
+            name = matched.group("name")
+            dispname = matched.group("dispname")
+            titles[name] = name if dispname == "-" else dispname
+        return titles
+
+    def write_inventory(self, path: Path) -> None:
+        """
+        Write titles to an intersphinx inventory file.
+        """
+
+        def escape(string: str) -> str:
+            return re.sub(r"\s+", " ", string).strip()
+
+        with open(path, "wb") as f:
+            f.write(
+                (
+                    "# Sphinx inventory version 2\n"
+                    f"# Project: {escape(self.project)}\n"
+                    "# Version: \n"
+                    "# The remainder of this file is compressed using zlib.\n"
+                ).encode("utf8")
+            )
+            compressor = zlib.compressobj(9)
+            for url in sorted(self.titles):
+                # Inventory names can not contain whitespace.
+                if re.search(r"\s", url):
+                    continue
+                dispname = escape(self.titles[url]) or "-"
+                if dispname == url:
+                    dispname = "-"
+                entry = f"{url} {self.domain_role} {self.priority} {url} {dispname}\n"
+                f.write(compressor.compress(entry.encode("utf8")))
+            f.write(compressor.flush())
@@ -0,0 +1,71 @@
+import threading
+import typing as t
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import zip_longest
+from urllib.parse import urlsplit
+
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TitlePrefetcher:
+    """
+    Retrieve titles of many HTML pages concurrently.
+
+    Requests are dispatched to a bounded thread pool, while the number of
+    concurrent requests to the same host is limited, so servers will not
+    be hammered.
+    """
+
+    def __init__(self, fetch: t.Callable[[str], str], max_workers: int = 8, per_host: int = 2):
+        self.fetch = fetch
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+
+    def run(self, urls: t.Iterable[str]) -> t.Dict[str, str]:
+        """
+        Retrieve titles of all pages, and return them by URL.
+
+        Pages which can not be retrieved are omitted from the result.
+        """
+        urls = self.interleave(urls)
+        if not urls:
+            return {}
+
+        semaphores: t.Dict[str, threading.BoundedSemaphore] = {
+            host: threading.BoundedSemaphore(self.per_host) for host in map(self.host, urls)
+        }
+        results: t.Dict[str, str] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(urls)), thread_name_prefix="hyper-title"
+        ) as executor:
+            futures = {executor.submit(self.fetch_one, url, semaphores[self.host(url)]): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as ex:
+                    logger.debug(f"Unable to retrieve page title of {url}: {ex}")
+        return results
+
+    def fetch_one(self, url: str, semaphore: threading.BoundedSemaphore) -> str:
+        with semaphore:
+            return self.fetch(url)
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def interleave(self, urls: t.Iterable[str]) -> t.List[str]:
+        """
+        Deduplicate URLs, and order them round-robin by host.
+
+        That way, worker threads will rarely block on the per-host limit while
+        requests to other hosts are still pending.
+        """
+        by_host: t.Dict[str, t.List[str]] = defaultdict(list)
+        for url in dict.fromkeys(urls):
+            by_host[self.host(url)].append(url)
+        return [url for batch in zip_longest(*by_host.values()) for url in batch if url is not None]
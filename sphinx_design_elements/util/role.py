@@ -1,14 +1,20 @@
 from functools import lru_cache
-from typing import Any, List, Optional, Tuple, Union, cast
-from urllib.request import urlopen
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from bs4 import BeautifulSoup
 from docutils import nodes
-from myst_parser.mocking import MockInliner
+from docutils.parsers.rst import Directive, DirectiveError, directives, roles
+from docutils.statemachine import StringList
+from docutils.utils import SystemMessage
+from myst_parser.mocking import MockingError, MockInliner, MockState, MockStateMachine
+from myst_parser.parsers.directives import MarkupError, parse_directive_arguments
 from sphinx import addnodes
 from sphinx.environment import BuildEnvironment
 from sphinx.ext.intersphinx import resolve_reference_detect_inventory
 
+from sphinx_design_elements.util.html import read_html_title
+from sphinx_design_elements.util.http import get_transport
+
 
 def resolve_reference(
     env: BuildEnvironment, document: nodes.document, target: str, label: Optional[str] = None, level: int = 2, **kwargs
@@ -77,15 +83,26 @@ def link_type(link: Union[str, None]) -> Union[str, None]:
 
 
 @lru_cache(maxsize=8192)
-def get_html_page_title(url: str) -> str:
+def get_html_page_title(url: str, timeout: Optional[float] = None) -> str:
     """
     Retrieve HTML page via HTTP, and extract value of <title>TEXT</title>.
+
+    Requests are issued using the pluggable HTTP transport, see `util.http`.
+
+    The optional `timeout` is applied to blocking network operations, in seconds.
+
+    The response is only read until the title has been seen. When that is not
+    conclusive, the whole document is parsed using BeautifulSoup.
     """
     if not (url.startswith("http://") or url.startswith("https://")):
         return url
 
-    soup = BeautifulSoup(urlopen(url), "html.parser")  # noqa: S310
-    return soup.title and soup.title.get_text() or url
+    with get_transport().open(url, timeout=timeout) as response:
+        title, head = read_html_title(response, charset=response.headers.get_content_charset())
+        if title is None:
+            soup = BeautifulSoup(head + response.read(), "html.parser")
+            title = soup.title.get_text() if soup.title else None
+    return title or url
 
 
 def parse_block_myst(
@@ -102,18 +119,127 @@ def parse_block_myst(
         with self._renderer.current_node_context(container):
             self._renderer.nested_render_text(text, lineno, inline=False)
 
-    # Extract the reference node from the container paragraph node.
-    ref: Optional[nodes.Node]
-    if with_container:
-        ref = container.next_node()
-    else:
-        ref = cast("nodes.Node", container.next_node()).next_node()
+    ref = extract_block_node(container, with_container=with_container)
     if ref:
         return [ref], []
     else:
         return [], []
 
 
+def extract_block_node(container: nodes.Element, with_container: bool = False) -> Optional[nodes.Node]:
+    """
+    Extract the reference node from the container paragraph node.
+    """
+    if with_container:
+        return container.next_node()
+    child = container.next_node()
+    if child is None:
+        return None
+    return child.next_node()
+
+
+def build_role_node(
+    inliner: MockInliner, name: str, text: str, lineno: int
+) -> Tuple[Optional[nodes.Node], List[nodes.system_message]]:
+    """
+    Run a role directly, without rendering a MyST snippet.
+
+    Return the first node produced by the role, and the system messages it reported.
+    The node is `None` when the role is not available, or did not produce any nodes.
+    When it also did not report any messages, the caller can fall back to rendering
+    a snippet.
+    """
+    role_function, _ = roles.role(name, inliner.language, lineno, inliner.reporter)
+    if role_function is None:
+        return None, []
+    rawtext = f"{{{name}}}`{text}`"
+    result, messages = role_function(name, rawtext, text, lineno, inliner, {}, [])  # type: ignore[arg-type]
+    node = result[0] if result else None
+    return node, messages  # type: ignore[return-value]
+
+
+def build_directive_node(
+    inliner: MockInliner,
+    name: str,
+    argument: str,
+    options: Dict[str, Any],
+    content: str,
+    lineno: int,
+    with_container: bool = False,
+) -> Optional[nodes.Node]:
+    """
+    Run a directive directly, without rendering a MyST snippet.
+
+    The setup is the same as within `DocutilsRenderer.run_directive`, but the
+    directive arguments and options are passed through without serializing
+    and parsing them again.
+
+    Return the extracted node, like `parse_block_myst`, or `None` when the
+    directive is not available, or when its arguments or options are invalid,
+    so the caller can fall back to rendering a snippet, which also reports
+    those problems.
+    """
+    renderer = inliner._renderer
+    directive_class, _ = directives.directive(name, renderer.language_module_rst, renderer.document)
+    if directive_class is None:
+        return None
+    try:
+        arguments = parse_directive_arguments(directive_class, argument)
+    except MarkupError:
+        return None
+    converted = convert_directive_options(directive_class, options)
+    if converted is None:
+        return None
+
+    renderer.document.current_line = lineno
+    body = content.splitlines()
+    container = nodes.Element()
+    with renderer.current_node_context(inliner.parent):
+        with renderer.current_node_context(container):
+            state_machine = MockStateMachine(renderer, lineno)
+            state = MockState(renderer, state_machine, lineno)
+            directive = directive_class(
+                name=name,
+                arguments=arguments,
+                options=converted,
+                content=StringList(body, renderer.document["source"]),
+                lineno=lineno,
+                content_offset=0,
+                block_text="\n".join(body),
+                state=state,  # type: ignore[arg-type]
+                state_machine=state_machine,  # type: ignore[arg-type]
+            )
+            try:
+                result = directive.run()
+            except (DirectiveError, MockingError, SystemMessage):
+                return None
+    container.extend(result)
+    return extract_block_node(container, with_container=with_container)
+
+
+def convert_directive_options(directive_class: Type[Directive], options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Validate and convert directive option values, like MyST does for option blocks.
+
+    `True` designates a flag. Return `None` when an option is unknown, or when
+    its value is invalid.
+    """
+    option_spec = directive_class.option_spec or {}
+    converted: Dict[str, Any] = {}
+    for key, value in options.items():
+        converter = option_spec.get(key)
+        if converter is None:
+            return None
+        value = "true" if value is True else str(value)
+        if not value or converter is directives.flag:
+            value = None
+        try:
+            converted[key] = converter(value)
+        except (ValueError, TypeError):
+            return None
+    return converted
+
+
 def parse_block_rst(  # pragma: nocover
     self: MockInliner, text: str, lineno: int, memo: Any, parent: nodes.Element
 ) -> Tuple[List[nodes.Node], List[nodes.system_message]]:
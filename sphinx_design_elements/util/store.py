@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+
+class SharedTitleStore:
+    """
+    A title store shared by all processes and threads of a build, based on SQLite.
+
+    It coordinates retrieving page titles, so that each URL is fetched at most once
+    per build, even when documents are read by multiple worker processes in parallel
+    (`sphinx-build -j N`). The first process to claim a URL fetches its title, while
+    all others wait for the outcome.
+
+    It also accumulates the time spent waiting for the network by all processes,
+    so the network budget applies to the whole build.
+    """
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path: t.Union[str, Path], poll_interval: float = 0.05):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.local = threading.local()
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["local"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self.local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Return a database connection for the current process and thread.
+
+        Connections must not be shared across forked processes, nor across threads.
+        """
+        pid = os.getpid()
+        if getattr(self.local, "pid", None) != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS titles (url TEXT PRIMARY KEY, title TEXT, status TEXT, updated REAL)"
+            )
+            connection.execute("CREATE TABLE IF NOT EXISTS budget (id INTEGER PRIMARY KEY, spent REAL)")
+            self.local.connection = connection
+            self.local.pid = pid
+        return self.local.connection
+
+    def reset(self) -> None:
+        """
+        Forget all outcomes, at the beginning of a build.
+        """
+        self.connection.execute("DELETE FROM titles")
+        self.connection.execute("DELETE FROM budget")
+
+    def add_spent(self, seconds: float) -> None:
+        """
+        Account time spent waiting for the network.
+        """
+        self.connection.execute(
+            "INSERT INTO budget (id, spent) VALUES (0, ?) ON CONFLICT(id) DO UPDATE SET spent = spent + excluded.spent",
+            (seconds,),
+        )
+
+    def spent(self) -> float:
+        """
+        Return the time spent waiting for the network by all processes, in seconds.
+        """
+        row = self.connection.execute("SELECT spent FROM budget WHERE id=0").fetchone()
+        return row[0] if row is not None else 0.0
+
+    def claim(self, url: str) -> bool:
+        """
+        Claim a URL for retrieving its title. Return `True` if the caller should fetch it.
+        """
+        cursor = self.connection.execute(
+            "INSERT OR IGNORE INTO titles (url, status, updated) VALUES (?, ?, ?)", (url, self.PENDING, time.time())
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, url: str, title: str) -> None:
+        self.connection.execute(
+            "UPDATE titles SET title=?, status=?, updated=? WHERE url=?", (title, self.DONE, time.time(), url)
+        )
+
+    def fail(self, url: str) -> None:
+        self.connection.execute("UPDATE titles SET status=?, updated=? WHERE url=?", (self.FAILED, time.time(), url))
+
+    def lookup(self, url: str) -> t.Tuple[t.Optional[str], t.Optional[str]]:
+        """
+        Return the status and title of a URL.
+        """
+        row = self.connection.execute("SELECT status, title FROM titles WHERE url=?", (url,)).fetchone()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    def wait(self, url: str, timeout: t.Optional[float] = None) -> t.Optional[str]:
+        """
+        Wait for another process to retrieve the title of a URL.
+
+        Return the title, or `None` when retrieving it failed, or did not finish in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status, title = self.lookup(url)
+            if status == self.DONE:
+                return title
+            if status != self.PENDING:
+                return None
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
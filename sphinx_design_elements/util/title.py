@@ -0,0 +1,136 @@
+import threading
+import time
+import typing as t
+
+from sphinx.util import logging
+
+from sphinx_design_elements.util.instrument import phase, record_network
+from sphinx_design_elements.util.inventory import TitleInventory
+from sphinx_design_elements.util.role import get_html_page_title
+from sphinx_design_elements.util.store import SharedTitleStore
+
+logger = logging.getLogger(__name__)
+
+
+class TitleUnavailable(Exception):
+    """
+    Raised when a page title can not be retrieved, or must not be retrieved.
+    """
+
+
+class TitleResolver:
+    """
+    Resolve page titles of URL targets, from the title inventory, or from the network.
+
+    Network access is bounded by a per-request timeout, and by a total budget of
+    seconds spent waiting for responses per build. When running in offline mode,
+    or when the budget has been exhausted, titles are only looked up in the
+    title inventory.
+
+    When a shared title store is given, retrieving titles is coordinated across
+    all processes and threads of the build, so each URL is fetched at most once.
+    """
+
+    def __init__(
+        self,
+        inventory: TitleInventory,
+        timeout: t.Optional[float] = None,
+        budget: t.Optional[float] = None,
+        offline: bool = False,
+        store: t.Optional[SharedTitleStore] = None,
+    ):
+        self.inventory = inventory
+        self.timeout = timeout
+        self.budget = budget
+        self.offline = offline
+        self.store = store
+        self.spent = 0.0
+        self.lock = threading.Lock()
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @property
+    def remaining(self) -> t.Optional[float]:
+        """
+        Return the remaining network budget in seconds, or `None` when unlimited.
+        """
+        if self.budget is None:
+            return None
+        spent = self.spent if self.store is None else max(self.spent, self.store.spent())
+        return max(0.0, self.budget - spent)
+
+    @property
+    def available(self) -> bool:
+        """
+        Whether network access is permitted.
+        """
+        return not self.offline and self.remaining != 0
+
+    def resolve(self, url: str) -> t.Optional[str]:
+        """
+        Return the title of a page, or `None` when it can not be resolved in time.
+        """
+        title = self.inventory.get(url)
+        if title is not None:
+            return title
+        try:
+            return self.fetch(url)
+        except TitleUnavailable as ex:
+            logger.debug(f"Unable to resolve page title of {url}: {ex}")
+            return None
+
+    def fetch(self, url: str) -> str:
+        """
+        Retrieve the title of a page from the network, and store it into the inventory.
+        """
+        if self.offline:
+            raise TitleUnavailable("Offline mode")
+        timeout = self.timeout
+        remaining = self.remaining
+        if remaining is not None:
+            if remaining <= 0:
+                raise TitleUnavailable("Network budget exhausted")
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        # When another process or thread is retrieving the title already, wait for it.
+        started = time.perf_counter()
+        try:
+            with phase("fetch title", url=url):
+                if self.store is not None and not self.store.claim(url):
+                    title = self.store.wait(url, timeout=timeout)
+                    if title is None:
+                        raise TitleUnavailable("Retrieving the title failed in another process")
+                else:
+                    title = self.fetch_title(url, timeout)
+        finally:
+            record_network(time.perf_counter() - started)
+        self.inventory.set(url, title)
+        return title
+
+    def fetch_title(self, url: str, timeout: t.Optional[float]) -> str:
+        """
+        Retrieve the title of a page, and publish the outcome to the shared store.
+        """
+        started = time.monotonic()
+        try:
+            title = get_html_page_title(url, timeout=timeout)
+        except Exception as ex:
+            if self.store is not None:
+                self.store.fail(url)
+            raise TitleUnavailable(str(ex)) from ex
+        finally:
+            elapsed = time.monotonic() - started
+            with self.lock:
+                self.spent += elapsed
+            if self.store is not None:
+                self.store.add_spent(elapsed)
+        if self.store is not None:
+            self.store.complete(url, title)
+        return title
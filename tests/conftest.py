@@ -134,3 +134,15 @@ def find_reference(node: nodes.Node, with_container: bool = False):
     if results:
         return results[0]
     return node
+
+
+@pytest.fixture
+def page_server():
+    """
+    Provide a local stand-in HTTP server, serving HTML pages with titles.
+    """
+    from tests.server import PageServer
+
+    server = PageServer().start()
+    yield server
+    server.stop()
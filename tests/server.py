@@ -0,0 +1,101 @@
+"""
+A local stand-in HTTP server, used by the test suite and by the benchmarks.
+"""
+
+import gzip
+import threading
+import time
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class PageServer:
+    """
+    A local stand-in HTTP server, serving HTML pages with titles.
+
+    - `/<name>` responds with a page titled `Title of <name>`.
+    - `/redirect/<name>` redirects to `/<name>`.
+    - `/large/<name>` responds with a large page.
+    - `/slow/<name>` responds after a delay.
+    - `/missing/<name>` responds with an error.
+
+    All responses can be delayed by `latency` seconds, for example to simulate
+    remote hosts when benchmarking.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.connections: t.Set[t.Tuple[str, int]] = set()
+        self.requests: t.List[t.Dict[str, str]] = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler_factory())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.port}/{path.lstrip('/')}"
+
+    def start(self) -> "PageServer":
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "PageServer":
+        return self.start()
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.stop()
+
+    def handler_factory(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def do_GET(self):
+                server.connections.add(self.client_address)
+                server.requests.append(
+                    {
+                        "path": self.path,
+                        "client": self.client_address,
+                        **{key.lower(): value for key, value in self.headers.items()},
+                    }
+                )
+                if server.latency:
+                    time.sleep(server.latency)
+                path = self.path.strip("/")
+                if path.startswith("redirect/"):
+                    self.send_response(302)
+                    self.send_header("Location", "/" + path.split("/", 1)[1])
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if path.startswith("missing/"):
+                    self.send_error(404)
+                    return
+                if path.startswith("slow/"):
+                    time.sleep(0.5)
+                name = path.rsplit("/", 1)[-1]
+                body = f"<html><head><title>Title of {name}</title></head><body>".encode("utf8")
+                if path.startswith("large/"):
+                    body += b"<p>Lorem ipsum dolor sit amet.</p>" * 100_000
+                body += b"</body></html>"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
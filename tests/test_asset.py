@@ -0,0 +1,86 @@
+import gzip
+import json
+import stat
+
+import pytest
+
+from sphinx_design_elements.util import asset
+from sphinx_design_elements.util.asset import (
+    MANIFEST_FILENAME,
+    asset_filename,
+    build_asset,
+    minify_css,
+    minify_js,
+    write_assets,
+)
+
+ASSETS = ("addon.js", "style.css")
+
+
+def test_minify_css():
+    css = "/* Comment */\n.foo > .bar,\nhr.docutils {\n  margin: 0;\n  font-size: small;\n}\n"
+    assert minify_css(css) == ".foo>.bar,hr.docutils{margin:0;font-size:small}"
+
+
+def test_minify_js():
+    js = 'function foo() {\n    // Comment.\n\n    const url = "https://example.org";\n}\n'
+    assert minify_js(js) == 'function foo() {\nconst url = "https://example.org";\n}\n'
+
+
+def test_build_asset():
+    css = build_asset("style.css").decode()
+    assert "/*" not in css
+    assert "\n" not in css
+    assert ".sd-col>div.line-block{margin-top:unset;margin-bottom:unset}" in css
+    assert "setup_dropdown_group" in build_asset("addon.js").decode()
+
+
+def test_asset_filename():
+    assert asset_filename("addon.js") == "design-elements.js"
+    assert asset_filename("style.css") == "design-elements.css"
+    with pytest.raises(ValueError):
+        asset_filename("foo.txt")
+
+
+def test_write_assets(tmp_path):
+    manifest_path = tmp_path / "doctrees" / MANIFEST_FILENAME
+    names = write_assets(tmp_path, ASSETS, manifest_path)
+    assert sorted(names) == ["design-elements.css", "design-elements.js"]
+    for name in names:
+        path = tmp_path / name
+        assert gzip.decompress(tmp_path.joinpath(f"{name}.gz").read_bytes()) == path.read_bytes()
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+        assert tmp_path.joinpath(f"{name}.br").exists() == (asset.brotli is not None)
+    assert not tmp_path.joinpath(MANIFEST_FILENAME).exists()
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["assets"] == names
+    assert manifest["key"]["version"] == asset.__version__
+
+
+def test_write_assets_once_per_version(tmp_path, monkeypatch):
+    """
+    Assets are only built again when the package version changes.
+    """
+    manifest_path = tmp_path / MANIFEST_FILENAME
+    names = write_assets(tmp_path, ASSETS, manifest_path)
+
+    def build_asset(filename):
+        raise AssertionError("Unexpected build")
+
+    monkeypatch.setattr(asset, "build_asset", build_asset)
+    assert write_assets(tmp_path, ASSETS, manifest_path) == names
+
+    monkeypatch.setattr(asset, "__version__", "99.0.0")
+    with pytest.raises(AssertionError):
+        write_assets(tmp_path, ASSETS, manifest_path)
+
+
+def test_write_assets_missing_file(tmp_path):
+    """
+    Assets are built again when files are missing, for example after cleaning the build directory.
+    """
+    manifest_path = tmp_path / MANIFEST_FILENAME
+    write_assets(tmp_path, ASSETS, manifest_path)
+    tmp_path.joinpath("design-elements.js").unlink()
+    write_assets(tmp_path, ASSETS, manifest_path)
+    assert tmp_path.joinpath("design-elements.js").exists()
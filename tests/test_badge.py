@@ -0,0 +1,188 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from sphinx_design_elements.util.badge import (
+    badge_filename,
+    badge_id,
+    can_render_badge,
+    render_badge_sprite,
+    render_badge_svg,
+    render_badge_symbol,
+    resolve_color,
+    text_colors,
+    text_width,
+)
+
+
+def test_text_width():
+    assert text_width("") == 0
+    assert text_width("i") < text_width("m")
+    assert text_width("Read More") == 58.7
+    # Unknown characters are measured using fallback widths.
+    assert text_width("ä") == 7.0
+    assert text_width("漢") == 11.0
+
+
+def test_resolve_color():
+    assert resolve_color(None, "#555") == "#555"
+    assert resolve_color("blue", "#555") == "#007ec6"
+    assert resolve_color("Success", "#555") == "#4c1"
+    assert resolve_color("ff0000", "#555") == "#ff0000"
+    assert resolve_color("#abc", "#555") == "#abc"
+    assert resolve_color("darkcyan", "#555") == "darkcyan"
+    assert resolve_color("rgb(10, 20, 30)", "#555") == "rgb(10, 20, 30)"
+    assert resolve_color("darkyellow", "#555") == "#555"
+    assert resolve_color('"/><script>', "#555") == "#555"
+
+
+def test_text_colors():
+    assert text_colors("#007ec6") == ("#fff", "#010101")
+    assert text_colors("lightblue") == ("#333", "#ccc")
+    assert text_colors("#fff") == ("#333", "#ccc")
+
+
+def test_render_badge_flat():
+    svg = render_badge_svg("foobar", label="Open", color="darkblue")
+    assert svg.startswith('<svg xmlns="http://www.w3.org/2000/svg" width="85" height="20"')
+    assert "<title>Open: foobar</title>" in svg
+    assert 'rx="3"' in svg
+    assert '<rect width="39" height="20" fill="#555"/>' in svg
+    assert '<rect x="39" width="46" height="20" fill="darkblue"/>' in svg
+    assert svg.count(">foobar</text>") == 2
+
+
+def test_render_badge_flat_square():
+    svg = render_badge_svg("foobar", style="flat-square")
+    assert 'shape-rendering="crispEdges"' in svg
+    assert "rx=" not in svg
+    assert "linearGradient" not in svg
+    assert svg.count(">foobar</text>") == 1
+    assert re.search(r'<svg [^>]+width="46"', svg)
+
+
+def test_render_badge_escape():
+    svg = render_badge_svg("<b>&", label='"quoted"')
+    assert "<b>" not in svg
+    assert "&lt;b&gt;&amp;" in svg
+    assert 'aria-label="&quot;quoted&quot;: &lt;b&gt;&amp;"' in svg
+
+
+def test_render_badge_unsupported():
+    assert can_render_badge()
+    assert can_render_badge(style="flat-square")
+    assert not can_render_badge(style="for-the-badge")
+    assert not can_render_badge(logo="GitHub")
+    with pytest.raises(ValueError):
+        render_badge_svg("foobar", style="plastic")
+
+
+def test_badge_filename():
+    svg = render_badge_svg("foobar")
+    assert re.match(r"^shield\.[0-9a-f]{32}\.svg$", badge_filename(svg))
+    assert badge_filename(svg) != badge_filename(render_badge_svg("foobaz"))
+
+
+def test_render_badge_symbol():
+    badge = {"message": "foobar", "label": "Open"}
+    symbol_id = badge_id(badge)
+    assert re.match(r"^shield-[0-9a-f]{16}$", symbol_id)
+    assert symbol_id != badge_id({"message": "foobar"})
+    width, symbol = render_badge_symbol(symbol_id, badge)
+    assert width == 85
+    assert symbol.startswith(f'<symbol id="{symbol_id}" viewBox="0 0 85 20">')
+    # Element identifiers within symbols must not collide with other badges.
+    assert f'clip-path="url(#{symbol_id}-r)"' in symbol
+    assert "<title>" not in symbol
+
+
+def test_render_badge_sprite():
+    badges = {badge_id({"message": name}): {"message": name} for name in ["foo", "bar"]}
+    sprite = render_badge_sprite(badges)
+    assert sprite.startswith('<svg xmlns="http://www.w3.org/2000/svg"><symbol ')
+    assert sprite.count("<symbol ") == 2
+    assert 'aria-hidden="true"' in render_badge_sprite(badges, hidden=True)
+
+
+SHIELDS = """
+:::{shield}
+:message: Example
+:color: darkcyan
+:::
+
+:::{shield}
+:message: Logo
+:logo: GitHub
+:::
+"""
+
+
+def build_shield_project(sphinx_builder, render_mode: str):
+    builder = sphinx_builder(
+        conf_kwargs={
+            "extensions": ["myst_parser", "sphinx_design", "sphinx_design_elements"],
+            "myst_enable_extensions": ["colon_fence"],
+            "shield_render": render_mode,
+        }
+    )
+    builder.src_path.joinpath("index.md").write_text("# Index\n\n```{toctree}\nsub/page\n```\n" + SHIELDS)
+    builder.src_path.joinpath("sub").mkdir()
+    builder.src_path.joinpath("sub", "page.md").write_text("# Page\n" + SHIELDS)
+    builder.build()
+    return builder
+
+
+def test_shield_local_build(sphinx_builder):
+    builder = build_shield_project(sphinx_builder, "local")
+
+    static_path = Path(builder.app.outdir) / "_sphinx_design_elements_static"
+    badges = list(static_path.glob("shield.*.svg"))
+    assert len(badges) == 1
+    assert "Example" in badges[0].read_text()
+
+    index = Path(builder.app.outdir, "index.html").read_text()
+    page = Path(builder.app.outdir, "sub", "page.html").read_text()
+    assert f'src="_sphinx_design_elements_static/{badges[0].name}"' in index
+    assert f'src="../_sphinx_design_elements_static/{badges[0].name}"' in page
+
+    # Badges with logos are still rendered by shields.io.
+    assert 'src="https://img.shields.io/badge/Logo-blue?logo=GitHub"' in index
+
+
+def test_shield_sprite_build(sphinx_builder):
+    builder = build_shield_project(sphinx_builder, "sprite")
+
+    static_path = Path(builder.app.outdir) / "_sphinx_design_elements_static"
+    assert not list(static_path.glob("shield.*.svg"))
+    sprite = static_path.joinpath("shields.svg").read_text()
+    assert sprite.count("<symbol ") == 1
+    symbol_id = re.search(r'<symbol id="(shield-[0-9a-f]+)"', sprite).group(1)
+    version = builder.app.env.shield_sprite_version
+
+    index = Path(builder.app.outdir, "index.html").read_text()
+    page = Path(builder.app.outdir, "sub", "page.html").read_text()
+    assert f'<use href="_sphinx_design_elements_static/shields.svg?v={version}#{symbol_id}"/>' in index
+    assert f'<use href="../_sphinx_design_elements_static/shields.svg?v={version}#{symbol_id}"/>' in page
+    assert 'aria-label="Example"' in index
+
+    # Badges with logos are still rendered by shields.io.
+    assert 'src="https://img.shields.io/badge/Logo-blue?logo=GitHub"' in index
+
+    # Removing a badge from all documents drops it from the sprite.
+    builder.src_path.joinpath("index.md").write_text("# Index\n\n```{toctree}\nsub/page\n```\n")
+    builder.src_path.joinpath("sub", "page.md").write_text("# Page\n")
+    builder.build()
+    assert "<symbol " not in static_path.joinpath("shields.svg").read_text()
+
+
+def test_shield_inline_build(sphinx_builder):
+    builder = build_shield_project(sphinx_builder, "inline")
+
+    static_path = Path(builder.app.outdir) / "_sphinx_design_elements_static"
+    assert not static_path.joinpath("shields.svg").exists()
+
+    page = Path(builder.app.outdir, "sub", "page.html").read_text()
+    symbol_id = re.search(r'<symbol id="(shield-[0-9a-f]+)"', page).group(1)
+    assert page.count("<symbol ") == 1
+    assert f'<use href="#{symbol_id}"/>' in page
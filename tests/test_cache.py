@@ -0,0 +1,176 @@
+import pickle
+
+from docutils import nodes, utils
+from sphinx import addnodes
+
+from sphinx_design_elements.util.cache import NodeCache, PrototypeCache, freeze, get_node_cache
+
+
+def make_reference(text: str = "Example") -> nodes.Node:
+    node = nodes.reference("", "", refuri="https://example.org/")
+    node.source, node.line = "one.md", 1
+    node += nodes.inline(text, text)
+    return node
+
+
+def test_node_cache_copy():
+    cache = NodeCache()
+    cache.set(("hyper", "example"), "one", [make_reference()])
+
+    first = cache.get(("hyper", "example"), "two", "two.md", 42)
+    second = cache.get(("hyper", "example"), "two", "two.md", 43)
+    assert first is not None and second is not None
+    assert first[0] is not second[0]
+    assert first[0].astext() == "Example"
+    assert (first[0].source, first[0].line) == ("two.md", 42)
+    assert (second[0].source, second[0].line) == ("two.md", 43)
+
+    # Modifying a returned copy does not modify the cached nodes.
+    first[0]["classes"].append("foo")
+    third = cache.get(("hyper", "example"), "two")
+    assert third is not None
+    assert third[0]["classes"] == []
+
+    assert cache.hits == 3
+    assert cache.misses == 0
+
+
+def test_node_cache_lru():
+    cache = NodeCache(maxsize=2)
+    cache.set(("a",), "index", [make_reference("a")])
+    cache.set(("b",), "index", [make_reference("b")])
+    assert cache.get(("a",), "index") is not None
+    cache.set(("c",), "index", [make_reference("c")])
+
+    assert len(cache) == 2
+    assert cache.get(("b",), "index") is None
+    assert cache.get(("a",), "index") is not None
+    assert cache.get(("c",), "index") is not None
+    assert cache.stats() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
+
+
+def test_node_cache_document_specific():
+    cache = NodeCache()
+    xref = addnodes.pending_xref("", reftarget="foobar", refdoc="one")
+    xref += nodes.inline("foobar", "foobar")
+    cache.set(("hyper", "foobar"), "one", [xref])
+
+    assert cache.get(("hyper", "foobar"), "one") is not None
+    assert cache.get(("hyper", "foobar"), "two") is None
+
+
+def test_node_cache_not_cacheable():
+    cache = NodeCache()
+    node = make_reference()
+    node["ids"].append("example")
+    cache.set(("ids",), "index", [node])
+    cache.set(("message",), "index", [nodes.system_message("Failure", type="WARNING", level=2)])
+    cache.set(("empty",), "index", [])
+    assert len(cache) == 0
+
+
+def test_node_cache_disabled():
+    cache = NodeCache(maxsize=0)
+    cache.set(("hyper", "example"), "index", [make_reference()])
+    assert cache.get(("hyper", "example"), "index") is None
+    assert len(cache) == 0
+
+
+def test_node_cache_pickle():
+    cache = NodeCache()
+    cache.set(("hyper", "example"), "index", [make_reference()])
+    cache.get(("hyper", "example"), "index")
+    cache.get(("hyper", "unknown"), "index")
+
+    other = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert len(other) == 0
+    cache.update(other)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+CONTENT = """
+(foobar)=
+# Repeated
+
+{hyper-navigate}`Example <https://example.org/>`
+{hyper-navigate}`Example <https://example.org/>`
+{hyper}`Example <foobar> {type=badge}`
+{hyper}`Example <foobar> {type=badge}`
+
+:::{shield}
+:message: Example
+:::
+
+:::{shield}
+:message: Example
+:::
+"""
+
+
+def make_grid() -> nodes.container:
+    document = utils.new_document("one.md")
+    grid = nodes.container(classes=["sd-container-fluid"])
+    grid += nodes.container(classes=["sd-row"])
+    grid.document = document
+    grid[0].document = document
+    return grid
+
+
+def test_prototype_cache_clone():
+    cache = PrototypeCache()
+    first = cache.clone(("grid", freeze({"outline": None})), make_grid)
+    second = cache.clone(("grid", freeze({"outline": None})), make_grid)
+    assert first is not second
+    assert first.pformat() == second.pformat()
+    assert first.document is None
+    assert first[0].document is None
+
+    # Modifying a clone does not modify the prototype.
+    first[0]["classes"].append("foo")
+    first += nodes.paragraph()
+    third = cache.clone(("grid", freeze({"outline": None})), make_grid)
+    assert third[0]["classes"] == ["sd-row"]
+    assert len(third) == 1
+
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 1, "maxsize": 256}
+
+
+def test_prototype_cache_lru():
+    cache = PrototypeCache(maxsize=2)
+    for key in ["a", "b", "a", "c"]:
+        cache.clone((key,), make_grid)
+    assert list(cache.entries) == [("a",), ("c",)]
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_prototype_cache_disabled():
+    cache = PrototypeCache(maxsize=0)
+    assert cache.clone(("a",), make_grid).document is not None
+    assert len(cache) == 0
+
+
+def test_freeze():
+    assert freeze({"class": ["foo", "bar"], "outline": None}) == (("class", ("foo", "bar")), ("outline", None))
+    assert freeze({"outline": None, "class": ["foo"]}) == freeze({"class": ["foo"], "outline": None})
+
+
+def render_document(builder) -> str:
+    builder.src_path.joinpath("index.md").write_text(CONTENT, encoding="utf8")
+    builder.app.build(force_all=True)
+    return builder.get_doctree("index", post_transforms=True).pformat()
+
+
+def test_node_cache_build(sphinx_builder):
+    builder = sphinx_builder()
+    cached = render_document(builder)
+
+    cache = get_node_cache(builder.app.env)
+    assert cache is not None
+    assert cache.hits == 3
+    # The shield rendered by `hyper-navigate` counts as another miss.
+    assert cache.misses == 4
+
+    builder.app.config.design_elements_node_cache_size = 0
+    uncached = render_document(builder)
+    assert cached == uncached
+    assert cached.count("<image ") == 4
@@ -0,0 +1,138 @@
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+from docutils import nodes
+
+from sphinx_design_elements import extension
+from sphinx_design_elements.extension import find_page_assets, merge_page_assets, stylesheet_classes
+from sphinx_design_elements.util import asset
+
+DROPDOWN_GROUP = """
+::::{div} dropdown-group
+:::{dropdown} Foo
+Foo
+:::
+:::{dropdown} Bar
+Bar
+:::
+::::
+"""
+
+
+def build_pages(sphinx_builder):
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text("# Index\n\n```{toctree}\npage\nplain\n```\n", encoding="utf8")
+    builder.src_path.joinpath("page.md").write_text("# Page\n" + DROPDOWN_GROUP + "\n---\n\nFoo\n", encoding="utf8")
+    builder.src_path.joinpath("plain.md").write_text("# Plain\n\nFoo\n\n---\n\nBar\n", encoding="utf8")
+    builder.build()
+    return builder
+
+
+def test_assets_stable_names(sphinx_builder):
+    builder = build_pages(sphinx_builder)
+    static_path = Path(builder.app.outdir) / "_sphinx_design_elements_static"
+    assert sorted(path.name for path in static_path.glob("design-elements.*s")) == [
+        "design-elements.css",
+        "design-elements.js",
+    ]
+    assert static_path.joinpath("design-elements.css.gz").exists()
+    assert Path(builder.app.outdir, "_static", "design-elements.css.gz").exists()
+    assert Path(builder.app.doctreedir, "design-elements.manifest.json").exists()
+    assert not Path(builder.app.outdir, "_static", "design-elements.manifest.json").exists()
+    page = Path(builder.app.outdir, "page.html").read_text()
+    assert 'src="_static/design-elements.js' in page
+    assert 'href="_static/design-elements.css' in page
+
+
+def test_assets_per_page(sphinx_builder):
+    """
+    Assets are only added to pages using elements which need them.
+    """
+    builder = build_pages(sphinx_builder)
+    index = Path(builder.app.outdir, "index.html").read_text()
+    plain = Path(builder.app.outdir, "plain.html").read_text()
+    assert "design-elements" not in index
+    # The stylesheet also styles transitions.
+    assert "design-elements.js" not in plain
+    assert 'href="_static/design-elements.css' in plain
+    assert builder.app.env.design_elements_page_assets == {"page": {"addon.js", "style.css"}, "plain": {"style.css"}}
+
+
+def test_assets_policy_always(sphinx_builder):
+    builder = sphinx_builder()
+    builder.app.set_html_assets_policy("always")
+    builder.src_path.joinpath("index.md").write_text("# Index\n", encoding="utf8")
+    builder.build()
+    index = Path(builder.app.outdir, "index.html").read_text()
+    assert 'src="_static/design-elements.js' in index
+    assert 'href="_static/design-elements.css' in index
+
+
+def test_find_page_assets():
+    assert "text-small" in stylesheet_classes()
+    assert "sd-col" in stylesheet_classes()
+    assert "75rem" not in stylesheet_classes()
+    document = nodes.container()
+    assert find_page_assets(document) == set()
+    document += nodes.paragraph(classes=["text-large"])
+    assert find_page_assets(document) == {"style.css"}
+    document += nodes.container(classes=["dropdown-group"])
+    assert find_page_assets(document) == {"addon.js", "style.css"}
+
+
+def test_assets_merge():
+    env = SimpleNamespace(design_elements_page_assets={"foo": {"style.css"}, "bar": {"style.css"}})
+    other = SimpleNamespace(design_elements_page_assets={"bar": {"addon.js"}, "baz": {"addon.js"}})
+    merge_page_assets(None, env, ["bar", "baz"], other)
+    assert env.design_elements_page_assets == {"foo": {"style.css"}, "bar": {"addon.js"}, "baz": {"addon.js"}}
+
+
+def test_assets_changed_no_rewrite(sphinx_builder, monkeypatch):
+    """
+    Changing the content of assets does not rewrite unchanged pages.
+    """
+    builder = build_pages(sphinx_builder)
+    static_path = Path(builder.app.outdir) / "_sphinx_design_elements_static"
+    build_asset = asset.build_asset
+    monkeypatch.setattr(asset, "build_asset", lambda filename: build_asset(filename) + b"\n/* changed */\n")
+    monkeypatch.setattr(asset, "__version__", "99.0.0")
+
+    index_mtime = Path(builder.app.outdir, "index.html").stat().st_mtime_ns
+
+    extension.add_assets(builder.app)
+    builder.build()
+    assert "changed" in static_path.joinpath("design-elements.css").read_text()
+    assert Path(builder.app.outdir, "index.html").stat().st_mtime_ns == index_mtime
+
+
+def test_assets_migrate_content_addressed(sphinx_builder):
+    """
+    Content-addressed asset files of previous versions are removed, and all pages are rewritten once.
+    """
+    builder = build_pages(sphinx_builder)
+    static_path = Path(builder.app.outdir) / "_sphinx_design_elements_static"
+    legacy = static_path / "design-elements.0123456789abcdef0123456789abcdef.js"
+    legacy.write_text("", encoding="utf8")
+
+    extension.add_assets(builder.app)
+    assert not legacy.exists()
+    assert sorted(extension.update_asset_links(builder.app, builder.app.env)) == ["index", "page", "plain"]
+
+    extension.add_assets(builder.app)
+    assert extension.update_asset_links(builder.app, builder.app.env) == []
+
+
+def test_dropdown_group_names(sphinx_builder):
+    """
+    Dropdown elements of each group share a `name` attribute, distinct per group.
+    """
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n" + DROPDOWN_GROUP + DROPDOWN_GROUP + ":::{dropdown} Single\nSingle\n:::\n", encoding="utf8"
+    )
+    builder.build()
+    index = Path(builder.app.outdir, "index.html").read_text()
+    names = re.findall(r'<details class="[^"]+" name="([^"]+)">', index)
+    assert names == ["dropdown-group-index-1"] * 2 + ["dropdown-group-index-2"] * 2
+    assert index.count("<details ") == 5
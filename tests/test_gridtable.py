@@ -0,0 +1,326 @@
+import json
+import typing as t
+from pathlib import Path
+
+import pytest
+from docutils import nodes
+
+from sphinx_design_elements.gridtable import get_fragment_path, may_contain_markup, widths_option
+from sphinx_design_elements.util.data import read_table_data
+
+TABLE_CSV = """What,Description
+Fox,The quick brown fox jumps over the lazy dog.
+Franz,Franz jagt im **komplett** verwahrlosten Taxi quer durch Bayern.
+"""
+
+TABLE_RECORDS = [
+    {"What": "Fox", "Description": "The quick brown fox jumps over the lazy dog."},
+    {"What": "Franz", "Description": "Franz jagt im **komplett** verwahrlosten Taxi quer durch Bayern."},
+]
+
+TABLE_MANUAL = """
+::::{sd-table}
+:widths: 3 9
+:row-outline:
+
+:::{sd-row}
+```{sd-item} **What**
+```
+```{sd-item} **Description**
+```
+:::
+
+:::{sd-row}
+```{sd-item} Fox
+```
+```{sd-item}
+The quick brown fox jumps over the lazy dog.
+```
+:::
+:::{sd-row}
+```{sd-item} Franz
+```
+```{sd-item}
+Franz jagt im **komplett** verwahrlosten Taxi quer durch Bayern.
+```
+:::
+
+::::
+"""
+
+TABLE_FILE = """
+::::{{sd-table}}
+:widths: 3 9
+:row-outline:
+:header:
+:file: {filename}
+::::
+"""
+
+
+def write_data(path: Path, filename: str):
+    if filename.endswith(".csv"):
+        content = TABLE_CSV
+    elif filename.endswith(".jsonl"):
+        content = "\n".join(json.dumps(record) for record in TABLE_RECORDS)
+    elif filename.endswith(".json"):
+        content = json.dumps(TABLE_RECORDS)
+    else:
+        content = "".join(f"- What: {r['What']}\n  Description: {r['Description']}\n" for r in TABLE_RECORDS)
+    path.joinpath(filename).write_text(content, encoding="utf8")
+
+
+def find_classes(doctree: nodes.document, name: str) -> t.List[nodes.Element]:
+    return [node for node in doctree.findall(nodes.Element) if name in node["classes"]]
+
+
+def render_table(sphinx_builder, content: str, filename: str = "data.csv"):
+    builder = sphinx_builder()
+    write_data(builder.src_path, filename)
+    builder.src_path.joinpath("index.md").write_text("# Index\n" + content, encoding="utf8")
+    builder.build()
+    return builder
+
+
+@pytest.mark.parametrize("filename", ["data.csv", "data.jsonl", "data.json", "data.yaml"])
+def test_gridtable_file(sphinx_builder, filename):
+    """
+    Tables from data files are equivalent to tables defined by `sd-row` and `sd-item` directives.
+    """
+    builder = render_table(sphinx_builder, TABLE_MANUAL + TABLE_FILE.format(filename=filename), filename=filename)
+    manual, generated = find_classes(builder.get_doctree("index"), "sd-container-fluid")
+    assert generated.pformat() == manual.pformat()
+    assert builder.src_path / filename in {Path(path) for path in builder.app.env.dependencies["index"]}
+
+
+def test_gridtable_file_rst(sphinx_builder):
+    builder = sphinx_builder()
+    write_data(builder.src_path, "data.csv")
+    builder.src_path.joinpath("index.rst").write_text(
+        "Index\n=====\n\n.. sd-table::\n   :widths: 9\n   :file: data.csv\n   :columns: Description\n",
+        encoding="utf8",
+    )
+    builder.build()
+    doctree = builder.get_doctree("index")
+    items = find_classes(doctree, "sd-col")
+    assert [item.astext() for item in items] == [
+        "The quick brown fox jumps over the lazy dog.",
+        "Franz jagt im komplett verwahrlosten Taxi quer durch Bayern.",
+    ]
+    assert "sd-col-9" in items[0]["classes"]
+
+
+def test_gridtable_file_errors(sphinx_builder):
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n\n:::{sd-table}\n:file: unknown.csv\n:::\n\n:::{sd-table}\n:file: unknown.csv\nFoo\n:::\n",
+        encoding="utf8",
+    )
+    builder.build(assert_pass=False)
+    assert "Unable to read table data from unknown.csv" in builder.warnings
+    assert "Table content and `file` option are mutually exclusive" in builder.warnings
+
+
+def test_may_contain_markup():
+    for text in ["Fox", "The quick brown fox.", "Version 2.0", "C++", "Taxi-quer"]:
+        assert not may_contain_markup(text), text
+    for text in ["**bold**", "`code`", "a_b", "1. Item", "- Item", "https://example.org", "Foo\nBar", "{sup}`2`"]:
+        assert may_contain_markup(text), text
+
+
+def test_read_table_data(tmp_path):
+    path = tmp_path / "data.yaml"
+    path.write_text("- [a, b, c]\n- [1, true, null]\n- [2]\n", encoding="utf8")
+    assert list(read_table_data(path)) == [["a", "b", "c"], ["1", "true", ""], ["2"]]
+    assert list(read_table_data(path, ["c", "a"])) == [["c", "a"], ["", "1"], ["", "2"]]
+    with pytest.raises(ValueError, match="Unknown columns: d"):
+        list(read_table_data(path, ["d"]))
+
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"a": 1}\n\n{"b": 2}\n{', encoding="utf8")
+    rows = read_table_data(path)
+    assert next(rows) == ["a"]
+    assert next(rows) == ["1"]
+    assert next(rows) == [""]
+    with pytest.raises(ValueError, match="Line 4:"):
+        next(rows)
+
+    with pytest.raises(ValueError, match="Unknown table data format"):
+        read_table_data(tmp_path / "data.txt")
+
+
+def test_gridtable_paginated(sphinx_builder):
+    """
+    Paginated tables render their first page, and provide remaining rows as payload, and on a separate page.
+    """
+    builder = sphinx_builder()
+    rows = "".join(f"Animal {number},Description {number}\n" for number in range(1, 26))
+    builder.src_path.joinpath("data.csv").write_text("What,Description\n" + rows, encoding="utf8")
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n\n:::{sd-table}\n:file: data.csv\n:header:\n:page-size: 10\n:::\n\n"
+        ":::{sd-table}\n:file: data.csv\n:page-size: 100\n:::\n",
+        encoding="utf8",
+    )
+    builder.build()
+    outdir = Path(builder.app.outdir)
+    index = outdir.joinpath("index.html").read_text()
+    assert index.count('<div class="sd-row') == 11 + 25
+    assert 'data-rows="_sphinx_design_elements_static/tables/sd-table-index-0.json?v=' in index
+    assert 'data-header-rows="1" data-page-size="10" data-row-count="25"' in index
+    assert '<a class="sd-table-all-rows" href="index-table-0.html">Show all 25 rows</a>' in index
+    assert index.count("sd-table-all-rows") == 1
+    assert 'src="_static/design-elements.js' in index
+
+    payload = json.loads(outdir.joinpath("_sphinx_design_elements_static/tables/sd-table-index-0.json").read_text())
+    assert len(payload["rows"]) == 15
+    assert "Animal 11" in payload["rows"][0]
+
+    all_rows = outdir.joinpath("index-table-0.html").read_text()
+    assert all_rows.count('<div class="sd-row') == 26
+    assert '<a href="index.html#sd-table-index-0">Index</a>' in all_rows
+    assert 'href="_static/design-elements.css' in all_rows
+    assert not outdir.joinpath("index-table-1.html").exists()
+
+
+def test_gridtable_paginated_pages(sphinx_builder):
+    """
+    Pages presenting all rows do not shadow documents, and their files are removed with their tables.
+    """
+    builder = sphinx_builder()
+    rows = "".join(f"Animal {number}\n" for number in range(1, 26))
+    builder.src_path.joinpath("data.csv").write_text("What\n" + rows, encoding="utf8")
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n\n:::{sd-table}\n:file: data.csv\n:page-size: 10\n:::\n", encoding="utf8"
+    )
+    builder.build()
+    outdir = Path(builder.app.outdir)
+    assert "Animal 25" in outdir.joinpath("index-table-0.html").read_text()
+
+    # Adding a document of the same name moves the page.
+    builder.src_path.joinpath("index-table-0.md").write_text("---\norphan: true\n---\n# Document\n", encoding="utf8")
+    builder.build()
+    assert "Document" in outdir.joinpath("index-table-0.html").read_text()
+    assert "Animal 25" in outdir.joinpath("index-table-0-all.html").read_text()
+    assert 'href="index-table-0-all.html">Show all 25 rows</a>' in outdir.joinpath("index.html").read_text()
+
+    fragment_path = get_fragment_path(builder.app.doctreedir, "sd-table-index-0")
+    assert fragment_path.exists()
+    builder.src_path.joinpath("index.md").write_text("# Index\n", encoding="utf8")
+    builder.build()
+    assert not fragment_path.exists()
+    assert not outdir.joinpath("_sphinx_design_elements_static/tables/sd-table-index-0.json").exists()
+    assert not outdir.joinpath("index-table-0-all.html").exists()
+    assert "Document" in outdir.joinpath("index-table-0.html").read_text()
+
+
+def test_gridtable_paginated_page_removed(tmp_path: Path, make_app):
+    """
+    The page presenting all rows is removed with its table, also when reading in parallel.
+    """
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text("extensions = ['sphinx_design', 'sphinx_design_elements']\n")
+    rows = "".join(f"Animal {number}\n" for number in range(1, 26))
+    srcdir.joinpath("data.csv").write_text("What\n" + rows, encoding="utf8")
+    srcdir.joinpath("index.rst").write_text(
+        "Index\n=====\n\n.. sd-table::\n   :file: data.csv\n   :page-size: 10\n", encoding="utf8"
+    )
+    app = make_app(srcdir=srcdir, parallel=2)
+    app.build()
+    page_path = Path(app.outdir, "index-table-0.html")
+    assert "Animal 25" in page_path.read_text()
+
+    srcdir.joinpath("index.rst").write_text("Index\n=====\n", encoding="utf8")
+    app = make_app(srcdir=srcdir, parallel=2)
+    app.build()
+    assert not page_path.exists()
+
+
+def test_gridtable_paginated_text(sphinx_builder):
+    """
+    Builders other than HTML render all rows of paginated tables.
+    """
+    builder = sphinx_builder(buildername="text")
+    rows = "".join(f"Animal {number}\n" for number in range(1, 26))
+    builder.src_path.joinpath("data.csv").write_text("What\n" + rows, encoding="utf8")
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n\n:::{sd-table}\n:file: data.csv\n:page-size: 10\n:::\n", encoding="utf8"
+    )
+    builder.build()
+    assert "Animal 25" in Path(builder.app.outdir, "index.txt").read_text()
+
+
+def test_widths_option():
+    assert widths_option("3 9") == ["3", "9"]
+    assert widths_option("auto 12") == ["auto", "12"]
+    with pytest.raises(ValueError, match="column width must be an integer from 1 to 12"):
+        widths_option("3 13")
+    with pytest.raises(ValueError, match="column width must be an integer from 1 to 12"):
+        widths_option("3 x")
+    with pytest.raises(ValueError, match="at most 12 column widths"):
+        widths_option("1 " * 13)
+
+
+def test_gridtable_layout_scope(sphinx_builder):
+    """
+    The layout of each table applies to its own rows only, also for nested and consecutive tables.
+    """
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text(
+        """
+# Index
+
+::::::{sd-table}
+:widths: 4 8
+:row-class: outer
+
+:::::{sd-row}
+::::{sd-item}
+:::{sd-table}
+:widths: 12
+:item-outline:
+
+````{sd-row}
+```{sd-item}
+Inner
+```
+````
+:::
+::::
+```{sd-item}
+Outer
+```
+:::::
+::::::
+
+::::{sd-table}
+
+````{sd-row}
+```{sd-item}
+Plain
+```
+````
+::::
+""",
+        encoding="utf8",
+    )
+    builder.build()
+    doctree = builder.get_doctree("index")
+    assert "sd-table-layouts" not in doctree.attributes
+    outer_row, inner_row, plain_row = find_classes(doctree, "sd-row")
+    assert "outer" in outer_row["classes"]
+    assert "outer" not in inner_row["classes"]
+    assert "outer" not in plain_row["classes"]
+    assert [item["classes"][2] for item in outer_row.children] == ["sd-col-4", "sd-col-8"]
+    assert "sd-col-12" in inner_row.children[0]["classes"]
+    assert "sd-border-1" in inner_row.children[0]["classes"]
+    assert "sd-border-1" not in plain_row.children[0]["classes"]
+
+
+def test_gridtable_layout_mismatch(sphinx_builder):
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n\n::::{sd-table}\n:widths: 4 8\n\n:::{sd-row}\n```{sd-item} Foo\n```\n:::\n::::\n", encoding="utf8"
+    )
+    builder.build(assert_pass=False)
+    assert "Grid table row has 1 items, but 2 column widths" in builder.warnings
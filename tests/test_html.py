@@ -0,0 +1,57 @@
+import io
+
+import pytest
+
+from sphinx_design_elements.util.html import read_html_title, sniff_charset
+
+
+def test_read_html_title_stops_early():
+    page = b"<html><head><title>Example Domain</title></head><body>" + b"<p>padding</p>" * 10000 + b"</body></html>"
+    stream = io.BytesIO(page)
+    title, head = read_html_title(stream, chunk_size=1024)
+    assert title == "Example Domain"
+    assert len(head) == 1024
+    assert stream.tell() == 1024
+
+
+def test_read_html_title_marker_across_chunks():
+    page = b"<html><head><title>Example &amp; Domain</title></head></html>"
+    title, _ = read_html_title(io.BytesIO(page), chunk_size=3)
+    assert title == "Example & Domain"
+
+
+def test_read_html_title_missing():
+    page = b"<html><head><meta charset='utf-8'></head><body><svg><title>Icon</title></svg></body></html>"
+    title, _ = read_html_title(io.BytesIO(page))
+    assert title == ""
+
+
+def test_read_html_title_inconclusive():
+    page = b"<html><head>" + b"<meta name='x'>" * 1000
+    title, head = read_html_title(io.BytesIO(page), chunk_size=1024, max_bytes=2048)
+    assert title is None
+    assert len(head) == 2048
+
+
+@pytest.mark.parametrize(
+    "page,charset",
+    [
+        ("<html><head><meta charset='cp1251'><title>Пример</title></head></html>", None),
+        (
+            '<html><head><meta http-equiv="Content-Type" content="text/html; charset=cp1251">'
+            "<title>Пример</title></head></html>",
+            None,
+        ),
+        ("<html><head><title>Пример</title></head></html>", "cp1251"),
+    ],
+)
+def test_read_html_title_charset(page: str, charset: str):
+    title, _ = read_html_title(io.BytesIO(page.encode("cp1251")), charset=charset)
+    assert title == "Пример"
+
+
+def test_sniff_charset():
+    assert sniff_charset(b"<meta charset='ISO-8859-1'>") == "iso8859-1"
+    assert sniff_charset(b"<meta charset='ISO-8859-1'>", charset="utf-8") == "utf-8"
+    assert sniff_charset(b"<meta charset='unknown'>") == "utf-8"
+    assert sniff_charset(b"") == "utf-8"
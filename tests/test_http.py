@@ -0,0 +1,83 @@
+import http.client
+
+import pytest
+
+from sphinx_design_elements.util.http import HttpTransport, get_transport, set_transport
+from sphinx_design_elements.util.role import get_html_page_title
+from tests.server import PageServer
+
+
+@pytest.fixture
+def transport(page_server: PageServer):
+    """
+    Provide an HTTP transport directing requests for `example.org` to the local server.
+    """
+    transport = HttpTransport(hosts={"example.org": ("127.0.0.1", page_server.port)})
+    yield transport
+    transport.close()
+
+
+def test_transport_keepalive(page_server: PageServer, transport: HttpTransport):
+    for name in ("foo", "bar", "baz"):
+        with transport.open(page_server.url(name)) as response:
+            assert response.read() == f"<html><head><title>Title of {name}</title></head><body></body></html>".encode()
+    assert transport.connections_opened == 1
+    assert len(page_server.connections) == 1
+
+
+def test_transport_compression(page_server: PageServer, transport: HttpTransport):
+    with transport.open(page_server.url("foo")) as response:
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.read(12) == b"<html><head>"
+        assert response.read(7) == b"<title>"
+    assert page_server.requests[0]["accept-encoding"] == "gzip, deflate"
+
+
+def test_transport_host_mapping(page_server: PageServer, transport: HttpTransport):
+    with transport.open("http://example.org/foo") as response:
+        assert b"Title of foo" in response.read()
+    assert page_server.requests[0]["host"] == "example.org"
+
+
+def test_transport_redirect(page_server: PageServer, transport: HttpTransport):
+    with transport.open(page_server.url("redirect/foo")) as response:
+        assert response.url == page_server.url("foo")
+        assert b"Title of foo" in response.read()
+    assert transport.connections_opened == 1
+
+
+def test_transport_partial_read_large(page_server: PageServer, transport: HttpTransport):
+    with transport.open(page_server.url("large/foo")) as response:
+        response.read(100)
+    with transport.open(page_server.url("bar")) as response:
+        response.read()
+    # Uncompressed, the remainder of the large page would exceed the drain limit.
+    # Compressed, it is small enough to be drained, so the connection can be reused.
+    assert transport.connections_opened == 1
+
+
+def test_transport_timeout(page_server: PageServer, transport: HttpTransport):
+    with pytest.raises(TimeoutError):
+        transport.open(page_server.url("slow/foo"), timeout=0.1)
+
+
+def test_transport_unsupported(transport: HttpTransport):
+    with pytest.raises(ValueError):
+        transport.open("ftp://example.org/")
+
+
+def test_transport_not_found(page_server: PageServer, transport: HttpTransport):
+    with pytest.raises(http.client.HTTPException) as ex:
+        transport.open(page_server.url("missing/foo"))
+    assert ex.match("HTTP Error 404")
+
+
+def test_get_html_page_title_transport(page_server: PageServer, transport: HttpTransport):
+    previous = get_transport()
+    set_transport(transport)
+    try:
+        assert get_html_page_title("http://example.org/transport-title") == "Title of transport-title"
+        assert get_html_page_title("http://example.org/large/transport-large") == "Title of transport-large"
+    finally:
+        set_transport(previous)
+    assert transport.connections_opened == 1
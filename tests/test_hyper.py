@@ -1,8 +1,10 @@
 import re
 
 import pytest
+from docutils.parsers.rst import roles
 from sphinx_pytest.plugin import CreateDoctree
 
+from sphinx_design_elements.hyper import HyperRefRole, decode_hyper_options, split_hyper_text
 from tests.util import patch_snippet_docutils_forward, render_reference
 
 
@@ -210,3 +212,135 @@ def test_hyper_card_full(render):
             <inline>
                 https://example.org
 """.lstrip())  # noqa: E501
+
+
+HYPER_VARIANTS = """
+(foobar)=
+# Variants
+
+{hyper}`https://example.org {type=badge}`
+{hyper}`Example <https://example.org> {type=badge,color=secondary,outline=true}`
+{hyper}`foobar {type=badge}`
+{hyper}`https://example.org {type=button}`
+{hyper}`Example <https://example.org> {type=button,outline=true,color=info,shadow=true}`
+{hyper}`https://example.org {type=button,icon=octicon:report}`
+{hyper}`foobar {type=button}`
+{hyper}`https://example.org {type=button,color=unknown}`
+{hyper}`https://example.org {type=card}`
+{hyper}`https://example.org {type=card,title=title,header=header,footer=footer,shadow=lg}`
+{hyper}`foobar {type=shield}`
+{hyper-open}`foobar`
+{hyper-tutorial}`https://example.org`
+"""
+
+
+def render_document(builder, content: str) -> str:
+    builder.src_path.joinpath("index.md").write_text(content, encoding="utf8")
+    builder.app.build(force_all=True)
+    return builder.get_doctree("index", post_transforms=True).pformat()
+
+
+def test_hyper_build_nodes_equivalent(sphinx_builder, monkeypatch):
+    """
+    Building nodes directly produces the same document as rendering MyST snippets.
+    """
+    builder = sphinx_builder()
+    native = render_document(builder, HYPER_VARIANTS)
+    monkeypatch.setattr(HyperRefRole, "build_nodes", False)
+    snippet = render_document(builder, HYPER_VARIANTS)
+    assert native == snippet
+    assert native.count("sd-badge") == 3
+    assert native.count("sd-btn sd-text-wrap") == 4
+    assert native.count('design_component="card"') == 2
+    assert native.count("img.shields.io") == 6
+
+
+def test_hyper_build_nodes_without_snippet(sphinx_builder, monkeypatch):
+    """
+    Building nodes directly does not render MyST snippets for special types.
+    """
+
+    def render_snippet(self, snippet):
+        raise AssertionError(f"Unexpected snippet: {snippet}")
+
+    monkeypatch.setattr(HyperRefRole, "render_snippet", render_snippet)
+    text = render_document(
+        sphinx_builder(),
+        "{hyper}`https://example.org {type=badge}`\n"
+        "{hyper}`https://example.org {type=button}`\n"
+        "{hyper}`https://example.org {type=card}`\n"
+        "{hyper}`https://example.org {type=shield}`\n",
+    )
+    assert "sd-badge" in text
+    assert "sd-btn" in text
+    assert "sd-card" in text
+    assert "img.shields.io" in text
+
+
+def test_hyper_build_nodes_messages(sphinx_builder, monkeypatch):
+    """
+    System messages reported by roles are passed through when building nodes directly.
+    """
+
+    def failing_role(name, rawtext, text, lineno, inliner, options=None, content=None):
+        message = inliner.reporter.error(f"Unable to render badge: {text}", line=lineno)
+        return [inliner.problematic(rawtext, rawtext, message)], [message]
+
+    builder = sphinx_builder(
+        conf_kwargs={"extensions": ["myst_parser", "sphinx_design", "sphinx_design_elements"], "keep_warnings": True}
+    )
+    monkeypatch.setitem(roles._roles, "bdg-link-primary", failing_role)
+    text = render_document(builder, "{hyper}`https://example.org {type=badge}`\n")
+    assert '<problematic ids="id2" refid="id1">' in text
+    assert '<system_message backrefs="id2" ids="id1" level="3"' in text
+    assert "Unable to render badge: https://example.org <https://example.org>" in text
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("", None),
+        ("foobar", (None, "foobar", None)),
+        ("foobar  ", (None, "foobar", None)),
+        ("https://example.org {type=badge}", (None, "https://example.org", "type=badge")),
+        ("title <target>", ("title", "target", None)),
+        ("title  <target> {type=button,notext=true}", ("title", "target", "type=button,notext=true")),
+        ("a <b> <c>", ("a", "b> <c", None)),
+        ("a <b> c", (None, "a <b> c", None)),
+        ("a \x00<b>", (None, "a \x00<b>", None)),
+        ("a {b} {c}", (None, "a", "b} {c")),
+        ("a {}", (None, "a {}", None)),
+        ("title <target> {options}\n", ("title", "target", "options")),
+    ],
+)
+def test_hyper_split_text(text, expected):
+    assert split_hyper_text(text) == expected
+
+
+def test_hyper_parse_text():
+    data, has_explicit_title = HyperRefRole.parse_text("Example <https://example.org> {type=card}")
+    assert data == {"title": "Example", "target": "https://example.org", "options": "type=card"}
+    assert has_explicit_title is True
+
+    data, has_explicit_title = HyperRefRole.parse_text("https://example.org")
+    assert data == {"target": "https://example.org", "options": None}
+    assert has_explicit_title is False
+
+    assert HyperRefRole.parse_text("") == (None, False)
+
+
+def test_hyper_split_text_pathological():
+    """
+    Text which does not match the layout is parsed in linear time.
+    """
+    text = "Lorem <ipsum {dolor " * 10_000
+    assert split_hyper_text.__wrapped__(text) == (None, text.rstrip(), None)
+
+
+def test_hyper_decode_options():
+    options = decode_hyper_options("type=shield,label=Read More,short-title,color=a%2Cb")
+    assert options == {"type": "shield", "label": "Read More", "color": "a,b"}
+
+    # Returned options can be modified without affecting subsequent invocations.
+    options["type"] = "badge"
+    assert decode_hyper_options("type=shield,label=Read More,short-title,color=a%2Cb")["type"] == "shield"
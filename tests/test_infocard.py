@@ -0,0 +1,111 @@
+import typing as t
+from pathlib import Path
+
+import pytest
+from docutils import nodes
+from sphinx_design.cards import CardDirective
+
+from sphinx_design_elements.util.cache import prototypes
+
+INFO_CARD = """
+::::{info-card}
+
+:::{grid-item}
+:columns: 8
+[example.org](https://example.org/)
+
+A module for collecting votes from beagles, \\
+and for consolidating them.
+:::
+
+:::{grid-item}
+:columns: 4
+
+{tags-primary}`foo, bar`
+
+{tags-success}`baz`
+:::
+
+::::
+"""
+
+INFO_CARDS_YAML = """
+- title: example.org
+  link: https://example.org/
+  description: |
+    A module for collecting votes from beagles, \\
+    and for consolidating them.
+  tags:
+    primary: [foo, bar]
+    success: baz
+"""
+
+
+def find_cards(doctree: nodes.document) -> t.List[nodes.Element]:
+    return [node for node in doctree.children[0].children if isinstance(node, nodes.container)]
+
+
+def test_info_card_list(sphinx_builder, monkeypatch):
+    """
+    Info cards rendered from a data file are equivalent to hand-written ones,
+    sharing the card created by the card directive.
+    """
+    prototypes.clear()
+    calls = []
+    run = CardDirective.run
+    monkeypatch.setattr(CardDirective, "run", lambda self: calls.append(self) or run(self))
+
+    builder = sphinx_builder()
+    builder.src_path.joinpath("cards.yaml").write_text(INFO_CARDS_YAML * 3, encoding="utf8")
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n" + INFO_CARD + "\n:::{info-card-list} cards.yaml\n:::\n", encoding="utf8"
+    )
+    builder.build()
+    assert len(calls) == 1
+
+    doctree = builder.get_doctree("index")
+    manual, *cards = find_cards(doctree)
+    assert len(cards) == 3
+    for card in cards:
+        assert card.pformat() == manual.pformat()
+    assert builder.src_path / "cards.yaml" in {Path(path) for path in builder.app.env.dependencies["index"]}
+
+
+def test_info_card_list_links(sphinx_builder):
+    builder = sphinx_builder()
+    builder.src_path.joinpath("cards.json").write_text(
+        '[{"title": "Page", "link": "page", "description": "Plain", "tags": "foo, bar"},'
+        ' {"title": "Section", "link": "#section"}, {"title": "Unlinked"}]',
+        encoding="utf8",
+    )
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n\n```{toctree}\npage\n```\n\n:::{info-card-list} cards.json\n:widths: 6 6\n:::\n",
+        encoding="utf8",
+    )
+    builder.src_path.joinpath("page.md").write_text("(section)=\n# Page\n", encoding="utf8")
+    builder.build()
+    doctree = builder.get_doctree("index", post_transforms=True)
+    references = list(doctree.findall(nodes.reference))
+    assert [reference["refuri"] for reference in references] == ["page.html", "page.html#section"]
+    items = [node for node in doctree.findall(nodes.container) if "sd-col" in node["classes"]]
+    assert "sd-col-6" in items[0]["classes"]
+    assert items[0].astext() == "Page\n\nPlain"
+    assert items[1].astext() == "foo bar"
+    assert items[4].astext() == "Unlinked"
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("- [foo]", "Record 1 must be a mapping"),
+        ("- tags: {purple: foo}", "Unknown tag color: purple"),
+    ],
+)
+def test_info_card_list_errors(sphinx_builder, content, message):
+    builder = sphinx_builder()
+    builder.src_path.joinpath("cards.yaml").write_text(content, encoding="utf8")
+    builder.src_path.joinpath("index.md").write_text(
+        "# Index\n\n:::{info-card-list} cards.yaml\n:::\n", encoding="utf8"
+    )
+    builder.build(assert_pass=False)
+    assert f"Unable to read info cards from cards.yaml: {message}" in builder.warnings
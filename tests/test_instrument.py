@@ -0,0 +1,222 @@
+import json
+import pickle
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sphinx_design_elements.util.instrument import ElementStats, Instrumentation
+
+CONF = {
+    "extensions": ["myst_parser", "sphinx_design", "sphinx_design_elements"],
+    "myst_enable_extensions": ["colon_fence"],
+    "design_elements_instrumentation": True,
+}
+
+PAGE = """
+# {title}
+
+{{hyper}}`https://example.org/`
+
+{{tags}}`foo, bar`
+
+::::{{sd-table}}
+:widths: 4 8
+
+:::{{sd-row}}
+```{{sd-item}} Key
+```
+```{{sd-item}} Value
+```
+:::
+::::
+"""
+
+
+def fetch_title(url: str, timeout: float) -> str:
+    time.sleep(0.01)
+    return "Example Domain"
+
+
+def read_report(path: Path) -> dict:
+    return json.loads(path.joinpath("design-elements-instrumentation.json").read_text())
+
+
+def test_instrumentation(sphinx_builder):
+    """
+    Roles and directives of this package are counted and timed, excluding nested elements.
+    """
+    builder = sphinx_builder(conf_kwargs={**CONF, "hyper_title_prefetch": False})
+    builder.src_path.joinpath("index.md").write_text(PAGE.format(title="Index") * 2, encoding="utf8")
+    with patch("sphinx_design_elements.util.title.get_html_page_title", side_effect=fetch_title) as fetch:
+        builder.build()
+    assert fetch.call_count == 1
+
+    report = read_report(builder.out_path)
+    elements = report["elements"]
+    assert {name: stats["count"] for name, stats in elements.items()} == {
+        "hyper": 2,
+        "sd-item": 4,
+        "sd-row": 2,
+        "sd-table": 2,
+        "tags": 2,
+    }
+    table, row, item = elements["sd-table"], elements["sd-row"], elements["sd-item"]
+    assert table["total_s"] >= table["self_s"] + row["total_s"] - 0.001
+    assert row["self_s"] + item["self_s"] <= table["total_s"]
+    assert item["max_location"].startswith("index:")
+    assert item["prototypes"]["hits"] + item["prototypes"]["misses"] == 4
+
+    # The title of the first link is retrieved from the network, the second one is cached.
+    assert elements["hyper"]["network_requests"] == 1
+    assert elements["hyper"]["network_s"] >= 0.01
+    assert elements["hyper"]["node_cache"]["hits"] == 1
+    assert report["network"] == {"network_s": 0.0, "network_requests": 0}
+
+    assert "sd-table" in builder.status
+    assert "instrumentation report written to" in builder.status
+
+
+def test_instrumentation_prefetch(sphinx_builder):
+    """
+    Network time spent prefetching page titles is recorded outside of elements.
+    """
+    builder = sphinx_builder(conf_kwargs=CONF)
+    builder.src_path.joinpath("index.md").write_text(PAGE.format(title="Index"), encoding="utf8")
+    with patch("sphinx_design_elements.util.title.get_html_page_title", side_effect=fetch_title):
+        builder.build()
+    report = read_report(builder.out_path)
+    assert report["network"]["network_requests"] == 1
+    assert report["elements"]["hyper"]["network_requests"] == 0
+
+
+def test_instrumentation_disabled(sphinx_builder):
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text(PAGE.format(title="Index"), encoding="utf8")
+    with patch("sphinx_design_elements.util.title.get_html_page_title", return_value="Example Domain"):
+        builder.build()
+    assert not builder.out_path.joinpath("design-elements-instrumentation.json").exists()
+    assert not hasattr(builder.app.env, "design_elements_instrumentation")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires forking worker processes")
+def test_instrumentation_parallel(tmp_path: Path, make_app):
+    """
+    Counters of parallel readers are accumulated.
+    """
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text(
+        "\n".join(f"{key} = {value!r}" for key, value in CONF.items()) + "\nhyper_title_offline = True\n"
+    )
+    docnames = [f"page{index}" for index in range(8)]
+    srcdir.joinpath("index.md").write_text(
+        "# Index\n\n```{toctree}\n" + "\n".join(docnames) + "\n```\n", encoding="utf8"
+    )
+    for docname in docnames:
+        srcdir.joinpath(f"{docname}.md").write_text(PAGE.format(title=docname), encoding="utf8")
+
+    app = make_app(srcdir=srcdir, parallel=4)
+    app.build()
+    assert app._warning.getvalue() == ""
+    report = read_report(Path(app.outdir))
+    assert report["parallel"] == 4
+    assert report["elements"]["sd-item"]["count"] == 16
+    assert report["elements"]["hyper"]["count"] == 8
+
+
+def test_element_stats_update():
+    first, second = ElementStats(), ElementStats()
+    first.count, first.total, first.max, first.max_location = 1, 0.5, 0.5, "one:1"
+    second.count, second.total, second.max, second.max_location = 2, 1.5, 1.0, "two:3"
+    second.cache = [1, 2, 3, 4]
+    first.update(second)
+    assert (first.count, first.total, first.max, first.max_location) == (3, 2.0, 1.0, "two:3")
+    assert first.as_dict()["node_cache"] == {"hits": 1, "misses": 2, "hit_rate": 0.333}
+
+
+def test_instrumentation_pickle():
+    instrumentation = Instrumentation()
+    instrumentation.elements["hyper"] = ElementStats()
+    instrumentation.record_network(0.25)
+    restored = pickle.loads(pickle.dumps(instrumentation))  # noqa: S301
+    assert restored.network == 0.25
+    assert "hyper" in restored.elements
+    restored.record_network(0.25)
+    assert restored.requests == 2
+
+
+def test_trace(sphinx_builder):
+    """
+    Invocations of elements, and phases within, are traced as Chrome trace events.
+    """
+    builder = sphinx_builder(
+        conf_kwargs={
+            **CONF,
+            "design_elements_instrumentation": False,
+            "design_elements_trace": "trace.json",
+            "hyper_title_prefetch": False,
+        }
+    )
+    builder.src_path.joinpath("index.md").write_text(PAGE.format(title="Index"), encoding="utf8")
+    with patch("sphinx_design_elements.util.title.get_html_page_title", side_effect=fetch_title):
+        builder.build()
+    assert not builder.out_path.joinpath("design-elements-instrumentation.json").exists()
+
+    trace = json.loads(builder.out_path.joinpath("trace.json").read_text())
+    metadata, *events = trace["traceEvents"]
+    assert metadata["ph"] == "M"
+    assert metadata["args"] == {"name": "sphinx-build"}
+    assert [event["ts"] for event in events] == sorted(event["ts"] for event in events)
+    names = [(event["cat"], event["name"]) for event in events]
+    for name in [
+        ("role", "hyper"),
+        ("phase", "parse text"),
+        ("phase", "resolve title"),
+        ("phase", "fetch title"),
+        ("directive", "sd-table"),
+        ("directive", "sd-row"),
+        ("directive", "sd-item"),
+        ("phase", "nested_parse"),
+    ]:
+        assert name in names
+
+    # Phases are nested within the invocation of their element, and carry its location.
+    hyper = next(event for event in events if event["name"] == "hyper")
+    resolve = next(event for event in events if event["name"] == "resolve title")
+    assert hyper["ts"] <= resolve["ts"]
+    assert resolve["ts"] + resolve["dur"] <= hyper["ts"] + hyper["dur"]
+    assert resolve["dur"] >= 10_000
+    assert hyper["args"] == {"docname": "index", "line": resolve["args"]["line"]}
+    assert resolve["args"]["url"] == "https://example.org/"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires forking worker processes")
+def test_trace_parallel(tmp_path: Path, make_app):
+    """
+    Trace events of parallel readers are merged into one timeline.
+    """
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text(
+        "\n".join(f"{key} = {value!r}" for key, value in CONF.items())
+        + "\nhyper_title_offline = True\ndesign_elements_trace = 'trace.json'\n"
+    )
+    docnames = [f"page{index}" for index in range(8)]
+    srcdir.joinpath("index.md").write_text(
+        "# Index\n\n```{toctree}\n" + "\n".join(docnames) + "\n```\n", encoding="utf8"
+    )
+    for docname in docnames:
+        srcdir.joinpath(f"{docname}.md").write_text(PAGE.format(title=docname), encoding="utf8")
+
+    app = make_app(srcdir=srcdir, parallel=4)
+    app.build()
+    trace = json.loads(Path(app.outdir, "trace.json").read_text())
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    processes = [event for event in trace["traceEvents"] if event["ph"] == "M"]
+    assert len([event for event in events if event["name"] == "sd-item"]) == 16
+    assert {event["args"]["docname"] for event in events if event["name"] == "sd-table"} == set(docnames)
+    assert {event["pid"] for event in events} <= {process["pid"] for process in processes}
+    assert len(processes) > 1
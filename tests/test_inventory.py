@@ -0,0 +1,98 @@
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from sphinx_design_elements.hyper import load_title_inventory
+from sphinx_design_elements.util.inventory import TitleInventory
+
+
+def test_inventory_roundtrip(tmp_path: Path):
+    inventory = TitleInventory(path=tmp_path)
+    inventory.set("https://example.org/", "Example Domain")
+    inventory.set("https://example.net/", "https://example.net/")
+    inventory.save()
+
+    assert (tmp_path / "objects.inv").exists()
+    assert (tmp_path / "timestamps.json").exists()
+
+    inventory = TitleInventory(path=tmp_path)
+    inventory.load()
+    assert inventory.get("https://example.org/") == "Example Domain"
+    assert inventory.get("https://example.net/") == "https://example.net/"
+    assert inventory.get("https://example.com/") is None
+
+
+def test_inventory_intersphinx_format(tmp_path: Path):
+    import posixpath
+
+    from sphinx.util.inventory import InventoryFile
+
+    inventory = TitleInventory(path=tmp_path)
+    inventory.set("https://example.org/", "Example  Domain\n")
+    inventory.save()
+
+    with open(tmp_path / "objects.inv", "rb") as f:
+        data = InventoryFile.load(f, "", posixpath.join)
+    assert "https://example.org/" in data["std:doc"]
+
+
+def test_inventory_expired(tmp_path: Path):
+    inventory = TitleInventory(path=tmp_path, cache_limit=1)
+    inventory.set("https://example.org/", "Example Domain", timestamp=time.time() - 2 * 86400)
+    inventory.set("https://example.net/", "Example Net")
+    assert inventory.get("https://example.org/") is None
+    inventory.save()
+
+    inventory = TitleInventory(path=tmp_path, cache_limit=1)
+    inventory.load()
+    assert "https://example.org/" not in inventory
+    assert "https://example.net/" in inventory
+
+    inventory = TitleInventory(path=tmp_path, cache_limit=-1)
+    inventory.set("https://example.org/", "Example Domain", timestamp=0)
+    assert inventory.get("https://example.org/") == "Example Domain"
+
+
+def test_inventory_update(tmp_path: Path):
+    now = time.time()
+    inventory = TitleInventory(path=tmp_path)
+    inventory.set("https://example.org/", "Example Domain", timestamp=now)
+    inventory.changed = False
+
+    # Identical entries do not mark the inventory as changed.
+    other = TitleInventory(path=tmp_path)
+    other.set("https://example.org/", "Example Domain", timestamp=now)
+    inventory.update(other)
+    assert inventory.changed is False
+
+    # Newer entries win, older ones are ignored.
+    other.set("https://example.org/", "Example Domain, updated", timestamp=now + 2)
+    other.set("https://example.net/", "Example Net", timestamp=now)
+    inventory.update(other)
+    assert inventory.changed is True
+    assert inventory.get("https://example.org/") == "Example Domain, updated"
+
+    inventory.changed = False
+    other.set("https://example.org/", "Example Domain", timestamp=now + 1)
+    inventory.update(other)
+    assert inventory.changed is False
+    assert inventory.get("https://example.org/") == "Example Domain, updated"
+
+
+def test_inventory_warm_build(sphinx_builder):
+    content = "{hyper}`https://example.org/`"
+
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text(content, encoding="utf8")
+    with patch("sphinx_design_elements.util.title.get_html_page_title", return_value="Example Domain") as fetch:
+        builder.build()
+    assert fetch.call_count == 1
+    assert (Path(builder.app.doctreedir) / "hyper" / "objects.inv").exists()
+
+    # A fresh inventory instance uses the titles from the persistent cache.
+    load_title_inventory(builder.app)
+    assert len(builder.app.env.hyper_title_inventory) == 1
+    with patch("sphinx_design_elements.util.title.get_html_page_title") as fetch:
+        builder.app.build(force_all=True)
+    assert fetch.call_count == 0
+    assert "Example Domain" in builder.get_doctree("index").astext()
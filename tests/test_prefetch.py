@@ -0,0 +1,70 @@
+import threading
+import time
+from collections import Counter
+from unittest.mock import patch
+
+from sphinx_design_elements.hyper import scan_title_urls
+from sphinx_design_elements.util.prefetch import TitlePrefetcher
+
+
+def test_scan_title_urls():
+    source = """
+{hyper}`https://example.org/`
+{hyper-navigate}`https://example.org/tutorial {color=red}`
+{hyper}`Explicit <https://example.org/explicit>`
+{hyper}`foo:bar`
+:hyper:`https://example.net/`
+{ref}`https://example.com/`
+"""
+    assert scan_title_urls(source) == [
+        "https://example.org/",
+        "https://example.org/tutorial",
+        "https://example.net/",
+    ]
+
+
+def test_prefetcher_per_host_limit():
+    lock = threading.Lock()
+    active: Counter = Counter()
+    peak: Counter = Counter()
+
+    def fetch(url: str) -> str:
+        host = TitlePrefetcher.host(url)
+        with lock:
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+        time.sleep(0.01)
+        with lock:
+            active[host] -= 1
+        return url.upper()
+
+    urls = [f"https://{host}/{index}" for host in ("a.example", "b.example") for index in range(10)]
+    prefetcher = TitlePrefetcher(fetch=fetch, max_workers=8, per_host=2)
+    results = prefetcher.run(urls + urls)
+
+    assert len(results) == 20
+    assert results["https://a.example/1"] == "HTTPS://A.EXAMPLE/1"
+    assert peak["a.example"] <= 2
+    assert peak["b.example"] <= 2
+
+
+def test_prefetcher_skip_failures():
+    def fetch(url: str) -> str:
+        if "fail" in url:
+            raise OSError("Connection refused")
+        return "Title"
+
+    results = TitlePrefetcher(fetch=fetch).run(["https://example.org/", "https://example.org/fail"])
+    assert results == {"https://example.org/": "Title"}
+
+
+def test_prefetch_build(sphinx_builder):
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.md").write_text(
+        "{hyper}`https://example.org/`\n\n{hyper}`https://example.org/ {type=shield}`", encoding="utf8"
+    )
+    with patch("sphinx_design_elements.util.title.get_html_page_title", return_value="Example Domain") as fetch:
+        builder.build()
+    assert fetch.call_count == 1
+    assert "prefetching 1 page titles" in builder.status
+    assert "Example Domain" in builder.get_doctree("index").astext()
@@ -0,0 +1,148 @@
+import pytest
+
+from sphinx_design_elements.shield import ShieldsDirective
+from sphinx_design_elements.util.directive import MarkdownWrapper
+
+SHIELD_VARIANTS_MYST = """
+# Index
+
+```{toctree}
+page
+```
+
+(label)=
+## Section
+
+:::{shield}
+:message: Plain
+:::
+
+:::{shield}
+:label: Open
+:message: URL
+:color: darkcyan
+:style: flat-square
+:link: https://example.org/äöü
+:::
+
+:::{shield}
+:message: Document
+:link: page
+:link-title: The page
+:::
+
+:::{shield}
+:message: Anchor
+:link: "#label"
+:link-alt: Alternative text
+:::
+"""
+
+SHIELD_VARIANTS_RST = """
+Page
+====
+
+.. shield::
+   :message: Plain
+
+.. shield::
+   :label: Open
+   :message: URL
+   :color: darkcyan
+   :style: flat-square
+   :link: https://example.org/äöü
+
+.. shield::
+   :message: Document
+   :link: index
+   :link-title: The index
+
+.. _label2:
+
+.. shield::
+   :message: Anchor
+   :link: #label2
+   :link-alt: Alternative text
+"""
+
+
+def render_documents(builder):
+    builder.src_path.joinpath("index.md").write_text(SHIELD_VARIANTS_MYST, encoding="utf8")
+    builder.src_path.joinpath("page.rst").write_text(SHIELD_VARIANTS_RST, encoding="utf8")
+    builder.app.build(force_all=True)
+    return [builder.get_doctree(docname, post_transforms=True).pformat() for docname in ["index", "page"]]
+
+
+def test_shield_build_nodes_equivalent(sphinx_builder, monkeypatch):
+    """
+    Building nodes directly produces the same documents as rendering Markdown.
+    """
+    builder = sphinx_builder()
+    native = render_documents(builder)
+    monkeypatch.setattr(ShieldsDirective, "build_nodes", False)
+    markdown = render_documents(builder)
+    assert native == markdown
+    for text in native:
+        assert text.count("<image ") == 4
+        assert "https://example.org/%C3%A4%C3%B6%C3%BC" in text
+
+
+@pytest.mark.parametrize("docname", ["index.md", "page.rst"])
+def test_shield_build_nodes_without_markdown(sphinx_builder, monkeypatch, docname):
+    """
+    Building nodes directly does not parse Markdown, neither in MyST nor in rST documents.
+    """
+
+    def parse(*args, **kwargs):
+        raise AssertionError("Unexpected Markdown parsing")
+
+    monkeypatch.setattr(MarkdownWrapper, "render", parse)
+    monkeypatch.setattr(ShieldsDirective, "parse_nested", parse)
+    builder = sphinx_builder()
+    content = SHIELD_VARIANTS_MYST if docname.endswith(".md") else SHIELD_VARIANTS_RST
+    builder.src_path.joinpath(docname).write_text(content, encoding="utf8")
+    if docname.endswith(".rst"):
+        builder.src_path.joinpath("index.md").write_text("# Index\n\n```{toctree}\npage\n```\n", encoding="utf8")
+    else:
+        builder.src_path.joinpath("page.md").write_text("# Page\n", encoding="utf8")
+    builder.app.build(force_all=True)
+    text = builder.get_doctree(docname.split(".")[0]).pformat()
+    assert text.count("<image ") == 4
+
+
+def test_shield_build_nodes_fallback(sphinx_builder, monkeypatch):
+    """
+    Other kinds of references, like indirect ones, are still rendered by MyST.
+    """
+    contents = []
+    render = MarkdownWrapper.render
+
+    def spy(self, content, document=None):
+        contents.append(content)
+        return render(self, content, document=document)
+
+    monkeypatch.setattr(MarkdownWrapper, "render", spy)
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.rst").write_text(
+        "Index\n=====\n\n.. shield::\n   :message: Plain\n\n"
+        ".. shield::\n   :message: Indirect\n   :link: [example]\n\n"
+        ".. shield::\n   :message: Other\n   :link: [example]\n",
+        encoding="utf8",
+    )
+    builder.build()
+    assert contents == [
+        "[![Indirect](https://img.shields.io/badge/Indirect-blue)][example]",
+        "[![Other](https://img.shields.io/badge/Other-blue)][example]",
+    ]
+
+
+def test_shield_rst_inventory_reference(sphinx_builder):
+    """
+    Inventory references within rST documents are resolved using the Sphinx environment.
+    """
+    builder = sphinx_builder()
+    builder.src_path.joinpath("index.rst").write_text(
+        "Index\n=====\n\n.. shield::\n   :message: Inventory\n   :link: unknown:label\n", encoding="utf8"
+    )
+    builder.build(assert_pass=False)
+    assert "No matches for 'unknown:*:*:label' [myst.iref_missing]" in builder.warnings
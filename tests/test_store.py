@@ -0,0 +1,192 @@
+import multiprocessing
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from sphinx_design_elements.util.http import HttpTransport, get_transport, set_transport
+from sphinx_design_elements.util.inventory import TitleInventory
+from sphinx_design_elements.util.store import SharedTitleStore
+from sphinx_design_elements.util.title import TitleResolver
+from tests.server import PageServer
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Requires forking worker processes")
+
+
+@pytest.fixture
+def local_transport(page_server: PageServer):
+    """
+    Use an HTTP transport directed to the local server.
+    """
+    previous = get_transport()
+    transport = HttpTransport()
+    set_transport(transport)
+    yield transport
+    set_transport(previous)
+    transport.close()
+
+
+def test_store_claim(tmp_path: Path):
+    store = SharedTitleStore(tmp_path / "titles.sqlite")
+    assert store.claim("https://example.org/") is True
+    assert store.claim("https://example.org/") is False
+    assert store.lookup("https://example.org/") == (store.PENDING, None)
+    assert store.wait("https://example.org/", timeout=0.1) is None
+
+    store.complete("https://example.org/", "Example Domain")
+    assert store.wait("https://example.org/") == "Example Domain"
+
+    assert store.claim("https://example.net/") is True
+    store.fail("https://example.net/")
+    assert store.wait("https://example.net/") is None
+
+    store.reset()
+    assert store.lookup("https://example.org/") == (None, None)
+
+
+def test_store_budget(tmp_path: Path):
+    store = SharedTitleStore(tmp_path / "titles.sqlite")
+    assert store.spent() == 0.0
+    store.add_spent(0.25)
+    SharedTitleStore(tmp_path / "titles.sqlite").add_spent(0.5)
+    assert store.spent() == 0.75
+
+    # Resolvers sharing a store also share the network budget.
+    resolver = TitleResolver(inventory=TitleInventory(tmp_path), budget=1, store=store)
+    assert resolver.remaining == 0.25
+    store.add_spent(0.5)
+    assert resolver.remaining == 0
+
+    store.reset()
+    assert store.spent() == 0.0
+
+
+def resolve_in_process(resolver: TitleResolver, url: str, queue) -> None:
+    queue.put(resolver.resolve(url))
+
+
+def test_store_processes(tmp_path: Path, page_server: PageServer, local_transport: HttpTransport):
+    url = page_server.url("slow/shared-processes")
+    resolver = TitleResolver(
+        inventory=TitleInventory(tmp_path), store=SharedTitleStore(tmp_path / "titles.sqlite"), timeout=10
+    )
+    resolver.store.reset()
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    processes = [context.Process(target=resolve_in_process, args=(resolver, url, queue)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+
+    assert [queue.get(timeout=5) for _ in processes] == ["Title of shared-processes"] * 4
+    assert [request["path"] for request in page_server.requests] == ["/slow/shared-processes"]
+
+
+def test_parallel_build(tmp_path: Path, make_app, page_server: PageServer, local_transport: HttpTransport):
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text(
+        "extensions = ['myst_parser', 'sphinx_design', 'sphinx_design_elements']\nhyper_title_prefetch = False\n"
+    )
+    docnames = [f"page{index}" for index in range(12)]
+    srcdir.joinpath("index.md").write_text(
+        "# Index\n\n```{toctree}\n" + "\n".join(docnames) + "\n```\n", encoding="utf8"
+    )
+    for docname in docnames:
+        srcdir.joinpath(f"{docname}.md").write_text(
+            f"# {docname}\n\n"
+            f"{{hyper}}`{page_server.url('shared-build')}`\n\n"
+            f"{{hyper}}`{page_server.url(docname)}`\n",
+            encoding="utf8",
+        )
+
+    app = make_app(srcdir=srcdir, parallel=4)
+    app.build()
+    assert app._warning.getvalue() == ""
+
+    paths = Counter(request["path"] for request in page_server.requests)
+    assert paths["/shared-build"] == 1
+    assert all(count == 1 for count in paths.values())
+
+    # Titles retrieved by parallel readers have been merged into the main inventory.
+    inventory = app.env.hyper_title_inventory
+    assert inventory.get(page_server.url("shared-build")) == "Title of shared-build"
+    assert all(inventory.get(page_server.url(docname)) == f"Title of {docname}" for docname in docnames)
+
+
+def test_parallel_build_inherited_connections(
+    tmp_path: Path, make_app, page_server: PageServer, local_transport: HttpTransport
+):
+    """
+    Parallel readers do not reuse keep-alive connections opened by the main process.
+
+    Otherwise, forked readers would share sockets, and could receive each other's responses.
+    """
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text(
+        "extensions = ['myst_parser', 'sphinx_design', 'sphinx_design_elements']\nhyper_title_prefetch = False\n"
+    )
+    docnames = [f"page{index}" for index in range(12)]
+    srcdir.joinpath("index.md").write_text(
+        "# Index\n\n```{toctree}\n" + "\n".join(docnames) + "\n```\n", encoding="utf8"
+    )
+    for docname in docnames:
+        srcdir.joinpath(f"{docname}.md").write_text(
+            f"# {docname}\n\n{{hyper}}`{page_server.url(docname)}`\n", encoding="utf8"
+        )
+
+    # Leave an idle connection in the pool of the main process.
+    with local_transport.open(page_server.url("main")) as response:
+        response.read()
+    main_client = page_server.requests[0]["client"]
+
+    app = make_app(srcdir=srcdir, parallel=4)
+    app.build()
+    assert app._warning.getvalue() == ""
+
+    assert [request["path"] for request in page_server.requests if request["client"] == main_client] == ["/main"]
+    inventory = app.env.hyper_title_inventory
+    assert all(inventory.get(page_server.url(docname)) == f"Title of {docname}" for docname in docnames)
+
+
+def test_parallel_build_budget(tmp_path: Path, make_app, page_server: PageServer, local_transport: HttpTransport):
+    """
+    The network budget applies to the whole build, across parallel readers.
+
+    The budget is given as a string, like when using `-D hyper_title_budget=1`.
+    """
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text(
+        "extensions = ['myst_parser', 'sphinx_design', 'sphinx_design_elements']\nhyper_title_prefetch = False\n"
+    )
+    docnames = [f"page{index}" for index in range(12)]
+    srcdir.joinpath("index.md").write_text(
+        "# Index\n\n```{toctree}\n" + "\n".join(docnames) + "\n```\n", encoding="utf8"
+    )
+    for docname in docnames:
+        srcdir.joinpath(f"{docname}.md").write_text(
+            f"# {docname}\n\n{{hyper}}`{page_server.url('slow/' + docname)}`\n", encoding="utf8"
+        )
+
+    app = make_app(srcdir=srcdir, parallel=4, confoverrides={"hyper_title_budget": "1"})
+    assert app.config.hyper_title_budget == 1.0
+    app.build()
+
+    # Each request takes 0.5 seconds. Up to four readers may start a request before
+    # the first one accounts for its time, but they all stop once the budget is spent.
+    assert 2 <= len(page_server.requests) <= 6
+
+
+def test_invalid_budget(tmp_path: Path, make_app):
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    srcdir.joinpath("conf.py").write_text("extensions = ['myst_parser', 'sphinx_design_elements']\n")
+    srcdir.joinpath("index.md").write_text("# Index\n", encoding="utf8")
+    app = make_app(srcdir=srcdir, confoverrides={"hyper_title_budget": "one"})
+    assert app.config.hyper_title_budget is None
+    assert "Invalid network budget: 'one'" in app._warning.getvalue()
@@ -0,0 +1,147 @@
+import pickle
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from docutils import nodes
+
+from sphinx_design_elements.hyper import hyper_title
+from sphinx_design_elements.util.inventory import TitleInventory
+from sphinx_design_elements.util.title import TitleResolver, TitleUnavailable
+
+
+@pytest.fixture
+def inventory(tmp_path: Path) -> TitleInventory:
+    return TitleInventory(path=tmp_path)
+
+
+def test_resolver_inventory(inventory: TitleInventory):
+    inventory.set("https://example.org/", "Example Domain")
+    resolver = TitleResolver(inventory=inventory, offline=True)
+    assert resolver.resolve("https://example.org/") == "Example Domain"
+
+
+def test_resolver_offline(inventory: TitleInventory):
+    resolver = TitleResolver(inventory=inventory, offline=True)
+    with patch("sphinx_design_elements.util.title.get_html_page_title") as fetch:
+        assert resolver.resolve("https://example.org/") is None
+        with pytest.raises(TitleUnavailable):
+            resolver.fetch("https://example.org/")
+    assert fetch.call_count == 0
+    assert resolver.available is False
+
+
+def test_resolver_timeout(inventory: TitleInventory):
+    resolver = TitleResolver(inventory=inventory, timeout=3, budget=2)
+    with patch("sphinx_design_elements.util.title.get_html_page_title", return_value="Example Domain") as fetch:
+        assert resolver.resolve("https://example.org/") == "Example Domain"
+    fetch.assert_called_once_with("https://example.org/", timeout=pytest.approx(2))
+    assert inventory.get("https://example.org/") == "Example Domain"
+
+
+def test_resolver_budget_exhausted(inventory: TitleInventory):
+    resolver = TitleResolver(inventory=inventory, budget=1)
+    resolver.spent = 1.5
+    assert resolver.remaining == 0
+    assert resolver.available is False
+    with patch("sphinx_design_elements.util.title.get_html_page_title") as fetch:
+        assert resolver.resolve("https://example.org/") is None
+    assert fetch.call_count == 0
+
+
+def test_resolver_failure(inventory: TitleInventory):
+    resolver = TitleResolver(inventory=inventory)
+    with patch("sphinx_design_elements.util.title.get_html_page_title", side_effect=TimeoutError("timed out")):
+        assert resolver.resolve("https://example.org/") is None
+    assert resolver.spent > 0
+    assert "https://example.org/" not in inventory
+
+
+def test_resolver_pickle(inventory: TitleInventory):
+    resolver = pickle.loads(pickle.dumps(TitleResolver(inventory=inventory, budget=5)))  # noqa: S301
+    assert resolver.budget == 5
+    assert resolver.lock is not None
+
+
+def test_deferred_title(sphinx_builder):
+    builder = sphinx_builder(
+        conf_kwargs={
+            "extensions": ["myst_parser", "sphinx_design", "sphinx_design_elements"],
+            "myst_enable_extensions": ["colon_fence"],
+            "hyper_title_offline": True,
+        }
+    )
+    builder.src_path.joinpath("index.md").write_text(
+        "{hyper}`https://example.org/`\n\n{hyper}`https://example.net/ {type=button,short-title=true}`", encoding="utf8"
+    )
+    with patch("sphinx_design_elements.util.title.get_html_page_title") as fetch:
+        builder.build()
+    assert fetch.call_count == 0
+
+    doctree = builder.get_doctree("index")
+    placeholders = list(doctree.findall(hyper_title))
+    assert [node["url"] for node in placeholders] == ["https://example.org/", "https://example.net/"]
+
+    # Titles which became known in the meanwhile are resolved from the inventory.
+    builder.app.env.hyper_title_inventory.set("https://example.net/", "Example Net - Home")
+    doctree = builder.get_doctree("index", post_transforms=True)
+    assert not list(doctree.findall(hyper_title))
+    assert "https://example.org/" in doctree.astext()
+    assert "Example Net" in doctree.astext()
+    assert "Home" not in doctree.astext()
+
+
+def deferred_shields(sphinx_builder, shield_render: str):
+    builder = sphinx_builder(
+        conf_kwargs={
+            "extensions": ["myst_parser", "sphinx_design", "sphinx_design_elements"],
+            "myst_enable_extensions": ["colon_fence"],
+            "hyper_title_offline": True,
+            "shield_render": shield_render,
+        }
+    )
+    builder.src_path.joinpath("index.md").write_text(
+        "{hyper}`https://example.org/ {type=shield}`\n\n{hyper}`https://example.net/ {type=shield}`\n",
+        encoding="utf8",
+    )
+    builder.build()
+    doctree = builder.get_doctree("index")
+    assert [node["hyper-title-url"] for node in doctree.findall(nodes.image)] == [
+        "https://example.org/",
+        "https://example.net/",
+    ]
+
+    # A title which became known in the meanwhile.
+    builder.app.env.hyper_title_inventory.set("https://example.org/", "Example Domain")
+    return builder
+
+
+def test_deferred_title_shield(sphinx_builder):
+    """
+    Shields display deferred titles within attributes, which are resolved from the inventory, too.
+    Unknown titles fall back to the URL.
+    """
+    builder = deferred_shields(sphinx_builder, "remote")
+    doctree = builder.get_doctree("index", post_transforms=True)
+    resolved, fallback = doctree.findall(nodes.image)
+    assert resolved["alt"] == "Example Domain"
+    assert resolved.parent["reftitle"] == "Example Domain"
+    assert resolved["uri"].startswith("https://img.shields.io/badge/Example%20Domain-blue")
+    assert "hyper-title-url" not in resolved
+    assert fallback["alt"] == "https://example.net/"
+    assert fallback["uri"].startswith("https://img.shields.io/badge/https%3A//example.net/-blue")
+
+
+def test_deferred_title_shield_sprite(sphinx_builder):
+    """
+    Shields with resolved deferred titles are missing from the site-wide sprite, so they are embedded.
+    """
+    builder = deferred_shields(sphinx_builder, "sprite")
+    doctree = builder.get_doctree("index", post_transforms=True)
+    sprite, *_ = doctree.findall(nodes.raw)
+    assert "Example Domain" in sprite.astext()
+    uses = [node.astext() for node in doctree.findall(nodes.raw)][1:]
+    assert 'aria-label="Example Domain"' in uses[0]
+    assert '<use href="#shield-' in uses[0]
+    assert 'aria-label="https://example.net/"' in uses[1]
+    assert "shields.svg?v=" in uses[1]
@@ -4,7 +4,12 @@ from typing import List, Union
 import pytest
 from docutils import nodes
 
-from sphinx_design_elements.util.directive import MarkdownWrapper, SmartReference, link_to_markdown
+from sphinx_design_elements.util.directive import (
+    MarkdownWrapper,
+    SmartReference,
+    get_markdown_wrapper,
+    link_to_markdown,
+)
 from tests.util import patch_snippet_docutils_forward
 
 
@@ -121,3 +126,14 @@ def test_markdown_wrapper():
     assert str(outcome) == patch_snippet_docutils_forward(
         '<reference id_link="True" reftitle="title" refuri="#document">label</reference>'
     )
+
+
+def test_markdown_wrapper_shared():
+    mw = get_markdown_wrapper()
+    assert get_markdown_wrapper() is mw
+    first = mw.render("[label](document)")
+    second = mw.render("**bold**")
+    assert first[0].next_node(nodes.reference)["refname"] == "document"
+    assert second[0].astext() == "bold"
+    # Rendering does not leak state into subsequent renders.
+    assert "document" not in mw.parser.options